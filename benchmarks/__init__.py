@@ -0,0 +1,4 @@
+"""성능 측정 스크립트 모음.
+
+프로젝트 루트에서 모듈 형태로 실행한다. (예: `python -m benchmarks.bench_title_dedup`)
+"""
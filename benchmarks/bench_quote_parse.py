@@ -0,0 +1,188 @@
+"""
+영어 명언 페이지 파싱 벤치마크: 전체 수신 + BeautifulSoup vs 스트리밍 조기 종료.
+
+- full: 이전 fetch_latest_quote 방식. 페이지 전체를 받아 BeautifulSoup 트리를 만들고
+  get_text 로 펼친 뒤 줄 단위 상태 기계(extract_quotes)로 첫 명언을 찾는다.
+- stream: http_utils.fetch_stream + QuoteStreamParser. 받는 대로 토큰화하고 첫 명언이
+  완성되면 나머지 본문을 받지 않고 연결을 닫는다.
+
+로컬 스텁 서버가 명언을 페이지의 여러 위치(앞에서부터 비율)에 둔 페이지를 돌려준다.
+위치마다 읽은 본문 바이트, 소요 시간(중앙값), 최대 메모리(tracemalloc)를 비교하고
+두 방식의 결과가 같은지 확인한다. 실제 페이지 녹화본(fixtures/hackers_quote.html)이 있으면
+"recorded" 로 함께 측정한다.
+
+결과는 benchmarks/results/quote_parse_<시각>.json 으로 저장한다.
+
+Usage:
+    python -m benchmarks.bench_quote_parse
+    python -m benchmarks.bench_quote_parse --positions 0.1 0.5 --size 200000 --repeat 50
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import datetime
+import platform
+import statistics
+import tempfile
+import tracemalloc
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "benchmarks", "results")
+
+
+def _configure(workdir):
+    """저장 폴더를 임시 폴더로, 속도 제한은 풀고 HTTP 캐시는 끈 설정으로 core 를 불러오게 한다."""
+    config_path = os.path.join(workdir, "config.json")
+    with open(config_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "quotes_dir": os.path.join(workdir, "quotes"),
+            "news_dir": os.path.join(workdir, "news"),
+            "rate_limits": {"default": {"rate": 100000, "burst": 100000},
+                            "www.hackers.co.kr": {"rate": 100000, "burst": 100000}},
+            "rate_limit_total": {"rate": 100000, "burst": 100000},
+            "http_cache": {"enabled": False},
+        }, f)
+    os.environ["DAILY_GATHERINGS_CONFIG"] = config_path
+
+
+def make_page(position, size, seed=0):
+    """명언 블록 앞에 전체 분량의 position 비율만큼 스크립트/내비게이션을 둔 약 size 바이트 페이지."""
+    from benchmarks import fixtures
+
+    rng = random.Random(seed)
+    body = fixtures._hackers_quote(None, rng)
+    filler = max(0, size - len(body.encode("utf-8")))
+    before = int(filler * position)
+    head = fixtures._script_block(before // 2, rng) if before else ""
+    nav_before = fixtures._nav_block(before - before // 2, rng) if before else ""
+    nav_after = fixtures._nav_block(filler - before, rng) if filler > before else ""
+    return (
+        "<!DOCTYPE html>\n<html lang=\"ko\"><head><meta charset=\"utf-8\"><title>quote</title>"
+        f"{head}</head>\n<body>{nav_before}\n{body}\n{nav_after}</body></html>"
+    ).encode("utf-8")
+
+
+def full_parse(url, headers):
+    """이전 방식: 전체 수신 → BeautifulSoup → get_text → extract_quotes. (명언, 읽은 바이트)"""
+    from core import http_utils
+    from core.crawling_english_saying import extract_quotes, page_lines
+
+    response = http_utils._get(url, http_utils.DEFAULT_TIMEOUT, headers)
+    soup = http_utils.make_soup(response.content, http_utils._declared_charset(response))
+    quotes = extract_quotes(page_lines(soup), limit=1)
+    return (quotes[0] if quotes else None), len(response.content)
+
+
+def stream_parse(url, headers):
+    """스트리밍 방식: fetch_stream + QuoteStreamParser. (명언, 읽은 바이트)"""
+    from core import http_utils
+    from core.crawling_english_saying import QuoteStreamParser
+
+    parser = QuoteStreamParser()
+    size = http_utils.fetch_stream(url, parser.feed_text, headers=headers)
+    if not parser.done:
+        parser.close()
+    return (parser.quotes[0] if parser.quotes else None), size
+
+
+METHODS = {"full": full_parse, "stream": stream_parse}
+
+
+def measure(method, url, headers, repeat):
+    """(결과, 읽은 바이트, 소요 시간 목록, 최대 메모리 바이트)"""
+    func = METHODS[method]
+    func(url, headers)  # 예열 (연결, 모듈 import)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        quote, size = func(url, headers)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func(url, headers)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return quote, size, times, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="영어 명언 페이지 파싱: 전체 파싱 vs 스트리밍 조기 종료")
+    parser.add_argument("--positions", type=float, nargs="+", default=[0.05, 0.25, 0.5, 1.0],
+                        help="명언 블록 앞에 둘 분량 비율 (0~1)")
+    parser.add_argument("--size", type=int, default=80_000, help="합성 페이지 크기(바이트)")
+    parser.add_argument("--repeat", type=int, default=30, help="측정 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/quote_parse_<시각>.json)")
+    args = parser.parse_args()
+
+    _configure(tempfile.mkdtemp(prefix="bench_quote_"))
+    from benchmarks import fixtures
+    from benchmarks.stub_server import StubServer, redirect_to_stub
+    from core.config import QUOTE_URL, QUOTE_HEADERS
+    from core.logging_utils import quiet_console
+
+    pages = {f"pos={position:g}": make_page(position, args.size) for position in args.positions}
+    recorded = fixtures.load_recorded("hackers_quote")
+    if recorded is not None:
+        pages["recorded"] = recorded
+
+    class QuoteStub(StubServer):
+        current = b""
+
+        def page(self, url):
+            return self.current
+
+        def handle_error(self, request, client_address):
+            # 스트리밍 방식이 본문을 다 받기 전에 연결을 닫으면 서버 쪽 쓰기가 끊긴다 (정상)
+            if not isinstance(sys.exc_info()[1], ConnectionError):
+                super().handle_error(request, client_address)
+
+    server = QuoteStub().start()
+    redirect_to_stub(server.port)
+    quiet_console()
+
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "pages": {},
+    }
+    print(f"{'page':>10} {'method':>7} {'bytes':>9} {'median ms':>10} {'peak KB':>9} {'same':>5}")
+    try:
+        for name, body in pages.items():
+            server.current = body
+            entry = {"page_bytes": len(body)}
+            for method in METHODS:
+                quote, size, times, peak = measure(method, QUOTE_URL, QUOTE_HEADERS, args.repeat)
+                entry[method] = {
+                    "quote": quote,
+                    "bytes_read": size,
+                    "median_ms": statistics.median(times) * 1000,
+                    "min_ms": min(times) * 1000,
+                    "peak_kb": peak / 1024,
+                }
+            same = entry["full"]["quote"] == entry["stream"]["quote"]
+            entry["same"] = same
+            results["pages"][name] = entry
+            for method in METHODS:
+                stat = entry[method]
+                print(f"{name:>10} {method:>7} {stat['bytes_read']:9d} {stat['median_ms']:10.2f}"
+                      f" {stat['peak_kb']:9.0f} {('yes' if same else 'NO') if method == 'stream' else '':>5}")
+    finally:
+        server.stop()
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"quote_parse_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+    return 0 if all(entry["same"] for entry in results["pages"].values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
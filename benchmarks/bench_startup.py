@@ -0,0 +1,216 @@
+"""
+시작 시간 벤치마크: 모듈별 import 시간(cold / warm)과 첫 네트워크 요청까지 걸리는 시간.
+
+측정마다 새 인터프리터를 띄워 이전 import 가 섞이지 않게 한다.
+
+- cold: 빈 PYTHONPYCACHEPREFIX 폴더를 지정해 .pyc 없이 소스를 컴파일하며 import
+  (설치/업데이트 직후 첫 실행에 가깝다)
+- warm: .pyc 가 있는 상태의 import (평소 실행)
+- first_request: 프로세스 시작부터 daily_runner.run_once() 의 첫 HTTP 요청(인터넷 연결 확인)이
+  나가기 직전까지. 요청은 실제로 보내지 않고 그 시점에 프로세스를 끝낸다.
+  인터프리터 자체의 시작 시간(python -c pass)도 따로 잰다.
+
+설정은 임시 config.json(DAILY_GATHERINGS_CONFIG)으로 주어 저장 폴더도 임시 폴더에 만든다.
+결과는 benchmarks/results/startup_<시각>.json 으로 저장한다.
+
+Usage:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --repeat 10 --modules core.http_utils daily_runner
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import datetime
+import platform
+import statistics
+import tempfile
+import subprocess
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "benchmarks", "results")
+
+MODULES = (
+    "core.config",
+    "core.logging_utils",
+    "core.metrics",
+    "core.archive",
+    "core.fetch_engine",
+    "core.connection_pool",
+    "core.http_utils",
+    "core.crawling_english_saying",
+    "core.run_headline_crawling",
+    "core.run_economics_crawling",
+    "core.run_opinions_crawling",
+    "core.run_eng_stock_check",
+    "daily_runner",
+)
+
+# 모듈 하나를 import 하고 (초, 새로 불러온 모듈 수) 를 출력
+_IMPORT_SCRIPT = """
+import sys, time, importlib
+before = len(sys.modules)
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+print(time.perf_counter() - start, len(sys.modules) - before)
+"""
+
+# requests.adapters 가 import 되는 순간 HTTPAdapter.send 를 바꿔, 첫 요청 직전 시각을 기록하고 끝낸다.
+# (requests 를 미리 import 하면 측정이 틀어지므로 import 훅으로 건다)
+_FIRST_REQUEST_SCRIPT = """
+import os, sys, time, importlib.machinery
+
+class _Hook:
+    def find_spec(self, name, path, target=None):
+        if name != "requests.adapters":
+            return None
+        sys.meta_path.remove(self)
+        spec = importlib.machinery.PathFinder.find_spec(name, path)
+        exec_module = spec.loader.exec_module
+
+        def patched(module):
+            exec_module(module)
+
+            def send(self, request, *args, **kwargs):
+                with open(sys.argv[1], "w") as f:
+                    f.write(f"{time.time()} {len(sys.modules)}")
+                os._exit(0)
+
+            module.HTTPAdapter.send = send
+
+        spec.loader.exec_module = patched
+        return spec
+
+sys.meta_path.insert(0, _Hook())
+import daily_runner
+daily_runner.run_once()
+"""
+
+
+def _env(config_path, pycache_prefix=None):
+    env = dict(os.environ)
+    env["DAILY_GATHERINGS_CONFIG"] = config_path
+    env["PYTHONPATH"] = PROJECT_ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    if pycache_prefix:
+        env["PYTHONPYCACHEPREFIX"] = pycache_prefix
+    else:
+        env.pop("PYTHONPYCACHEPREFIX", None)
+    return env
+
+
+def _run(args, env):
+    completed = subprocess.run(
+        [sys.executable, *args], cwd=PROJECT_ROOT, env=env,
+        capture_output=True, text=True, check=True,
+    )
+    return completed.stdout
+
+
+def measure_import(module, config_path, repeat, cold):
+    """module import 시간(초) 목록과 새로 불러온 모듈 수."""
+    times, loaded = [], 0
+    for _ in range(repeat):
+        prefix = tempfile.mkdtemp(prefix="pycache_") if cold else None
+        out = _run(["-c", _IMPORT_SCRIPT, module], _env(config_path, prefix))
+        seconds, loaded = out.split()[-2:]
+        times.append(float(seconds))
+    return times, int(loaded)
+
+
+def measure_interpreter(config_path, repeat):
+    """python -c pass 의 프로세스 시작~종료 시간(초) 목록."""
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        _run(["-c", "pass"], _env(config_path))
+        times.append(time.time() - start)
+    return times
+
+
+def measure_first_request(config_path, repeat, workdir):
+    """프로세스 시작부터 첫 HTTP 요청 직전까지의 시간(초) 목록과 그때 불러온 모듈 수."""
+    times, loaded = [], 0
+    marker = os.path.join(workdir, "first_request.txt")
+    for _ in range(repeat):
+        if os.path.exists(marker):
+            os.remove(marker)
+        start = time.time()
+        subprocess.run(
+            [sys.executable, "-c", _FIRST_REQUEST_SCRIPT, marker],
+            cwd=PROJECT_ROOT, env=_env(config_path),
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False,
+        )
+        with open(marker) as f:
+            sent_at, loaded = f.read().split()
+        times.append(float(sent_at) - start)
+    return times, int(loaded)
+
+
+def _summary(times):
+    return {
+        "median_ms": statistics.median(times) * 1000,
+        "min_ms": min(times) * 1000,
+        "runs_ms": [round(t * 1000, 2) for t in times],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 시간 벤치마크 (import 시간, 첫 요청까지 시간)")
+    parser.add_argument("--modules", nargs="+", default=list(MODULES), help="import 시간을 잴 모듈")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (중앙값 사용)")
+    parser.add_argument("--no-cold", action="store_true", help="cold(.pyc 없음) 측정 생략")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/startup_<시각>.json)")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="bench_startup_")
+    config_path = os.path.join(workdir, "config.json")
+    with open(config_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "quotes_dir": os.path.join(workdir, "quotes"),
+            "news_dir": os.path.join(workdir, "news"),
+        }, f)
+
+    # warm 측정 전에 한 번 불러 .pyc 를 만든다 (config.json 보강 저장도 이때 끝남)
+    for module in args.modules:
+        _run(["-c", _IMPORT_SCRIPT, module], _env(config_path))
+
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "interpreter": _summary(measure_interpreter(config_path, args.repeat)),
+        "modules": {},
+    }
+
+    print(f"{'module':32} {'warm ms':>9} {'cold ms':>9} {'modules':>8}")
+    for module in args.modules:
+        warm, loaded = measure_import(module, config_path, args.repeat, cold=False)
+        entry = {"warm": _summary(warm), "loaded_modules": loaded}
+        if not args.no_cold:
+            entry["cold"] = _summary(measure_import(module, config_path, args.repeat, cold=True)[0])
+        results["modules"][module] = entry
+        cold_ms = f"{entry['cold']['median_ms']:9.1f}" if "cold" in entry else f"{'-':>9}"
+        print(f"{module:32} {entry['warm']['median_ms']:9.1f} {cold_ms} {loaded:8}")
+
+    first, loaded = measure_first_request(config_path, args.repeat, workdir)
+    results["first_request"] = {**_summary(first), "loaded_modules": loaded}
+    print("-" * 61)
+    print(f"{'interpreter (python -c pass)':32} {results['interpreter']['median_ms']:9.1f}")
+    print(f"{'process start → first request':32} {results['first_request']['median_ms']:9.1f}"
+          f" {'':>9} {loaded:8}")
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"startup_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
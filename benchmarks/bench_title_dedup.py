@@ -0,0 +1,114 @@
+"""
+경제 뉴스 제목 중복 제거 벤치마크: 전체 비교(O(n²)) vs TitleIndex.
+
+합성 제목(한국어 뉴스 제목 형태, 약 20% 는 기존 제목의 변형)을 만들어
+두 방식의 소요 시간과 are_similar 계산 횟수를 비교하고, 판정이 같은지 확인한다.
+전체 비교는 느리므로 --brute-max 이하 크기에서만 실행한다.
+
+Usage:
+    python -m benchmarks.bench_title_dedup
+    python -m benchmarks.bench_title_dedup --sizes 1000 10000 50000 --brute-max 2000
+"""
+
+import argparse
+import random
+import time
+
+from core.title_index import TitleIndex, are_similar
+
+
+_WORDS = (
+    "코스피 코스닥 환율 금리 한국은행 기준금리 동결 인상 인하 반도체 수출 증가 감소 "
+    "삼성전자 SK하이닉스 현대차 부동산 아파트 전세 매매 가계부채 물가 소비자 "
+    "정부 대책 발표 기업 실적 영업이익 분기 사상 최대 하락 상승 외국인 순매수 "
+    "투자 증권 은행 보험 카드 대출 규제 완화 강화 미국 중국 일본 유럽 관세 무역"
+).split()
+
+
+def _make_vocabulary(rng, size=3000):
+    """자주 쓰는 경제 용어 + 고유명사 역할의 합성 단어(한글 2~4음절)."""
+    syllables = [chr(0xAC00 + rng.randrange(11172)) for _ in range(2000)]
+    words = list(_WORDS)
+    while len(words) < size:
+        words.append("".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))))
+    # 앞쪽 단어일수록 자주 등장 (Zipf 분포에 가깝게)
+    weights = [1 / (rank + 1) for rank in range(len(words))]
+    return words, weights
+
+
+def make_titles(n, seed=0, dup_ratio=0.2):
+    """n 개의 합성 제목과 URL 을 만든다. dup_ratio 비율은 이전 제목을 조금 바꾼 변형."""
+    rng = random.Random(seed)
+    vocabulary, weights = _make_vocabulary(rng)
+    items = []
+    for i in range(n):
+        if items and rng.random() < dup_ratio:
+            words = rng.choice(items)[0].split()
+            if len(words) > 3 and rng.random() < 0.5:
+                words.pop(rng.randrange(len(words)))
+            else:
+                words[rng.randrange(len(words))] = rng.choice(_WORDS)
+            title = " ".join(words)
+        else:
+            title = " ".join(rng.choices(vocabulary, weights, k=rng.randint(5, 9)))
+        items.append((title, f"https://n.news.naver.com/mnews/article/001/{i:010d}"))
+    return items
+
+
+def dedup_bruteforce(items):
+    accepted = []
+    decisions = []
+    comparisons = 0
+    for title, url in items:
+        duplicate = False
+        for existing_title, existing_url in accepted:
+            comparisons += 1
+            if are_similar(existing_title, title) or existing_url == url:
+                duplicate = True
+                break
+        decisions.append(duplicate)
+        if not duplicate:
+            accepted.append((title, url))
+    return decisions, comparisons
+
+
+def dedup_index(items):
+    index = TitleIndex()
+    decisions = []
+    for title, url in items:
+        duplicate = index.is_duplicate(title, url)
+        decisions.append(duplicate)
+        if not duplicate:
+            index.add(title, url)
+    return decisions, index.comparisons
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 1000, 2000, 5000, 10000, 20000, 50000])
+    parser.add_argument("--brute-max", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'titles':>8} {'brute(s)':>10} {'ratio calls':>12} {'index(s)':>10} {'ratio calls':>12} {'same':>6}")
+    for n in args.sizes:
+        items = make_titles(n, seed=args.seed)
+
+        start = time.perf_counter()
+        index_decisions, index_calls = dedup_index(items)
+        index_time = time.perf_counter() - start
+
+        if n <= args.brute_max:
+            start = time.perf_counter()
+            brute_decisions, brute_calls = dedup_bruteforce(items)
+            brute_time = f"{time.perf_counter() - start:10.3f}"
+            brute_calls = f"{brute_calls:12d}"
+            same = "yes" if brute_decisions == index_decisions else "NO"
+        else:
+            brute_time, brute_calls, same = f"{'-':>10}", f"{'-':>12}", "-"
+
+        print(f"{n:8d} {brute_time} {brute_calls} {index_time:10.3f} {index_calls:12d} {same:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+"""
+크롤러 종단 간(end-to-end) 오프라인 벤치마크.
+
+로컬 스텁 서버(benchmarks.stub_server)를 띄우고 각 크롤러의 main() 과 daily_runner.main 을
+실제 네트워크 없이 실행해 다음을 측정한다.
+
+- 소요 시간(wall time), 초당 요청 수, 페이지 종류별 요청 수/바이트/주입된 실패 수
+- 페이지 종류별 HTML 파싱 시간 (make_soup)
+- 최대 메모리 (peak RSS, --tracemalloc 이면 tracemalloc 최대값도)
+
+대상마다 별도 프로세스에서 실행해 모듈 싱글턴(캐시/메모/엔진)과 메모리 측정이 서로 섞이지 않게 한다.
+설정은 임시 config.json(DAILY_GATHERINGS_CONFIG)으로 주어 저장 폴더도 임시 폴더에 만든다.
+결과는 JSON 으로 저장하며 --compare 로 두 결과를 비교할 수 있다.
+
+Usage:
+    python -m benchmarks.crawl_bench
+    python -m benchmarks.crawl_bench --targets headline stock --latency 0.2 --failure-rate 0.05
+    python -m benchmarks.crawl_bench --page-latency yahoo=1.5 --page-failure finviz_article=0.2
+    python -m benchmarks.crawl_bench --compare benchmarks/results/a.json benchmarks/results/b.json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import datetime
+import platform
+import tempfile
+import threading
+import subprocess
+
+from benchmarks import fixtures
+from benchmarks.stub_server import StubServer, StubSettings, redirect_to_stub
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(PROJECT_ROOT, "benchmarks", "results")
+
+TARGETS = ("quote", "headline", "economics", "opinions", "stock", "daily_runner")
+
+
+# ─────────────────────────────────────────────
+# 자식 프로세스: 계측 후 대상 하나 실행
+# ─────────────────────────────────────────────
+
+def _install_parse_timer():
+    """fetch_soup / make_soup 을 감싸 페이지 종류별 파싱 시간을 잰다.
+
+    크롤러 모듈이 fetch_soup 을 import 하기 전에 호출해야 한다.
+    """
+    from core import http_utils
+
+    parse_stats = {}
+    lock = threading.Lock()
+    local = threading.local()
+    fetch_soup = http_utils.fetch_soup
+    make_soup = http_utils.make_soup
+
+    def timed_fetch_soup(url, *args, **kwargs):
+        local.kind = fixtures.page_type(url)
+        return fetch_soup(url, *args, **kwargs)
+
+    def timed_make_soup(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return make_soup(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            kind = getattr(local, "kind", "unknown")
+            with lock:
+                stat = parse_stats.setdefault(kind, {"count": 0, "seconds": 0.0})
+                stat["count"] += 1
+                stat["seconds"] += elapsed
+
+    http_utils.fetch_soup = timed_fetch_soup
+    http_utils.make_soup = timed_make_soup
+    return parse_stats
+
+
+def _target_function(target):
+    if target == "quote":
+        from core import crawling_english_saying
+        return crawling_english_saying.insert_latest_quote
+    if target == "headline":
+        from core import run_headline_crawling
+        return run_headline_crawling.main
+    if target == "economics":
+        from core import run_economics_crawling
+        return run_economics_crawling.main
+    if target == "opinions":
+        from core import run_opinions_crawling
+        return run_opinions_crawling.main
+    if target == "stock":
+        from core import run_eng_stock_check
+        return run_eng_stock_check.main
+    import daily_runner
+    return daily_runner.main
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 는 KB, macOS 는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_child(target, port, result_path, use_tracemalloc, quiet):
+    """대상 하나를 계측해 실행하고 결과를 result_path 에 JSON 으로 쓴다."""
+    if use_tracemalloc:
+        import tracemalloc
+        tracemalloc.start()
+
+    redirect_to_stub(port)
+    parse_stats = _install_parse_timer()
+    from core.connection_pool import pool_stats
+    from core.logging_utils import quiet_console
+    from core import http_utils
+    if quiet:
+        quiet_console()
+
+    func = _target_function(target)
+    start = time.perf_counter()
+    error = None
+    try:
+        result = func()
+    except BaseException as e:  # daily_runner 는 실패 시 sys.exit 를 부른다
+        result = None
+        error = repr(e)
+    wall = time.perf_counter() - start
+
+    report = {
+        "wall_seconds": wall,
+        "result": result,
+        "error": error,
+        "parse": parse_stats,
+        "peak_rss_mb": _peak_rss_mb(),
+        "parser": http_utils._BS4_PARSER,
+        "slicer": getattr(http_utils._slicer(), "__name__", None),
+        "connections": {
+            name: value for name, value in pool_stats.snapshot().items() if name != "hosts"
+        },
+    }
+    if use_tracemalloc:
+        report["tracemalloc_peak_mb"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+    with open(result_path, "w", encoding="utf-8") as f:
+        json.dump(report, f)
+
+
+# ─────────────────────────────────────────────
+# 부모 프로세스: 스텁 서버 + 대상별 자식 실행
+# ─────────────────────────────────────────────
+
+def _write_config(directory, no_rate_limit, no_cache):
+    config = {
+        "quotes_dir": os.path.join(directory, "quotes"),
+        "news_dir": os.path.join(directory, "news"),
+        # 모든 호스트가 스텁 서버(127.0.0.1) 풀 하나로 모이므로 전체 동시 요청 수만큼 연다
+        "connection_pool": {"sizes": {"127.0.0.1": 64}},
+    }
+    if no_rate_limit:
+        # 사전형 설정은 기본값과 병합되므로 기본값에 있는 호스트를 모두 덮어쓴다.
+        hosts = {"news.naver.com", "n.news.naver.com", "finviz.com", "default", *fixtures.SOURCE_HOSTS}
+        config["rate_limits"] = {host: {"rate": 10_000, "burst": 10_000} for host in hosts}
+        config["rate_limit_total"] = {"rate": 10_000, "burst": 10_000}
+    if no_cache:
+        config["http_cache"] = {"enabled": False}
+    path = os.path.join(directory, "config.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(config, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def _run_target(server, target, args):
+    """임시 폴더/설정으로 자식 프로세스를 띄워 target 을 실행하고 결과 dict 를 반환."""
+    with tempfile.TemporaryDirectory(prefix="bench_") as directory:
+        config_path = _write_config(directory, args.no_rate_limit, args.no_cache)
+        result_path = os.path.join(directory, "result.json")
+        command = [
+            sys.executable, "-m", "benchmarks.crawl_bench",
+            "--child", target, "--port", str(server.port), "--result", result_path,
+        ]
+        if args.tracemalloc:
+            command.append("--tracemalloc")
+        if not args.verbose:
+            command.append("--quiet")
+        env = dict(os.environ, DAILY_GATHERINGS_CONFIG=config_path)
+
+        server.reset_stats()
+        subprocess.run(command, cwd=PROJECT_ROOT, env=env, check=False)
+        pages = server.stats()
+
+        if not os.path.isfile(result_path):
+            return {"error": "child process did not report", "pages": pages}
+        with open(result_path, encoding="utf-8") as f:
+            report = json.load(f)
+
+    requests_total = sum(stat["requests"] for stat in pages.values())
+    report["pages"] = pages
+    report["requests"] = requests_total
+    report["bytes"] = sum(stat["bytes"] for stat in pages.values())
+    report["failures_injected"] = sum(stat["failures"] for stat in pages.values())
+    report["requests_per_second"] = requests_total / report["wall_seconds"] if report["wall_seconds"] else None
+    for stat in report["parse"].values():
+        stat["mean_ms"] = stat["seconds"] / stat["count"] * 1000 if stat["count"] else 0.0
+    return report
+
+
+def _parse_overrides(values, name):
+    """["yahoo=1.5", ...] → {"yahoo": 1.5}"""
+    overrides = {}
+    for value in values or ():
+        kind, _, number = value.partition("=")
+        if kind not in fixtures.PAGE_TYPES or not number:
+            raise SystemExit(f"{name}: '{value}' (페이지 종류: {', '.join(fixtures.PAGE_TYPES)})")
+        overrides[kind] = float(number)
+    return overrides
+
+
+def _print_report(results):
+    print()
+    print(f"{'target':<13} {'wall(s)':>8} {'requests':>9} {'req/s':>7} {'MB':>7} {'parse(s)':>9} {'peak RSS':>9} {'conn new/reuse':>15} {'result':>7}")
+    for target, report in results["targets"].items():
+        if "wall_seconds" not in report:
+            print(f"{target:<13} {report.get('error')}")
+            continue
+        parse_seconds = sum(stat["seconds"] for stat in report["parse"].values())
+        rss = f"{report['peak_rss_mb']:.0f}MB" if report.get("peak_rss_mb") else "-"
+        connections = report.get("connections")
+        conns = f"{connections['created']}/{connections['reused']}" if connections else "-"
+        print(
+            f"{target:<13} {report['wall_seconds']:8.2f} {report['requests']:9d}"
+            f" {report['requests_per_second'] or 0:7.1f} {report['bytes'] / 1e6:7.1f}"
+            f" {parse_seconds:9.2f} {rss:>9} {conns:>15} {str(report['result']):>7}"
+        )
+
+    print()
+    print(f"{'page type':<18} {'parses':>7} {'total(s)':>9} {'mean(ms)':>9}")
+    merged = {}
+    for target, report in results["targets"].items():
+        if target == "daily_runner":
+            continue
+        for kind, stat in report.get("parse", {}).items():
+            total = merged.setdefault(kind, {"count": 0, "seconds": 0.0})
+            total["count"] += stat["count"]
+            total["seconds"] += stat["seconds"]
+    for kind, stat in sorted(merged.items()):
+        mean = stat["seconds"] / stat["count"] * 1000 if stat["count"] else 0.0
+        print(f"{kind:<18} {stat['count']:7d} {stat['seconds']:9.3f} {mean:9.2f}")
+
+
+def compare(old_path, new_path):
+    """두 결과 파일의 대상별 소요 시간/초당 요청 수/파싱 시간을 비교해 출력."""
+    with open(old_path, encoding="utf-8") as f:
+        old = json.load(f)
+    with open(new_path, encoding="utf-8") as f:
+        new = json.load(f)
+
+    def change(a, b):
+        return f"{(b - a) / a * 100:+.1f}%" if a else "-"
+
+    print(f"{'target':<13} {'wall old':>9} {'wall new':>9} {'change':>8} {'req/s old':>10} {'req/s new':>10} {'parse old':>10} {'parse new':>10}")
+    for target in new["targets"]:
+        a, b = old["targets"].get(target), new["targets"][target]
+        if not a or "wall_seconds" not in a or "wall_seconds" not in b:
+            continue
+        parse_a = sum(stat["seconds"] for stat in a["parse"].values())
+        parse_b = sum(stat["seconds"] for stat in b["parse"].values())
+        print(
+            f"{target:<13} {a['wall_seconds']:9.2f} {b['wall_seconds']:9.2f}"
+            f" {change(a['wall_seconds'], b['wall_seconds']):>8}"
+            f" {a['requests_per_second'] or 0:10.1f} {b['requests_per_second'] or 0:10.1f}"
+            f" {parse_a:10.2f} {parse_b:10.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤러 종단 간 오프라인 벤치마크")
+    parser.add_argument("--targets", nargs="+", choices=TARGETS, default=list(TARGETS))
+    parser.add_argument("--latency", type=float, default=0.05, help="평균 응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="응답 지연 ± 범위(초)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="503 응답 확률")
+    parser.add_argument("--page-latency", nargs="*", metavar="TYPE=SEC", help="페이지 종류별 평균 지연")
+    parser.add_argument("--page-failure", nargs="*", metavar="TYPE=RATE", help="페이지 종류별 실패율")
+    parser.add_argument("--scale", type=float, default=1.0, help="합성 페이지 크기 배율")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-rate-limit", action="store_true", help="rate_limits 를 사실상 끈다")
+    parser.add_argument("--no-cache", action="store_true", help="디스크 HTTP 캐시를 끈다")
+    parser.add_argument("--tracemalloc", action="store_true", help="tracemalloc 최대 메모리도 측정 (느려짐)")
+    parser.add_argument("--verbose", action="store_true", help="크롤러 로그를 콘솔에 출력")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/crawl_<시각>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="두 결과 JSON 비교")
+    # 내부용 (자식 프로세스)
+    parser.add_argument("--child", choices=TARGETS, help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    parser.add_argument("--quiet", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.port, args.result, args.tracemalloc, args.quiet)
+        return
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    settings = StubSettings(
+        latency=args.latency, jitter=args.jitter, failure_rate=args.failure_rate,
+        page_latency=_parse_overrides(args.page_latency, "--page-latency"),
+        page_failure=_parse_overrides(args.page_failure, "--page-failure"),
+        scale=args.scale, seed=args.seed,
+    )
+    server = StubServer(settings).start()
+    recorded = [kind for kind in fixtures.PAGE_TYPES if fixtures.load_recorded(kind) is not None]
+
+    results = {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "stub": settings.as_dict(),
+        "rate_limit": not args.no_rate_limit,
+        "http_cache": not args.no_cache,
+        "recorded_fixtures": recorded,
+        "targets": {},
+    }
+    try:
+        for target in args.targets:
+            print(f"[{target}] 실행 중...", flush=True)
+            results["targets"][target] = _run_target(server, target, args)
+    finally:
+        server.stop()
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"crawl_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+    _print_report(results)
+    print(f"\n결과 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,428 @@
+"""
+벤치마크용 HTML 픽스처.
+
+크롤러가 요청하는 URL 을 페이지 종류(page type)로 분류하고, 종류별 HTML 을 돌려준다.
+
+- benchmarks/fixtures/<page_type>.html 이 있으면 그 녹화본(record_fixtures 로 저장한 실제 페이지)을
+  같은 종류의 모든 URL 에 그대로 재생한다.
+- 녹화본이 없으면 크롤러 셀렉터에 맞춘 합성 HTML 을 만든다. 실제 페이지처럼 스크립트/내비게이션
+  덩어리를 붙여 크기를 맞추고, URL 별 시드로 만들어 같은 URL 은 항상 같은 내용을 돌려준다.
+"""
+
+import os
+import random
+import zlib
+from urllib.parse import urlsplit, parse_qs
+
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# 외부 소스 호스트 → 페이지 종류 (run_eng_stock_check._fetch_from_source 의 분기와 같은 순서)
+SOURCE_HOSTS = {
+    "finance.yahoo.com": "yahoo",
+    "www.prnewswire.com": "prnewswire",
+    "www.prnewswire.co.uk": "prnewswire",
+    "www.businesswire.com": "businesswire",
+    "www.globenewswire.com": "globenewswire",
+    "www.investopedia.com": "investopedia",
+    "www.newsfilecorp.com": "newsfilecorp",
+}
+
+PAGE_TYPES = (
+    "naver_section", "naver_subsection", "editorial_list", "editorial_article",
+    "naver_article", "finviz_news", "finviz_article",
+    "yahoo", "prnewswire", "businesswire", "globenewswire", "investopedia", "newsfilecorp",
+    "other_source", "hackers_quote", "connectivity",
+)
+
+# 합성 페이지의 대략적인 크기(바이트). 실제 페이지의 스크립트/내비게이션 분량에 맞춘 값.
+PAGE_SIZES = {
+    "naver_section": 350_000,
+    "naver_subsection": 250_000,
+    "editorial_list": 150_000,
+    "editorial_article": 200_000,
+    "naver_article": 200_000,
+    "finviz_news": 300_000,
+    "finviz_article": 120_000,
+    "yahoo": 400_000,
+    "prnewswire": 150_000,
+    "businesswire": 150_000,
+    "globenewswire": 150_000,
+    "investopedia": 250_000,
+    "newsfilecorp": 100_000,
+    "other_source": 100_000,
+    "hackers_quote": 80_000,
+    "connectivity": 0,
+}
+
+# 사설 기사 ID 는 9 로 시작하게 만들어 일반 기사와 구분한다.
+_EDITORIAL_ID_PREFIX = "9"
+
+_ECONOMICS_SUBSECTIONS = (
+    ("259", "금융"), ("258", "증권"), ("261", "산업/재계"), ("771", "중기/벤처"),
+    ("260", "부동산"), ("262", "글로벌 경제"), ("310", "생활경제"), ("263", "경제 일반"),
+)
+
+_PRESS = ("한국경제", "서울경제", "매일경제", "연합뉴스", "머니투데이", "이데일리", "파이낸셜뉴스", "조선비즈")
+_OFFICES = ("015", "011", "009", "001", "008", "018", "014", "366")
+
+_KO_WORDS = (
+    "코스피 코스닥 환율 금리 한국은행 기준금리 동결 인상 인하 반도체 수출 증가 감소 "
+    "삼성전자 SK하이닉스 현대차 부동산 아파트 전세 매매 가계부채 물가 소비자 정부 대책 "
+    "발표 기업 실적 영업이익 분기 사상 최대 하락 상승 외국인 순매수 투자 증권 은행 보험 "
+    "카드 대출 규제 완화 강화 미국 중국 일본 유럽 관세 무역 고용 성장률 전망 회복 둔화"
+).split()
+
+_EN_WORDS = (
+    "shares stock market investors earnings revenue quarter growth guidance announces "
+    "company results record rally slump federal reserve rates inflation outlook analysts "
+    "report acquisition merger dividend board approves launches partnership expands global"
+).split()
+
+_TICKERS = ("AAPL", "MSFT", "NVDA", "TSLA", "AMZN", "META", "GOOGL", "AMD", "NFLX", "JPM")
+
+# finviz 뉴스 목록의 소스 분포 (호스트, 비율). None = finviz 내부 기사.
+_FINVIZ_MIX = (
+    (None, 0.30),
+    ("finance.yahoo.com", 0.25),
+    ("www.prnewswire.com", 0.08),
+    ("www.businesswire.com", 0.08),
+    ("www.globenewswire.com", 0.10),
+    ("www.investopedia.com", 0.05),
+    ("www.newsfilecorp.com", 0.06),
+    ("www.reuters.com", 0.08),
+)
+
+
+# ─────────────────────────────────────────────
+# URL → 페이지 종류
+# ─────────────────────────────────────────────
+
+def page_type(url):
+    """크롤러가 요청하는 URL 의 페이지 종류 (PAGE_TYPES 중 하나)."""
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    path = parts.path
+
+    if host == "news.naver.com":
+        if path.startswith("/opinion/editorial"):
+            return "editorial_list"
+        if path.startswith("/breakingnews/section/"):
+            return "naver_subsection"
+        return "naver_section"
+    if host == "n.news.naver.com":
+        article_id = path.rstrip("/").rsplit("/", 1)[-1]
+        return "editorial_article" if article_id.startswith(_EDITORIAL_ID_PREFIX) else "naver_article"
+    if host == "finviz.com":
+        return "finviz_article" if path.startswith("/news/") else "finviz_news"
+    if host in SOURCE_HOSTS:
+        return SOURCE_HOSTS[host]
+    if host == "www.hackers.co.kr":
+        return "hackers_quote"
+    if host == "www.google.com":
+        return "connectivity"
+    return "other_source"
+
+
+def load_recorded(kind):
+    """녹화된 픽스처 바이트 (없으면 None)."""
+    path = os.path.join(FIXTURES_DIR, f"{kind}.html")
+    if os.path.isfile(path):
+        with open(path, "rb") as f:
+            return f.read()
+    return None
+
+
+def render(url, scale=1.0):
+    """url 에 대한 (page_type, HTML 바이트). 녹화본이 있으면 녹화본, 없으면 합성 HTML."""
+    kind = page_type(url)
+    recorded = load_recorded(kind)
+    if recorded is not None:
+        return kind, recorded
+    rng = random.Random(zlib.crc32(url.encode("utf-8")))
+    body = _RENDERERS[kind](url, rng)
+    html = _page(kind, body, int(PAGE_SIZES[kind] * scale), rng)
+    return kind, html.encode("utf-8")
+
+
+# ─────────────────────────────────────────────
+# 합성 HTML
+# ─────────────────────────────────────────────
+
+def _page(kind, body, size, rng):
+    """body 앞뒤에 스크립트/내비게이션 덩어리를 붙여 대략 size 바이트의 문서를 만든다."""
+    if kind == "connectivity":
+        return body
+    filler = max(0, size - len(body.encode("utf-8")))
+    script = _script_block(filler // 2, rng)
+    nav = _nav_block(filler - filler // 2, rng)
+    return (
+        "<!DOCTYPE html>\n<html lang=\"ko\"><head><meta charset=\"utf-8\">"
+        f"<title>{kind}</title>{script}</head>\n<body>{nav}\n{body}\n</body></html>"
+    )
+
+
+def _script_block(size, rng):
+    parts = []
+    total = 0
+    while total < size:
+        line = (
+            f"window.__DATA_{rng.randrange(10**6)}__ = {{\"id\": {rng.randrange(10**9)}, "
+            f"\"flag\": {str(rng.random() < 0.5).lower()}, \"name\": \"{rng.choice(_EN_WORDS)}\"}};\n"
+        )
+        parts.append(line)
+        total += len(line)
+    return "<script>" + "".join(parts) + "</script>"
+
+
+def _nav_block(size, rng):
+    parts = []
+    total = 0
+    while total < size:
+        item = (
+            f"<li class=\"nav_item\"><a href=\"/menu/{rng.randrange(10**5)}\" class=\"nav_link\">"
+            f"<span class=\"nav_text\">{rng.choice(_KO_WORDS)}</span></a></li>"
+        )
+        parts.append(item)
+        total += len(item.encode("utf-8"))
+    return "<div class=\"gnb\"><ul class=\"nav_list\">" + "".join(parts) + "</ul></div>"
+
+
+def _ko_title(rng, words=(5, 9)):
+    return " ".join(rng.choice(_KO_WORDS) for _ in range(rng.randint(*words)))
+
+
+def _en_sentence(rng, words=(12, 30)):
+    text = " ".join(rng.choice(_EN_WORDS) for _ in range(rng.randint(*words)))
+    return text[0].upper() + text[1:] + "."
+
+
+def _ko_paragraph(rng, sentences=4):
+    return " ".join(_ko_title(rng, (8, 14)) + "." for _ in range(sentences))
+
+
+def _article_url(office, article_id, sid):
+    return f"https://n.news.naver.com/mnews/article/{office}/{article_id}?sid={sid}"
+
+
+def _sa_item(rng, title, url, title_class_wrapper):
+    press = rng.choice(_PRESS)
+    lede = _ko_paragraph(rng, 2)
+    if title_class_wrapper:
+        # 헤드라인: 제목은 a.sa_text_title 안의 strong.sa_text_strong
+        link = (
+            f"<a href=\"{url}\" class=\"sa_text_title\" data-imp-url=\"{url}\">"
+            f"<strong class=\"sa_text_strong\">{title}</strong></a>"
+        )
+    else:
+        link = f"<a href=\"{url}\" class=\"sa_text_title\">{title}</a>"
+    return (
+        "<li class=\"sa_item\"><div class=\"sa_item_inner\"><div class=\"sa_text\">"
+        f"{link}<div class=\"sa_text_lede\">{lede}</div>"
+        f"<div class=\"sa_text_info\"><div class=\"sa_text_press\">{press}</div></div>"
+        "</div></div></li>"
+    )
+
+
+def _naver_section(url, rng):
+    sid = urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1]
+    nav = "".join(
+        f"<li class=\"ct_snb_nav_item\"><a href=\"/breakingnews/section/{sid}/{code}\" "
+        f"class=\"ct_snb_nav_item_link\">{name}</a></li>"
+        for code, name in _ECONOMICS_SUBSECTIONS
+    )
+    items = "".join(
+        _sa_item(
+            rng, _ko_title(rng),
+            _article_url(rng.choice(_OFFICES), f"00{rng.randrange(10**8):08d}", sid),
+            title_class_wrapper=True,
+        )
+        for _ in range(10)
+    )
+    return (
+        f"<div class=\"ct_snb\"><ul class=\"ct_snb_nav\">{nav}</ul></div>"
+        "<div class=\"section_component as_section_headline\">"
+        f"<div class=\"sa_list\"><ul>{items}</ul></div></div>"
+    )
+
+
+def _naver_subsection(url, rng):
+    sid = urlsplit(url).path.rstrip("/").rsplit("/", 2)[-2]
+    # 서브섹션끼리 같은 기사를 일부 공유 (경제 크롤러의 중복 제거 경로를 태우기 위함)
+    shared = random.Random(0)
+    shared_titles = [_ko_title(shared) for _ in range(40)]
+    blocks = []
+    for _ in range(5):
+        items = []
+        for _ in range(6):
+            if rng.random() < 0.15:
+                title = rng.choice(shared_titles)
+                article_id = f"00{zlib.crc32(title.encode('utf-8')) % 10**8:08d}"
+            else:
+                title = _ko_title(rng)
+                article_id = f"00{rng.randrange(10**8):08d}"
+            items.append(_sa_item(
+                rng, title, _article_url(rng.choice(_OFFICES), article_id, sid),
+                title_class_wrapper=False,
+            ))
+        blocks.append(
+            f"<div class=\"section_article\"><ul class=\"sa_list\">{''.join(items)}</ul></div>"
+        )
+    return f"<div class=\"section_latest\">{''.join(blocks)}</div>"
+
+
+def _editorial_list(url, rng):
+    office = parse_qs(urlsplit(url).query).get("officeId", ["000"])[0]
+    items = "".join(
+        "<li class=\"opinion_editorial_item\">"
+        f"<a href=\"https://n.news.naver.com/mnews/article/{office}/"
+        f"{_EDITORIAL_ID_PREFIX}{rng.randrange(10**9):09d}\" class=\"link\">"
+        f"<strong class=\"title\">[사설] {_ko_title(rng)}</strong></a></li>"
+        for _ in range(rng.randint(2, 4))
+    )
+    return f"<ul class=\"opinion_editorial_list\">{items}</ul>"
+
+
+def _naver_article(url, rng, paragraphs=6):
+    body = "".join(f"{_ko_paragraph(rng)}<br><br>" for _ in range(paragraphs))
+    return (
+        "<div class=\"media_end_head\">"
+        f"<h2 class=\"media_end_head_headline\">{_ko_title(rng)}</h2>"
+        "<div class=\"media_end_head_info_datestamp\">"
+        "<span class=\"media_end_head_info_datestamp_time _ARTICLE_DATE_TIME\">2026.02.19. 오전 9:01</span>"
+        "<span class=\"media_end_head_info_datestamp_time _ARTICLE_MODIFY_DATE_TIME\">"
+        "2026.02.19. 오전 10:12</span></div></div>"
+        f"<div id=\"newsct_article\"><article id=\"dic_area\">{body}</article></div>"
+    )
+
+
+def _editorial_article(url, rng):
+    return _naver_article(url, rng, paragraphs=14)
+
+
+def _finviz_news(url, rng):
+    hosts = [host for host, _ in _FINVIZ_MIX]
+    weights = [weight for _, weight in _FINVIZ_MIX]
+    rows = []
+    for i in range(100):
+        host = rng.choices(hosts, weights)[0]
+        title = _en_sentence(rng, (6, 12))[:-1]
+        finviz_path = f"/news/{rng.randrange(10**6)}/{title.lower().replace(' ', '-')[:40]}"
+        if host is None:
+            anchor = f"<a href=\"{finviz_path}\" class=\"nn-tab-link\">{title}</a>"
+            press = "Motley Fool"
+        else:
+            external = f"https://{host}/news/{rng.randrange(10**8)}.html"
+            # 외부 기사 일부는 href 가 finviz 사본(/news/...)을 가리킨다 (fallback/헤지 대상)
+            href = finviz_path if rng.random() < 0.6 else external
+            anchor = (
+                f"<a href=\"{href}\" class=\"nn-tab-link\" "
+                f"onclick=\"trackAndOpenNews(event, '{host}', '{external}')\">{title}</a>"
+            )
+            press = host.split(".")[-2].capitalize()
+        labels = "".join(
+            f"<a class=\"stock-news-label\" href=\"/quote.ashx?t={t}\">{t}</a>"
+            for t in rng.sample(_TICKERS, rng.randint(0, 3))
+        )
+        rows.append(
+            f"<tr class=\"news_table-row\"><td class=\"news_date-cell\">{i % 12 + 1:02d}:00AM</td>"
+            f"<td class=\"news_link-cell\"><div class=\"news-badges-container\">{anchor}{labels}</div>"
+            f"<span class=\"news_date-cell\">{press}</span></td></tr>"
+        )
+    return f"<div id=\"news\"><div class=\"news\"><table>{''.join(rows)}</table></div></div>"
+
+
+def _paragraphs(rng, count, attrs=""):
+    return "".join(f"<p{attrs}>{_en_sentence(rng)} {_en_sentence(rng)}</p>" for _ in range(count))
+
+
+def _finviz_article(url, rng):
+    return (
+        "<div class=\"news-content\"><div class=\"news-publish-info\">"
+        "<span>February 19, 2026, 4:02 PM</span></div>"
+        f"<div>{_paragraphs(rng, 6)}</div></div>"
+    )
+
+
+def _yahoo(url, rng):
+    return (
+        "<div class=\"byline-attr-meta\"><time class=\"byline-attr-meta-time\">"
+        "Thu, Feb 19, 2026, 4:02 PM</time></div>"
+        "<div class=\"article\"><div class=\"body-wrap\"><div class=\"body\">"
+        f"<p>By {rng.choice(_EN_WORDS).capitalize()} Reporter</p>{_paragraphs(rng, 8)}"
+        "</div></div></div>"
+    )
+
+
+def _prnewswire(url, rng):
+    return (
+        "<p class=\"mb-no\">Feb 19, 2026, 16:02 ET</p>"
+        f"<section class=\"release-body\"><div class=\"row\">{_paragraphs(rng, 8)}</div></section>"
+    )
+
+
+def _businesswire(url, rng):
+    return (
+        "<div class=\"bw-release-story\">"
+        f"<p class=\"bwalignc\"><b>{_en_sentence(rng)}</b></p>{_paragraphs(rng, 8)}</div>"
+    )
+
+
+def _globenewswire(url, rng):
+    return (
+        "<p class=\"article-published-source\">February 19, 2026 16:02 ET</p>"
+        f"<div class=\"article-body\">{_paragraphs(rng, 8)}</div>"
+    )
+
+
+def _investopedia(url, rng):
+    blocks = "".join(
+        f"<div class=\"finance-sc-block-html\">{_en_sentence(rng)}</div>" for _ in range(6)
+    )
+    return (
+        "<div class=\"mntl-attribution__item-date\">Published February 19, 2026</div>"
+        f"<div class=\"article-body-content\">{blocks}</div>"
+    )
+
+
+def _newsfilecorp(url, rng):
+    return (
+        "<div id=\"release\">Toronto, Ontario--(Newsfile Corp. - February 19, 2026)</div>"
+        f"{_paragraphs(rng, 6)}<p style=\"color:#999\">Source: Newsfile</p>"
+    )
+
+
+def _other_source(url, rng):
+    return f"<main><h1>{_en_sentence(rng, (5, 9))}</h1>{_paragraphs(rng, 6)}</main>"
+
+
+def _hackers_quote(url, rng):
+    return (
+        "<div class=\"wisesay\"><p class=\"date\">2026-02-19</p>"
+        "<p class=\"eng\">The best way to predict the future is to create it.</p>"
+        "<p class=\"kor\">미래를 예측하는 가장 좋은 방법은 미래를 창조하는 것이다.</p></div>"
+    )
+
+
+def _connectivity(url, rng):
+    return "ok"
+
+
+_RENDERERS = {
+    "naver_section": _naver_section,
+    "naver_subsection": _naver_subsection,
+    "editorial_list": _editorial_list,
+    "editorial_article": _editorial_article,
+    "naver_article": _naver_article,
+    "finviz_news": _finviz_news,
+    "finviz_article": _finviz_article,
+    "yahoo": _yahoo,
+    "prnewswire": _prnewswire,
+    "businesswire": _businesswire,
+    "globenewswire": _globenewswire,
+    "investopedia": _investopedia,
+    "newsfilecorp": _newsfilecorp,
+    "other_source": _other_source,
+    "hackers_quote": _hackers_quote,
+    "connectivity": _connectivity,
+}
@@ -0,0 +1,91 @@
+"""
+실제 사이트에서 페이지 종류별 HTML 을 한 장씩 녹화해 benchmarks/fixtures/ 에 저장.
+
+크롤러(영어 명언, 헤드라인, 경제 뉴스, 사설, 영문 주식 뉴스)를 실제 네트워크로 한 번 실행하면서
+페이지 종류(benchmarks.fixtures.page_type)마다 처음 받은 200 응답 본문을 <page_type>.html 로 남긴다.
+이후 crawl_bench 의 스텁 서버는 합성 HTML 대신 이 녹화본을 같은 종류의 모든 URL 에 재생한다.
+
+저장 폴더는 임시 폴더로 지정하므로 평소 뉴스 폴더에는 아무것도 쓰지 않는다.
+
+Usage:
+    python -m benchmarks.record_fixtures
+    python -m benchmarks.record_fixtures --overwrite
+"""
+
+import os
+import json
+import argparse
+import tempfile
+import threading
+
+from benchmarks import fixtures
+
+
+def _install_recorder(overwrite):
+    """HTTPAdapter.send 를 감싸 페이지 종류별 첫 200 응답을 저장. 저장한 종류 목록을 반환."""
+    from requests.adapters import HTTPAdapter
+
+    original_send = HTTPAdapter.send
+    saved = []
+    lock = threading.Lock()
+
+    def send(self, request, *args, **kwargs):
+        response = original_send(self, request, *args, **kwargs)
+        if request.method != "GET" or response.status_code != 200:
+            return response
+        kind = fixtures.page_type(request.url)
+        path = os.path.join(fixtures.FIXTURES_DIR, f"{kind}.html")
+        with lock:
+            if kind in saved or (os.path.exists(path) and not overwrite):
+                return response
+            saved.append(kind)
+        with open(path, "wb") as f:
+            f.write(response.content)
+        return response
+
+    HTTPAdapter.send = send
+    return saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description="페이지 종류별 실제 HTML 녹화")
+    parser.add_argument("--overwrite", action="store_true", help="이미 있는 녹화본도 새로 저장")
+    args = parser.parse_args()
+
+    os.makedirs(fixtures.FIXTURES_DIR, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="record_") as directory:
+        config_path = os.path.join(directory, "config.json")
+        with open(config_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "quotes_dir": os.path.join(directory, "quotes"),
+                "news_dir": os.path.join(directory, "news"),
+                "http_cache": {"enabled": False},
+            }, f)
+        # core.config 가 읽기 전에 설정 파일을 지정해야 한다.
+        os.environ["DAILY_GATHERINGS_CONFIG"] = config_path
+
+        saved = _install_recorder(args.overwrite)
+
+        from core import crawling_english_saying
+        from core import run_headline_crawling
+        from core import run_economics_crawling
+        from core import run_opinions_crawling
+        from core import run_eng_stock_check
+
+        crawling_english_saying.insert_latest_quote()
+        run_headline_crawling.main()
+        run_economics_crawling.main()
+        run_opinions_crawling.main()
+        run_eng_stock_check.main()
+
+    missing = [
+        kind for kind in fixtures.PAGE_TYPES
+        if kind not in ("connectivity", "other_source") and fixtures.load_recorded(kind) is None
+    ]
+    print(f"녹화: {', '.join(sorted(saved)) or '(없음)'}")
+    if missing:
+        print(f"녹화본 없음 (합성 HTML 사용): {', '.join(missing)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+벤치마크용 로컬 HTTP 스텁 서버.
+
+크롤러의 모든 요청을 http://127.0.0.1:<port>/<원래 호스트>/<경로> 로 돌려
+benchmarks.fixtures 의 HTML 을 응답한다. 페이지 종류별로 응답 지연과 실패율을 설정할 수 있다.
+
+- 지연: 평균 latency 초 ± jitter 초 (균등 분포), 스레드 서버라 요청끼리 동시에 기다린다.
+- 실패: failure_rate 확률로 503 응답 (크롤러 세션의 재시도 로직이 그대로 동작).
+- HTTP/1.1 keep-alive 로 응답해 실제 서버처럼 연결을 재사용할 수 있다.
+- 페이지 종류별 요청 수/바이트/실패 수를 센다.
+"""
+
+import time
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from benchmarks import fixtures
+
+
+class StubSettings:
+    """응답 지연/실패 설정. page_latency / page_failure 는 페이지 종류별 덮어쓰기."""
+
+    def __init__(self, latency=0.05, jitter=0.02, failure_rate=0.0,
+                 page_latency=None, page_failure=None, scale=1.0, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.page_latency = dict(page_latency or {})
+        self.page_failure = dict(page_failure or {})
+        self.scale = scale
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+    def delay_for(self, kind):
+        base = self.page_latency.get(kind, self.latency)
+        with self._rng_lock:
+            return max(0.0, base + self._rng.uniform(-self.jitter, self.jitter))
+
+    def should_fail(self, kind):
+        rate = self.page_failure.get(kind, self.failure_rate)
+        with self._rng_lock:
+            return self._rng.random() < rate
+
+    def as_dict(self):
+        return {
+            "latency": self.latency,
+            "jitter": self.jitter,
+            "failure_rate": self.failure_rate,
+            "page_latency": self.page_latency,
+            "page_failure": self.page_failure,
+            "scale": self.scale,
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _original_url(self):
+        """/<host>/<path>?<query> → https://<host>/<path>?<query>"""
+        host, _, rest = self.path.lstrip("/").partition("/")
+        return f"https://{host}/{rest}"
+
+    def _respond(self, send_body):
+        server = self.server
+        url = self._original_url()
+        kind = fixtures.page_type(url)
+        time.sleep(server.settings.delay_for(kind))
+
+        if server.settings.should_fail(kind):
+            server.record(kind, 0, failed=True)
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = server.page(url)
+        server.record(kind, len(body))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+
+class StubServer(ThreadingHTTPServer):
+    """픽스처를 응답하는 스레드 HTTP 서버. start() 후 port 로 접속한다."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, settings=None, port=0):
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.settings = settings or StubSettings()
+        self._pages = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def page(self, url):
+        """url 의 응답 본문 (URL 별로 한 번만 만든다)."""
+        body = self._pages.get(url)
+        if body is None:
+            _, body = fixtures.render(url, self.settings.scale)
+            self._pages[url] = body
+        return body
+
+    def record(self, kind, size, failed=False):
+        with self._lock:
+            stat = self._stats.setdefault(kind, {"requests": 0, "bytes": 0, "failures": 0})
+            stat["requests"] += 1
+            stat["bytes"] += size
+            stat["failures"] += int(failed)
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {}
+
+    def stats(self):
+        """{page_type: {"requests", "bytes", "failures"}} 사본."""
+        with self._lock:
+            return {kind: dict(stat) for kind, stat in self._stats.items()}
+
+
+def redirect_to_stub(port):
+    """이 프로세스의 모든 requests 요청을 스텁 서버로 돌린다.
+
+    HTTPAdapter.send 를 감싸 URL 만 바꾸므로 세션/재시도/캐시 어댑터(CachingAdapter 는
+    원래 URL 로 캐시 키를 만든 뒤 super().send 를 호출)는 그대로 동작한다.
+    """
+    from requests.adapters import HTTPAdapter
+
+    original_send = HTTPAdapter.send
+
+    def send(self, request, *args, **kwargs):
+        parts = urlsplit(request.url)
+        request = request.copy()
+        request.url = (
+            f"http://127.0.0.1:{port}/{parts.hostname}{parts.path or '/'}"
+            + (f"?{parts.query}" if parts.query else "")
+        )
+        return original_send(self, request, *args, **kwargs)
+
+    HTTPAdapter.send = send
@@ -0,0 +1,360 @@
+"""
+기사 아카이브 (SQLite + FTS5 전문 검색).
+
+텍스트 파일과 별도로 모든 크롤러의 수집 결과를 NEWS_DIR/archive.sqlite3 에 쌓아,
+몇 달 치 파일을 grep 하지 않고도 키워드·날짜·언론사·종목으로 바로 찾을 수 있게 한다.
+
+- 크롤러마다 수집이 끝나면 store_records() 로 한 트랜잭션 안에서 한꺼번에 저장한다.
+  같은 날 다시 실행하면 (날짜, 종류, URL) 이 같은 행을 갱신한다.
+- WAL 모드: 병렬로 도는 크롤러들의 저장은 짧은 쓰기 잠금만 차례로 잡고, 읽기(검색)는 막지 않는다.
+- FTS5 인덱스(title/summary/body): trigram 토크나이저를 쓸 수 있으면 한국어 조사가 붙은 단어도
+  부분 문자열로 찾는다 (3글자 이상 검색어). 2글자 이하 검색어나 FTS5 가 없는 환경은 LIKE 로 찾는다.
+- 날짜/언론사/종목 라벨 인덱스.
+
+검색 CLI:
+    python -m core.archive search 반도체 수출
+    python -m core.archive search 금리 --kind economics --from 2026-01-01 --limit 50
+    python -m core.archive search --label NVDA --kind stock
+    python -m core.archive stats
+"""
+
+import os
+import sys
+import time
+import sqlite3
+import argparse
+import threading
+
+from core.config import ARCHIVE, ARCHIVE_PATH
+
+
+KINDS = ("headline", "economics", "opinion", "stock")
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS articles ("
+    " id INTEGER PRIMARY KEY,"
+    " day TEXT NOT NULL,"          # 수집일 YYYY-MM-DD
+    " kind TEXT NOT NULL,"         # headline / economics / opinion / stock
+    " key TEXT NOT NULL,"          # URL (없으면 제목) — 같은 날 재실행 시 갱신 기준
+    " category TEXT,"              # 헤드라인 탭 / 경제 서브섹션
+    " title TEXT NOT NULL,"
+    " summary TEXT,"
+    " body TEXT,"
+    " press TEXT,"
+    " url TEXT,"
+    " published TEXT,"
+    " modified TEXT,"
+    " labels TEXT,"                # 종목 라벨 (쉼표 구분, 검색은 article_labels 로)
+    " UNIQUE (day, kind, key))",
+    "CREATE INDEX IF NOT EXISTS articles_day ON articles(day)",
+    "CREATE INDEX IF NOT EXISTS articles_press ON articles(press)",
+    "CREATE INDEX IF NOT EXISTS articles_url ON articles(url)",
+    "CREATE TABLE IF NOT EXISTS article_labels ("
+    " label TEXT NOT NULL,"
+    " article_id INTEGER NOT NULL REFERENCES articles(id) ON DELETE CASCADE,"
+    " PRIMARY KEY (label, article_id)) WITHOUT ROWID",
+)
+
+# FTS5 외부 콘텐츠 테이블 동기화 트리거
+_FTS_TRIGGERS = (
+    "CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN"
+    " INSERT INTO articles_fts(rowid, title, summary, body)"
+    " VALUES (new.id, new.title, new.summary, new.body); END",
+    "CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN"
+    " INSERT INTO articles_fts(articles_fts, rowid, title, summary, body)"
+    " VALUES ('delete', old.id, old.title, old.summary, old.body); END",
+    "CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN"
+    " INSERT INTO articles_fts(articles_fts, rowid, title, summary, body)"
+    " VALUES ('delete', old.id, old.title, old.summary, old.body);"
+    " INSERT INTO articles_fts(rowid, title, summary, body)"
+    " VALUES (new.id, new.title, new.summary, new.body); END",
+)
+
+_UPSERT = (
+    "INSERT INTO articles"
+    " (day, kind, key, category, title, summary, body, press, url, published, modified, labels)"
+    " VALUES (:day, :kind, :key, :category, :title, :summary, :body, :press, :url,"
+    " :published, :modified, :labels)"
+    " ON CONFLICT (day, kind, key) DO UPDATE SET"
+    " category = excluded.category, title = excluded.title, summary = excluded.summary,"
+    " body = excluded.body, press = excluded.press, url = excluded.url,"
+    " published = excluded.published, modified = excluded.modified, labels = excluded.labels"
+)
+
+_FIELDS = ("category", "title", "summary", "body", "press", "url", "published", "modified")
+
+
+class Archive:
+    """기사 아카이브 DB. 호출마다 연결을 열어 여러 스레드에서 써도 안전하다."""
+
+    def __init__(self, path):
+        self.path = path
+        self._schema_lock = threading.Lock()
+        self._ready = False
+        self.fts_tokenizer = None   # "trigram" / "unicode61" / None(FTS5 없음)
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA busy_timeout = 30000")
+        conn.execute("PRAGMA foreign_keys = ON")
+        if not self._ready:
+            self._init_schema(conn)
+        return conn
+
+    def _init_schema(self, conn):
+        with self._schema_lock:
+            if self._ready:
+                return
+            conn.execute("PRAGMA journal_mode = WAL")
+            with conn:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+                self.fts_tokenizer = self._ensure_fts(conn)
+            self._ready = True
+
+    def _ensure_fts(self, conn):
+        """FTS5 테이블을 만들고 사용 중인 토크나이저 이름을 반환 (FTS5 가 없으면 None)."""
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'articles_fts'"
+        ).fetchone()
+        if row is None:
+            for tokenizer in ("trigram", "unicode61"):
+                try:
+                    conn.execute(
+                        "CREATE VIRTUAL TABLE articles_fts USING fts5("
+                        f"title, summary, body, content='articles', content_rowid='id', tokenize='{tokenizer}')"
+                    )
+                    break
+                except sqlite3.OperationalError:
+                    continue
+            else:
+                return None
+            for statement in _FTS_TRIGGERS:
+                conn.execute(statement)
+            return tokenizer
+        return "trigram" if "trigram" in row[0] else "unicode61"
+
+    # ── 저장 ──
+
+    def store(self, kind, day, records):
+        """records(dict 목록)를 한 트랜잭션으로 저장하고 저장한 행 수를 반환.
+
+        dict 키: title(필수), category, summary, body, press, url, published, modified, labels(목록)
+        """
+        rows = []
+        for record in records:
+            title = record.get("title") or ""
+            url = record.get("url") or ""
+            if not (title or url):
+                continue
+            row = {field: record.get(field) or None for field in _FIELDS}
+            row.update(
+                day=day, kind=kind, key=url or title, title=title,
+                labels=",".join(record.get("labels") or ()) or None,
+            )
+            rows.append((row, list(record.get("labels") or ())))
+
+        conn = self._connect()
+        try:
+            with conn:
+                for row, labels in rows:
+                    conn.execute(_UPSERT, row)
+                    if kind != "stock":
+                        continue
+                    article_id = conn.execute(
+                        "SELECT id FROM articles WHERE day = ? AND kind = ? AND key = ?",
+                        (day, kind, row["key"]),
+                    ).fetchone()[0]
+                    conn.execute("DELETE FROM article_labels WHERE article_id = ?", (article_id,))
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO article_labels (label, article_id) VALUES (?, ?)",
+                        [(label.upper(), article_id) for label in labels],
+                    )
+        finally:
+            conn.close()
+        return len(rows)
+
+    # ── 검색 ──
+
+    def search(self, terms=(), kind=None, day_from=None, day_to=None, press=None, label=None, limit=20):
+        """조건에 맞는 기사를 최근 저장한 순서로 반환. 모든 검색어를 포함(AND)해야 한다.
+
+        FTS 인덱스를 rowid 역순으로 훑다가 limit 개를 채우면 멈추므로,
+        1년 치가 쌓여도 흔한 검색어까지 수 ms 안에 끝난다 (날짜 정렬은 일치 행 전부를 정렬해야 한다).
+
+        Returns:
+            list of dict (day, kind, category, title, press, url, published, labels)
+        """
+        # 연결을 먼저 열어 스키마를 확인해야 FTS5 사용 여부(fts_tokenizer)가 정해진다
+        conn = self._connect()
+        where, params = [], []
+        join = ""
+        order = "a.id DESC"
+        fts_terms = [t for t in terms if self._fts_usable(t)]
+        like_terms = [t for t in terms if not self._fts_usable(t)]
+        if fts_terms:
+            join = " JOIN articles_fts ON articles_fts.rowid = a.id"
+            order = "articles_fts.rowid DESC"
+            where.append("articles_fts MATCH ?")
+            params.append(" AND ".join('"' + t.replace('"', '""') + '"' for t in fts_terms))
+        for term in like_terms:
+            where.append(
+                "(a.title LIKE ? ESCAPE '\\' OR a.summary LIKE ? ESCAPE '\\' OR a.body LIKE ? ESCAPE '\\')"
+            )
+            pattern = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            params.extend([pattern] * 3)
+        if kind:
+            where.append("a.kind = ?")
+            params.append(kind)
+        if day_from:
+            where.append("a.day >= ?")
+            params.append(day_from)
+        if day_to:
+            where.append("a.day <= ?")
+            params.append(day_to)
+        if press:
+            where.append("a.press = ?")
+            params.append(press)
+        if label:
+            where.append("a.id IN (SELECT article_id FROM article_labels WHERE label = ?)")
+            params.append(label.upper())
+
+        sql = (
+            "SELECT a.day, a.kind, a.category, a.title, a.press, a.url, a.published, a.labels"
+            f" FROM articles a{join}"
+            + (" WHERE " + " AND ".join(where) if where else "")
+            + f" ORDER BY {order} LIMIT ?"
+        )
+        params.append(limit)
+        try:
+            rows = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+        columns = ("day", "kind", "category", "title", "press", "url", "published", "labels")
+        return [dict(zip(columns, row)) for row in rows]
+
+    def latest_by_url(self, urls):
+        """URL 별로 가장 최근에 저장한 행 {url: {day, title, summary, body, press, published, modified}}.
+
+        이전 날 수집한 기사의 상세를 다시 받지 않고 재사용할 때 쓴다 (core.seen_index).
+        """
+        urls = list(dict.fromkeys(url for url in urls if url))
+        columns = ("day", "title", "summary", "body", "press", "published", "modified")
+        found = {}
+        conn = self._connect()
+        try:
+            for start in range(0, len(urls), 500):
+                chunk = urls[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT url, {', '.join(columns)} FROM articles"
+                    f" WHERE url IN ({', '.join('?' * len(chunk))}) ORDER BY day, id",
+                    chunk,
+                )
+                for url, *values in rows:
+                    found[url] = dict(zip(columns, values))
+        finally:
+            conn.close()
+        return found
+
+    def _fts_usable(self, term):
+        if self.fts_tokenizer == "trigram":
+            return len(term) >= 3
+        return self.fts_tokenizer is not None
+
+    def stats(self):
+        """{"articles", "days", "first_day", "last_day", "by_kind", "fts"}"""
+        conn = self._connect()
+        try:
+            total, days, first, last = conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT day), MIN(day), MAX(day) FROM articles"
+            ).fetchone()
+            by_kind = dict(conn.execute("SELECT kind, COUNT(*) FROM articles GROUP BY kind"))
+        finally:
+            conn.close()
+        return {
+            "articles": total, "days": days, "first_day": first, "last_day": last,
+            "by_kind": by_kind, "fts": self.fts_tokenizer,
+        }
+
+
+_archive = None
+_archive_lock = threading.Lock()
+
+
+def get_archive():
+    """프로세스 공용 Archive. 비활성화되어 있으면 None."""
+    global _archive
+    if _archive is None and ARCHIVE.get("enabled"):
+        with _archive_lock:
+            if _archive is None:
+                os.makedirs(os.path.dirname(ARCHIVE_PATH), exist_ok=True)
+                _archive = Archive(ARCHIVE_PATH)
+    return _archive
+
+
+def store_records(kind, day, records):
+    """크롤러용: 아카이브에 저장하고 저장한 행 수를 반환.
+
+    아카이브가 꺼져 있으면 0, 저장에 실패하면 None (텍스트 파일 저장에는 영향 없음).
+    """
+    try:
+        archive = get_archive()
+        if archive is None:
+            return 0
+        return archive.store(kind, day, records)
+    except (OSError, sqlite3.Error):
+        return None
+
+
+# ─────────────────────────────────────────────
+# 검색 CLI
+# ─────────────────────────────────────────────
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m core.archive", description="기사 아카이브 검색")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    search = commands.add_parser("search", help="키워드/조건으로 기사 검색")
+    search.add_argument("terms", nargs="*", help="검색어 (모두 포함)")
+    search.add_argument("--kind", choices=KINDS)
+    search.add_argument("--from", dest="day_from", metavar="YYYY-MM-DD")
+    search.add_argument("--to", dest="day_to", metavar="YYYY-MM-DD")
+    search.add_argument("--press")
+    search.add_argument("--label", help="종목 라벨 (예: NVDA)")
+    search.add_argument("--limit", type=int, default=20)
+
+    commands.add_parser("stats", help="아카이브 통계")
+
+    args = parser.parse_args(argv)
+    if not os.path.isfile(ARCHIVE_PATH):
+        print(f"아카이브가 없습니다: {ARCHIVE_PATH}")
+        return 1
+    archive = Archive(ARCHIVE_PATH)
+
+    if args.command == "stats":
+        stats = archive.stats()
+        print(f"아카이브: {ARCHIVE_PATH}")
+        print(f"  기사 {stats['articles']}건 / {stats['days']}일 ({stats['first_day']} ~ {stats['last_day']})")
+        for kind, count in sorted(stats["by_kind"].items()):
+            print(f"  {kind:<10} {count}건")
+        print(f"  전문 검색: {stats['fts'] or '없음 (LIKE 검색)'}")
+        return 0
+
+    start = time.perf_counter()
+    rows = archive.search(
+        args.terms, kind=args.kind, day_from=args.day_from, day_to=args.day_to,
+        press=args.press, label=args.label, limit=args.limit,
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+    for row in rows:
+        source = row["press"] or row["category"] or ""
+        labels = f" [{row['labels']}]" if row["labels"] else ""
+        print(f"{row['day']}  {row['kind']:<9} {source[:12]:<12} {row['title']}{labels}")
+        if row["url"]:
+            print(f"{'':>12}{row['url']}")
+    print(f"\n{len(rows)}건 ({elapsed:.1f}ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+실행 단위 기사 메타데이터 메모.
+
+헤드라인의 경제 섹션과 경제 뉴스 서브섹션은 같은 기사를 많이 공유하므로,
+한 번의 실행 안에서 같은 네이버 기사 페이지를 두 번 받아 파싱하지 않도록
+기사 URL(추적 파라미터 제거)별로 작성일/수정일을 기억한다.
+
+- 스레드 안전: 여러 크롤러 스레드가 동시에 같은 URL 을 요청하면
+  처음 요청한 스레드만 실제로 가져오고 나머지는 그 결과를 함께 기다린다.
+- 가져오기에 실패하면 메모에 남기지 않아, 이후 호출이 다시 시도할 수 있다.
+- 아낀 요청 수(saved)를 실행 결과 요약에 보고한다.
+"""
+
+import threading
+from concurrent.futures import Future
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from core.config import TRACKING_PARAMS
+
+
+def canonical_url(url):
+    """추적용 쿼리 파라미터와 fragment 를 제거한 정규화 URL.
+
+    예) https://n.news.naver.com/mnews/article/015/0005012345?sid=101
+        → https://n.news.naver.com/mnews/article/015/0005012345
+    """
+    parts = urlsplit(url.strip())
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+    ]
+    return urlunsplit((
+        parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), "",
+    ))
+
+
+class ArticleMemo:
+    """정규화 URL → 메타데이터. 진행 중인 요청은 Future 로 공유한다."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._fetches = 0
+        self._saved = 0
+
+    def get_or_fetch(self, url, fetch):
+        """메모에 있으면 그 값을, 없으면 fetch(url) 결과를 저장해 반환.
+
+        fetch 가 예외를 던지면 메모에서 지우고 같은 예외를 (기다리던 호출자에게도) 전달한다.
+        """
+        key = canonical_url(url)
+        with self._lock:
+            future = self._entries.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._entries[key] = future
+                self._fetches += 1
+            else:
+                self._saved += 1
+
+        if owner:
+            try:
+                future.set_result(fetch(url))
+            except Exception as e:
+                with self._lock:
+                    self._entries.pop(key, None)
+                future.set_exception(e)
+        return future.result()
+
+    def put(self, url, value):
+        """다른 경로(예: 사설 본문 수집)에서 이미 파싱한 메타데이터를 기억."""
+        key = canonical_url(url)
+        with self._lock:
+            if key not in self._entries:
+                future = Future()
+                future.set_result(value)
+                self._entries[key] = future
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._fetches = 0
+            self._saved = 0
+
+    def stats(self):
+        """{"fetches": 실제 요청 수, "saved": 메모로 아낀 요청 수}"""
+        with self._lock:
+            return {"fetches": self._fetches, "saved": self._saved}
+
+
+article_memo = ArticleMemo()
@@ -11,11 +11,13 @@
     · 뉴스 저장 폴더      = C:\\news
 - 사용자가 `config.json` 의 경로를 수정하면 다음 실행부터 해당 경로에 저장된다.
 - `config.json` 은 사용자별 설정이므로 git 추적에서 제외(.gitignore)한다.
+- 환경 변수 DAILY_GATHERINGS_CONFIG 로 다른 설정 파일을 지정할 수 있다 (벤치마크 등).
 """
 
 import os
 import sys
 import json
+from urllib.parse import urlsplit
 
 
 # ─────────────────────────────────────────────
@@ -39,12 +41,85 @@ def _desktop_dir():
     return os.path.join(os.path.expanduser("~"), "Desktop")
 
 
-CONFIG_PATH = os.path.join(_base_dir(), "config.json")
+CONFIG_PATH = os.environ.get("DAILY_GATHERINGS_CONFIG") or os.path.join(_base_dir(), "config.json")
 
 # config.json 기본값
 DEFAULT_CONFIG = {
     "quotes_dir": _desktop_dir(),   # 영어 명언 저장 폴더 (기본: 바탕화면)
     "news_dir": r"C:\news",         # 뉴스 저장 폴더 (기본: C:\news)
+    "max_in_flight": 32,            # 동시에 진행할 수 있는 최대 요청 수 (전체)
+    "host_concurrency": {           # 호스트별 동시 요청 상한 (하위 도메인 포함, default=그 외)
+        "news.naver.com": 6,
+        "n.news.naver.com": 6,
+        "finviz.com": 4,
+        "finance.yahoo.com": 2,
+        "www.prnewswire.com": 3,
+        "www.prnewswire.co.uk": 3,
+        "www.businesswire.com": 2,
+        "www.globenewswire.com": 3,
+        "www.investopedia.com": 2,
+        "www.newsfilecorp.com": 3,
+        "www.hackers.co.kr": 2,
+        "default": 4,
+    },
+    "connection_pool": {            # keep-alive 연결 풀 (모든 크롤러 스레드가 공유)
+        "max_hosts": 32,            # 연결 풀을 유지할 최대 호스트 수 (넘으면 오래 안 쓴 호스트 풀부터 닫음)
+        "sizes": {},                # 호스트별 유지 연결 수 (지정하지 않은 호스트는 host_concurrency + 2)
+    },
+    "html_parser": "auto",          # HTML 파서: auto(lxml/selectolax 있으면 사용) / lxml / html.parser
+    "detail_concurrency": 8,        # 기사 상세(작성일/수정일) 동시 수집 수
+    "section_concurrency": 6,       # 섹션/서브섹션 목록 페이지 동시 수집 수
+    "editorial_concurrency": 6,     # 사설 상세 동시 수집 수 (목록 수집과 겹쳐 진행)
+    "hedge": {                      # 주식 뉴스 상세: 외부 소스가 늦으면 finviz 사본을 병렬 요청
+        "enabled": True,
+        "percentile": 90,           # 소스별 지연 백분위를 대기 임계값으로 사용
+        "min_samples": 10,          # 표본이 이보다 적으면 initial_delay 사용
+        "initial_delay": 2.0,       # 초기 대기 임계값(초)
+        "max_delay": 8.0,           # 대기 임계값 상한(초)
+        "workers": 16,              # 헤지 요청 전용 스레드 수
+    },
+    "rate_limits": {                # 호스트별 요청 속도 (rate=초당 요청 수, burst=연속 허용 수)
+        "news.naver.com": {"rate": 2, "burst": 4},
+        "n.news.naver.com": {"rate": 4, "burst": 6},
+        "finviz.com": {"rate": 1, "burst": 2},
+        "finance.yahoo.com": {"rate": 1, "burst": 2},
+        "www.prnewswire.com": {"rate": 1, "burst": 2},
+        "www.prnewswire.co.uk": {"rate": 1, "burst": 2},
+        "www.businesswire.com": {"rate": 1, "burst": 2},
+        "www.globenewswire.com": {"rate": 1, "burst": 2},
+        "www.investopedia.com": {"rate": 1, "burst": 2},
+        "www.newsfilecorp.com": {"rate": 1, "burst": 2},
+        "www.hackers.co.kr": {"rate": 1, "burst": 2},
+        "default": {"rate": 2, "burst": 4},
+    },
+    "rate_limit_total": {"rate": 20, "burst": 20},  # 전체 요청 속도 상한
+    "http_cache": {                 # 디스크 HTTP 캐시 (NEWS_DIR/cache)
+        "enabled": True,
+        "max_mb": 200,              # 캐시 최대 크기(MB), 넘으면 오래 안 쓴 항목부터 삭제
+        "default_ttl": 0,           # 기본 신선도 유지 시간(초), 0 이면 매번 조건부 GET 으로 재검증
+        "ttl_rules": {              # URL 부분 문자열 → 신선도 유지 시간(초)
+            "n.news.naver.com/": 7 * 24 * 3600,
+            "finviz.com/news/": 7 * 24 * 3600,
+        },
+    },
+    "archive": {                    # 기사 아카이브 (NEWS_DIR/archive.sqlite3, 전문 검색)
+        "enabled": True,
+    },
+    "seen_index": {                 # 이전 날 수집한 기사 URL 색인 (NEWS_DIR/cache)
+        "enabled": True,
+        "repeats": "keep",          # 이전 수집 기사: "keep" 그대로 / "mark" 표시 / "drop" 파일에서 제외
+        "retention_days": 730,      # 이 기간 동안 다시 나오지 않은 URL 은 색인에서 지움
+    },
+    "snapshots": {                  # 원본 HTML 스냅샷 (NEWS_DIR/snapshots, 같은 본문은 한 번만 저장)
+        "enabled": True,
+        "level": 10,                # 압축 수준 (zstd 1~22, zstandard 가 없으면 zlib 1~9)
+        "dictionaries": True,       # 학습한 페이지 종류별 zstd 사전 사용 (python -m core.snapshots train)
+        "queue_size": 256,          # 쓰기 대기열 크기 (가득 차면 그 페이지는 건너뜀)
+    },
+    "daemon": {                     # 상주 모드 (python daily_runner.py --daemon)
+        "times": ["07:00"],         # 매일 실행할 시각 (HH:MM, 여러 개 가능)
+        "run_on_start": False,      # 시작하자마자 한 번 실행
+    },
 }
 
 
@@ -67,10 +142,14 @@ def _load_or_create_config():
         # 누락 키 보강: 기본값 위에 사용자가 지정한 유효한 값만 덮어쓴다.
         merged = dict(DEFAULT_CONFIG)
         for key, value in data.items():
-            if isinstance(value, str) and value.strip():
-                merged[key] = value
-            elif key not in DEFAULT_CONFIG:
+            if key not in DEFAULT_CONFIG:
                 merged[key] = value
+            elif _is_valid_value(value, DEFAULT_CONFIG[key]):
+                if isinstance(value, dict):
+                    # 사전형 설정은 기본값과 병합 (일부 호스트만 지정해도 됨)
+                    merged[key] = {**DEFAULT_CONFIG[key], **value}
+                else:
+                    merged[key] = value
 
         # 누락 키가 있었다면 파일에 보강해 저장 (선택적 편의 기능).
         if merged != data:
@@ -82,6 +161,17 @@ def _load_or_create_config():
     return dict(DEFAULT_CONFIG)
 
 
+def _is_valid_value(value, default):
+    """사용자 값이 기본값과 같은 종류(문자열/숫자/불리언/사전/목록)인지 확인."""
+    if isinstance(default, bool):
+        return isinstance(value, bool)
+    if isinstance(default, (int, float)):
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if isinstance(default, str):
+        return isinstance(value, str) and bool(value.strip())
+    return isinstance(value, type(default))
+
+
 def _save_config(cfg):
     """config.json 을 저장. 실패해도 크롤링은 계속되도록 예외를 흡수한다."""
     try:
@@ -101,6 +191,32 @@ HEADLINES_DIR = os.path.join(NEWS_DIR, "headlines")     # 헤드라인
 ECONOMICS_DIR = os.path.join(NEWS_DIR, "economics")     # 경제 뉴스
 OPINIONS_DIR = os.path.join(NEWS_DIR, "opinions")       # 사설
 STOCK_NEWS_DIR = os.path.join(NEWS_DIR, "stock_news")   # 영문 주식 뉴스
+CACHE_DIR = os.path.join(NEWS_DIR, "cache")             # HTTP 캐시 등 재사용 데이터
+HTTP_CACHE_PATH = os.path.join(CACHE_DIR, "http_cache.sqlite3")
+ARCHIVE_PATH = os.path.join(NEWS_DIR, "archive.sqlite3")   # 기사 아카이브 DB
+SEEN_INDEX_PATH = os.path.join(CACHE_DIR, "seen_urls.bin")  # 이전 수집 URL 색인
+QUOTE_STORE_DIR = os.path.join(NEWS_DIR, "quotes")      # 영어 명언 저장소 (연도별 기록 + 날짜 색인)
+QUOTE_BACKFILL_PATH = os.path.join(CACHE_DIR, "quote_backfill.json")  # 영어 명언 백필 체크포인트
+SNAPSHOT_DIR = os.path.join(NEWS_DIR, "snapshots")      # 원본 HTML 스냅샷 (내용 주소 기반 압축 보관)
+DAEMON_STATUS_PATH = os.path.join(LOGS_DIR, "daemon_status.json")  # 상주 모드 상태
+DAEMON_LOCK_PATH = os.path.join(LOGS_DIR, "daemon.lock")           # 상주 모드 중복 실행 방지
+
+# ── 동시 요청 설정 ──
+MAX_IN_FLIGHT = _cfg["max_in_flight"]                    # 전체 동시 요청 상한
+HOST_CONCURRENCY = _cfg["host_concurrency"]              # 호스트별 동시 요청 상한
+CONNECTION_POOL = _cfg["connection_pool"]                # 연결 풀 설정
+HTML_PARSER = _cfg["html_parser"]                        # HTML 파서 백엔드
+DETAIL_CONCURRENCY = _cfg["detail_concurrency"]          # 기사 상세 동시 수집 수
+SECTION_CONCURRENCY = _cfg["section_concurrency"]        # 섹션 목록 동시 수집 수
+EDITORIAL_CONCURRENCY = _cfg["editorial_concurrency"]    # 사설 상세 동시 수집 수
+HEDGE = _cfg["hedge"]                                    # 헤지 요청 설정
+RATE_LIMITS = _cfg["rate_limits"]                        # 호스트별 토큰 버킷 설정
+RATE_LIMIT_TOTAL = _cfg["rate_limit_total"]              # 전체 토큰 버킷 설정
+HTTP_CACHE = _cfg["http_cache"]                          # 디스크 HTTP 캐시 설정
+ARCHIVE = _cfg["archive"]                                # 기사 아카이브 설정
+SEEN_INDEX = _cfg["seen_index"]                          # 이전 수집 URL 색인 설정
+SNAPSHOTS = _cfg["snapshots"]                            # 원본 HTML 스냅샷 설정
+DAEMON = _cfg["daemon"]                                  # 상주 모드 설정
 
 
 # ─────────────────────────────────────────────
@@ -119,6 +235,12 @@ HEADERS = {
     "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
 }
 
+# Hackers영어 명언 게시판 전용
+QUOTE_HEADERS = {
+    "User-Agent": _USER_AGENT,
+    "Referer": "https://www.hackers.co.kr/",
+}
+
 # finviz 전용 (봇 차단 회피용 Referer 포함)
 FINVIZ_HEADERS = {
     "User-Agent": _USER_AGENT,
@@ -128,25 +250,25 @@ FINVIZ_HEADERS = {
 
 
 # ─────────────────────────────────────────────
-# 타임아웃 / 재시도 / 요청 간 딜레이
+# 타임아웃 / 재시도
+#   요청 간 간격은 고정 딜레이 대신 rate_limits(토큰 버킷)로 조절한다.
 # ─────────────────────────────────────────────
 
 DEFAULT_TIMEOUT = 10          # 일반 요청 타임아웃(초)
 RETRY_COUNT = 3               # HTTP 재시도 횟수
 RETRY_BACKOFF = 0.5           # 재시도 백오프 계수
 
-INTERNET_CHECK_URL = "https://www.google.com"
-INTERNET_CHECK_TIMEOUT = 5    # 인터넷 연결 확인 타임아웃(초)
+INTERNET_CHECK_TIMEOUT = 5    # 인터넷 연결 확인 타임아웃(초, DNS/TLS 예열용 HEAD 요청)
 INTERNET_MAX_RETRIES = 5      # 인터넷 연결 재시도 최대 횟수
 INTERNET_RETRY_INTERVAL = 5   # 인터넷 연결 재시도 간격(초)
 
-ARTICLE_DETAIL_DELAY = 0.5    # 기사 상세 요청 간 딜레이(초)
-SECTION_CRAWL_DELAY = 1       # 섹션/서브섹션 크롤링 간 딜레이(초)
-EDITORIAL_LIST_DELAY = 1      # 사설 목록 요청 간 딜레이(초)
-EDITORIAL_DETAIL_DELAY = 0.5  # 사설 상세 요청 간 딜레이(초)
 FINVIZ_TIMEOUT = 15           # finviz 요청 타임아웃(초)
 
 
+# 기사 URL 정규화 시 제거할 추적용 쿼리 파라미터 (utm_* 는 항상 제거)
+TRACKING_PARAMS = {"sid", "type", "ntype", "rc", "fbclid", "gclid"}
+
+
 # ─────────────────────────────────────────────
 # 수집 건수 검증 임계값 (이하이면 WARNING)
 # ─────────────────────────────────────────────
@@ -174,6 +296,28 @@ NAVER_SECTIONS = {
 # 경제 뉴스(서브섹션) 진입 페이지
 NAVER_ECONOMICS_URL = "https://news.naver.com/section/101"
 
+# finviz 뉴스 목록 페이지 (영문 주식 뉴스 크롤링 대상)
+FINVIZ_NEWS_URL = "https://finviz.com/news.ashx?v=3"
+
+# Hackers영어 '오늘의 한줄 영어명언' 게시판 (첫 페이지 = 최신 명언)
+QUOTE_URL = "https://www.hackers.co.kr/?c=s_eng/eng_contents/B_others_wisesay"
+QUOTE_PAGE_URL = QUOTE_URL + "&p={page}"    # 게시판 목록 페이지 (백필용, p=1 이 최신)
+
+
+# ─────────────────────────────────────────────
+# 인터넷 연결 확인 (수집 대상에 동시에 요청)
+#   ("GET", url, headers, timeout): 크롤러의 첫 목록 페이지. 받은 응답은 크롤러가 같은 페이지를
+#                                   같은 헤더로 요청할 때 그대로 쓴다 (http_utils.prefetch).
+#   ("HEAD", url, headers, timeout): 상세 페이지만 받는 호스트. DNS 조회와 TLS 연결만 미리 맺어 둔다.
+#   하나라도 응답하면 연결된 것으로 보고 바로 크롤링을 시작한다.
+# ─────────────────────────────────────────────
+
+INTERNET_PROBES = (
+    ("GET", NAVER_ECONOMICS_URL, HEADERS, DEFAULT_TIMEOUT),     # 헤드라인 경제 섹션 = 경제 뉴스 진입 페이지
+    ("GET", FINVIZ_NEWS_URL, FINVIZ_HEADERS, FINVIZ_TIMEOUT),
+    ("HEAD", "https://n.news.naver.com/", HEADERS, INTERNET_CHECK_TIMEOUT),
+)
+
 
 # ─────────────────────────────────────────────
 # 사설 수집 대상 언론사 (이름 → 네이버 officeId)
@@ -232,6 +376,25 @@ SELECTORS = {
 }
 
 
+# ─────────────────────────────────────────────
+# 호스트별 설정 조회
+# ─────────────────────────────────────────────
+
+def host_key(url, table):
+    """URL 의 호스트에 해당하는 table 키를 반환.
+
+    정확히 일치하는 호스트를 먼저 찾고, 없으면 상위 도메인 순으로 찾는다.
+    (예: "n.news.naver.com" → "news.naver.com" → "naver.com")
+    아무것도 없으면 "default".
+    """
+    host = (urlsplit(url).hostname or "").lower()
+    while host:
+        if host in table:
+            return host
+        _, _, host = host.partition(".")
+    return "default"
+
+
 def find_with_fallback(node, key):
     """SELECTORS[key] 후보를 순서대로 시도해 처음 매칭되는 단일 요소를 반환.
 
@@ -0,0 +1,193 @@
+"""
+연결 관리 (keep-alive 연결 풀 + 스레드별 세션).
+
+크롤러 스레드와 요청 엔진 워커 스레드가 한 프로세스에서 동시에 요청을 보내므로,
+연결 관리를 다음처럼 나눈다.
+
+- 연결 풀: urllib3 PoolManager 하나를 모든 스레드가 공유한다 (urllib3 PoolManager 와
+  연결 풀은 스레드 안전). 호스트마다 유지할 연결 수를 따로 정해, 동시 요청 상한
+  (host_concurrency)보다 풀이 작아 응답 후 연결을 버리고 다시 맺는 일이 없게 한다.
+  기본값은 host_concurrency + 2 (엔진 밖에서 나가는 인터넷 확인·prefetch 요청 여유분).
+- 세션: requests.Session 은 스레드 안전이 문서화되어 있지 않으므로 스레드마다 따로 만든다.
+  세션은 공용 어댑터(=공용 연결 풀)만 mount 하므로 새 세션이 생겨도 연결은 재사용된다.
+- 통계: 새로 맺은 연결, 재사용한 연결, 풀이 가득 차 버린 연결 수를 호스트별로 센다.
+  keep-alive 가 잘 동작하면 재사용이 대부분이고 버림은 0 이다.
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.poolmanager import PoolManager
+from urllib3.util.retry import Retry
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from core.config import CONNECTION_POOL, HOST_CONCURRENCY, host_key
+
+
+class PoolStats:
+    """호스트별 연결 통계 (스레드 안전)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts = {}
+
+    def count(self, host, name):
+        with self._lock:
+            stat = self._hosts.setdefault(host, {"created": 0, "reused": 0, "discarded": 0})
+            stat[name] += 1
+
+    def snapshot(self):
+        """{"created", "reused", "discarded", "hosts": {host: {...}}}"""
+        with self._lock:
+            hosts = {host: dict(stat) for host, stat in sorted(self._hosts.items())}
+        totals = {
+            name: sum(stat[name] for stat in hosts.values())
+            for name in ("created", "reused", "discarded")
+        }
+        return {**totals, "hosts": hosts}
+
+    def reset(self):
+        with self._lock:
+            self._hosts = {}
+
+
+pool_stats = PoolStats()
+
+
+class _CountingPoolMixin:
+    """연결을 꺼내고 돌려줄 때 새 연결/재사용/버림을 센다."""
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout)
+        # 소켓이 없으면 이번 요청에서 새로 연결한다 (처음 쓰는 자리이거나 끊긴 연결을 닫은 경우)
+        pool_stats.count(self.host, "created" if conn.sock is None else "reused")
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None and self.pool is not None and self.pool.full():
+            pool_stats.count(self.host, "discarded")
+        super()._put_conn(conn)
+
+
+class CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+def pool_size_for(host):
+    """host 에 유지할 연결 수. sizes 에 없으면 host_concurrency 상한 + 2."""
+    url = f"https://{host}/"
+    sizes = CONNECTION_POOL.get("sizes") or {}
+    key = host_key(url, sizes)
+    if key in sizes:
+        return max(1, int(sizes[key]))
+    limit = HOST_CONCURRENCY.get(host_key(url, HOST_CONCURRENCY), HOST_CONCURRENCY.get("default", 4))
+    return max(1, int(limit)) + 2
+
+
+class SizedPoolManager(PoolManager):
+    """호스트마다 pool_size_for(host) 크기의 풀을 만드는 PoolManager."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool_classes_by_scheme = {
+            "http": CountingHTTPConnectionPool,
+            "https": CountingHTTPSConnectionPool,
+        }
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        request_context = dict(request_context if request_context is not None else self.connection_pool_kw)
+        request_context["maxsize"] = pool_size_for(host)
+        return super()._new_pool(scheme, host, port, request_context)
+
+
+class ThrottledRetry(Retry):
+    """재시도(429/5xx, 연결 오류)마다 백오프 대기 뒤 throttle(url) 을 부르는 Retry.
+
+    재시도는 어댑터의 send 안(urllib3)에서 일어나므로 PooledAdapter.throttle 만으로는
+    첫 시도만 속도 제한을 거친다. 재시도할 호스트는 increment 가 받는 연결 풀에서 알아낸다.
+    """
+
+    def __init__(self, *args, throttle=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.throttle = throttle
+        self.retry_url = None
+
+    def new(self, **kwargs):
+        retry = super().new(**kwargs)
+        retry.throttle = self.throttle
+        retry.retry_url = self.retry_url
+        return retry
+
+    def increment(self, method=None, url=None, *args, **kwargs):
+        retry = super().increment(method, url, *args, **kwargs)
+        pool = kwargs.get("_pool")
+        if pool is not None:
+            retry.retry_url = f"{pool.scheme}://{pool.host}{url or '/'}"
+        return retry
+
+    def sleep(self, response=None):
+        super().sleep(response)
+        if self.throttle is not None and self.retry_url:
+            self.throttle(self.retry_url)
+
+
+class PooledAdapter(HTTPAdapter):
+    """SizedPoolManager 를 쓰는 requests 어댑터. 여러 세션이 한 인스턴스를 공유해도 된다.
+
+    throttle(url) 을 주면 요청을 네트워크로 보내기 직전에 부른다 (속도 제한 대기).
+    캐시 어댑터가 네트워크 없이 응답하는 경우에는 부르지 않는다.
+    재시도도 속도 제한을 거치게 하려면 max_retries 에 같은 throttle 을 준 ThrottledRetry 를 쓴다.
+    """
+
+    def __init__(self, throttle=None, **kwargs):
+        self.throttle = throttle
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if self.throttle is not None:
+            self.throttle(request.url)
+        return super().send(request, **kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = SizedPoolManager(
+            num_pools=CONNECTION_POOL.get("max_hosts", 32),
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs,
+        )
+
+
+class SessionFactory:
+    """공용 어댑터를 mount 한 requests.Session 을 스레드마다 하나씩 만들어 준다."""
+
+    def __init__(self, create_adapter):
+        self._create_adapter = create_adapter
+        self._adapter = None
+        self._adapter_lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def adapter(self):
+        if self._adapter is None:
+            with self._adapter_lock:
+                if self._adapter is None:
+                    self._adapter = self._create_adapter()
+        return self._adapter
+
+    def session(self):
+        """현재 스레드의 세션 (처음 호출 시 생성)."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self.adapter)
+            session.mount("https://", self.adapter)
+            self._local.session = session
+        return session
@@ -3,7 +3,8 @@ Hackers영어 '오늘의 한줄 영어명언' 크롤링 스크립트.
 
 저장 폴더(config.json 의 quotes_dir, 기본값=바탕화면)의
 `{YYYY}년 영어 명언 모음.txt` 파일에 최신 명언을 추가.
-파일이 없으면 자동으로 새 파일을 생성.
+명언은 NEWS_DIR/quotes 의 연도별 저장소(core.quote_store)에 기록하고,
+텍스트 파일은 저장소에서 최신 날짜가 위로 오게 다시 만든다 (없으면 새로 생성).
 
 Usage:
     python crawling_english_saying.py
@@ -11,17 +12,14 @@ Usage:
 
 import os
 import re
-from datetime import datetime
-from typing import Optional, Tuple
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
 
-from core.config import QUOTES_DIR
+from core.config import QUOTE_URL, QUOTE_HEADERS
+from core.quote_store import QuoteStore
 
-try:
-    from bs4 import BeautifulSoup  # type: ignore
-except ImportError:
-    BeautifulSoup = None  # type: ignore
 
-import requests
+DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
 
 
 def contains_hangul(text: str) -> bool:
@@ -29,95 +27,160 @@ def contains_hangul(text: str) -> bool:
     return any("\uac00" <= ch <= "\ud7a3" for ch in text)
 
 
-def fetch_latest_quote() -> Optional[Tuple[str, str, str]]:
-    """
-    Fetch the latest quote from the Hackers영어 site.
+def page_lines(soup) -> List[str]:
+    """Flatten a parsed page into its non-empty, stripped text lines."""
+    text = soup.get_text(separator="\n")
+    return [line.strip() for line in text.split("\n") if line.strip()]
 
-    Returns:
-        A tuple of (date, english_quote, korean_quote) if successful,
-        otherwise None.
+
+class QuoteExtractor:
     """
-    url = "https://www.hackers.co.kr/?c=s_eng/eng_contents/B_others_wisesay"
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/115.0 Safari/537.36"
-        ),
-        "Referer": "https://www.hackers.co.kr/",
-    }
-    try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-    except Exception as exc:
-        from core.http_utils import log
-        log(f"  ✗ 사이트 접속 실패: {exc}")
-        return None
+    Incremental date → English → Korean state machine.
 
-    # Extract text from HTML
-    if BeautifulSoup is not None:
-        soup = BeautifulSoup(response.text, "html.parser")
-        page_text = soup.get_text(separator="\n")
-    else:
-        page_text = re.sub(r"<[^>]+>", "\n", response.text)
+    A date line starts a quote; the first following line with five or more
+    words and no Hangul is the English quote, and the first Hangul line of
+    ten or more characters after it is the Korean translation.
 
-    lines = [line.strip() for line in page_text.split("\n") if line.strip()]
+    By default the first date is kept until its triple is complete and later
+    lines are not checked for dates, as the original single-quote scraper
+    did. With ``restart_on_date`` a new date seen before the triple is
+    complete starts over from that date, so a list page with an incomplete
+    entry does not pair one day's date with the next day's quote.
+    """
 
-    date_pattern = re.compile(r"\d{4}-\d{2}-\d{2}")
-    date: Optional[str] = None
-    english_quote: Optional[str] = None
-    korean_quote: Optional[str] = None
+    def __init__(self, restart_on_date: bool = False) -> None:
+        self.restart_on_date = restart_on_date
+        self.date: Optional[str] = None
+        self.english_quote: Optional[str] = None
 
-    for line in lines:
-        if date is None:
-            m = date_pattern.search(line)
+    def feed(self, line: str) -> Optional[Tuple[str, str, str]]:
+        """Feed one stripped text line; return the triple it completes, if any."""
+        if self.date is None or self.restart_on_date:
+            m = DATE_PATTERN.search(line)
             if m:
-                date = m.group(0)
-                continue
-        if date is not None and english_quote is None:
+                self.date, self.english_quote = m.group(0), None
+                return None
+        if self.date is None:
+            return None
+        if self.english_quote is None:
             if not contains_hangul(line) and len(line.split()) >= 5:
-                english_quote = line
-                continue
-        if english_quote is not None and korean_quote is None:
-            if contains_hangul(line) and len(line) >= 10:
-                korean_quote = line
+                self.english_quote = line
+            return None
+        if contains_hangul(line) and len(line) >= 10:
+            quote = (self.date, self.english_quote, line)
+            self.date, self.english_quote = None, None
+            return quote
+        return None
+
+
+def extract_quotes(lines: List[str], limit: Optional[int] = None) -> List[Tuple[str, str, str]]:
+    """
+    Extract (date, english_quote, korean_quote) triples in page order.
+
+    Args:
+        lines: Page text lines (see page_lines).
+        limit: Stop after this many triples (None for all). Only a full
+            extraction (None) restarts on a new date; see QuoteExtractor.
+    """
+    extractor = QuoteExtractor(restart_on_date=limit is None)
+    quotes: List[Tuple[str, str, str]] = []
+    for line in lines:
+        quote = extractor.feed(line)
+        if quote:
+            quotes.append(quote)
+            if limit is not None and len(quotes) >= limit:
                 break
+    return quotes
 
-    if date and english_quote and korean_quote:
-        return date, english_quote, korean_quote
 
-    from core.http_utils import log
-    log("  ✗ 페이지에서 명언 정보를 찾을 수 없습니다.")
-    return None
+class QuoteStreamParser(HTMLParser):
+    """
+    Incremental HTML tokenizer feeding text lines to a QuoteExtractor.
 
+    Text nodes are split into lines the same way page_lines splits
+    ``get_text(separator="\\n")``; script/style contents are skipped.
+    ``feed_text`` returns True once ``limit`` quotes have been found, so
+    the caller can stop reading the response (core.http_utils.fetch_stream).
+    """
+
+    _SKIP_TAGS = {"script", "style"}
+
+    def __init__(self, limit: int = 1) -> None:
+        super().__init__(convert_charrefs=True)
+        self.limit = limit
+        self.quotes: List[Tuple[str, str, str]] = []
+        self._extractor = QuoteExtractor()
+        self._skip_depth = 0
+
+    @property
+    def done(self) -> bool:
+        return len(self.quotes) >= self.limit
+
+    def feed_text(self, text: str) -> bool:
+        """Feed a decoded chunk; return True once enough quotes were found."""
+        if text and not self.done:
+            self.feed(text)
+        return self.done
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in self._SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if self._skip_depth or self.done:
+            return
+        for line in data.split("\n"):
+            line = line.strip()
+            if line:
+                quote = self._extractor.feed(line)
+                if quote:
+                    self.quotes.append(quote)
+                    if self.done:
+                        return
 
-def create_new_file(file_path: str, year: int) -> None:
+
+def fetch_latest_quote() -> Optional[Tuple[str, str, str]]:
     """
-    연초/최초 실행 시 파일이 없을 때 새 파일을 자동 생성.
+    Fetch the latest quote from the Hackers영어 site.
 
-    저장 폴더(config.json 의 quotes_dir)가 없으면 생성한다.
+    The page is streamed through QuoteStreamParser on the shared pooled
+    session (core.http_utils), so reading stops as soon as the first
+    date/English/Korean triple is complete instead of downloading and
+    parsing the whole page.
 
-    Args:
-        file_path: 생성할 파일 경로
-        year: 연도
+    Returns:
+        A tuple of (date, english_quote, korean_quote) if successful,
+        otherwise None.
     """
-    from core.http_utils import log
-    target_dir = os.path.dirname(file_path)
+    from core.http_utils import fetch_stream, log
+
+    parser = QuoteStreamParser()
     try:
-        os.makedirs(target_dir, exist_ok=True)
+        fetch_stream(QUOTE_URL, parser.feed_text, headers=QUOTE_HEADERS)
+        if not parser.done:
+            parser.close()  # flush text still buffered at the end of the page
     except Exception as exc:
-        log(f"  ✗ 저장 폴더를 만들 수 없습니다: {target_dir} ({exc})")
-        return
+        log(f"  ✗ 사이트 접속 실패: {exc}")
+        return None
 
-    header = f"{year}년 영어 명언 모음\n\n"
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write(header)
+    if parser.quotes:
+        return parser.quotes[0]
 
-    log(f"  새 파일 생성: {file_path}")
+    log("  ✗ 페이지에서 명언 정보를 찾을 수 없습니다.")
+    return None
 
 
 def insert_latest_quote() -> bool:
     """
-    Insert the latest fetched quote into the desktop file.
+    Insert the latest fetched quote into the yearly quote store and
+    regenerate the desktop file (newest first).
+
+    The date check is a single index lookup (core.quote_store), so the
+    daily insert does not depend on how large the yearly file has grown.
 
     Returns:
         True if successful, False otherwise.
@@ -127,43 +190,28 @@ def insert_latest_quote() -> bool:
         return False
     date, english_quote, korean_quote = quote_data
 
-    year = datetime.now().year
-    filename = f"{year}년 영어 명언 모음.txt"
-
-    file_path = os.path.join(QUOTES_DIR, filename)
-
     from core.http_utils import log
 
-    # 파일이 없으면 자동 생성
-    if not os.path.isfile(file_path):
-        create_new_file(file_path, year)
-        if not os.path.isfile(file_path):
-            log(f"  ✗ 파일 생성 실패: {file_path}")
-            return False
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    store = QuoteStore(int(date[:4]))
+    try:
+        added = store.add(date, english_quote, korean_quote)
+        created = not os.path.isfile(store.view_path)
+        if added or created:
+            store.render()
+    except (OSError, ValueError) as exc:
+        log(f"  ✗ 명언 저장 실패: {exc}")
+        return False
 
-    if date in content:
+    if created:
+        log(f"  새 파일 생성: {store.view_path}")
+    if added:
+        log(f"  ✓ {date} 명언 추가 완료")
+    else:
         log(f"  ✓ {date} 명언 이미 존재")
-        return True  # 이미 존재하므로 성공으로 처리
-
-    lines = content.splitlines()
-    insert_index = 0
-    for i, line in enumerate(lines):
-        if line.strip() == "":
-            insert_index = i + 1
-            break
-
-    new_entry = [date, english_quote, "", korean_quote, "", ""]
-    new_lines = lines[:insert_index] + new_entry + lines[insert_index:]
-
-    with open(file_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(new_lines))
-
-    log(f"  ✓ {date} 명언 추가 완료")
     return True
 
 
 if __name__ == "__main__":
+    from core.offline import parse_offline_day
+    parse_offline_day("Fetch the latest English quote")
     insert_latest_quote()
@@ -0,0 +1,277 @@
+"""
+상주(daemon) 모드: 프로세스를 띄워 둔 채 정해진 시각마다 크롤링을 실행.
+
+작업 스케줄러로 매번 새 프로세스를 띄우면 실행할 때마다 모듈 import, 세션/연결 풀,
+HTTP 캐시 DB 연결, 요청 엔진, 헤지 지연 추정치를 처음부터 다시 만든다.
+상주 모드는 이것들을 한 프로세스에 유지하고 내부 스케줄러로 실행한다.
+
+- 실행 시각: config.json 의 daemon.times (HH:MM 목록, 하루 여러 번 가능).
+  PC 가 잠들어 있다가 깨어나 시각을 지났으면 바로 한 번 실행한다 (밀린 실행은 한 번만).
+- 실행은 전용 스레드 하나에서만 하므로 겹치지 않는다. 실행이 길어져 다음 시각을 지나면
+  그 시각은 건너뛰고 그 다음 시각을 기다린다.
+- 중복 상주 방지: LOGS_DIR/daemon.lock 파일 잠금 (프로세스가 죽으면 OS 가 풀어 준다).
+- 상태 파일: LOGS_DIR/daemon_status.json 에 상태(idle/running/stopped), 다음 실행 시각,
+  마지막 실행 결과, heartbeat 를 원자적으로 기록한다. 실행 중에도 HEARTBEAT 초마다 갱신하므로,
+  모니터는 heartbeat 가 오래되었으면 멈춘 것으로 본다 (`python daily_runner.py --status`).
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import datetime
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+from core.config import DAEMON, DAEMON_STATUS_PATH, DAEMON_LOCK_PATH
+from core.logging_utils import log
+
+
+HEARTBEAT = 30              # 상태 파일 갱신 간격(초)
+STALE_AFTER = HEARTBEAT * 4  # heartbeat 가 이보다 오래되면 멈춘 것으로 판단
+
+
+def _now():
+    return datetime.datetime.now().replace(microsecond=0)
+
+
+# ─────────────────────────────────────────────
+# 실행 시각
+# ─────────────────────────────────────────────
+
+def parse_times(times):
+    """["07:00", "18:30"] → 정렬된 [(7, 0), (18, 30)]. 잘못된 항목은 ValueError."""
+    parsed = set()
+    for value in times:
+        try:
+            hour, minute = (int(part) for part in str(value).split(":"))
+        except ValueError:
+            raise ValueError(f"실행 시각 형식 오류: {value!r} (HH:MM)") from None
+        if not (0 <= hour < 24 and 0 <= minute < 60):
+            raise ValueError(f"실행 시각 범위 오류: {value!r}")
+        parsed.add((hour, minute))
+    if not parsed:
+        raise ValueError("실행 시각(daemon.times)이 비어 있습니다.")
+    return sorted(parsed)
+
+
+def next_run_time(now, times):
+    """now 이후 첫 실행 시각 (오늘 남은 시각이 없으면 내일 첫 시각)."""
+    for hour, minute in times:
+        candidate = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if candidate > now:
+            return candidate
+    hour, minute = times[0]
+    tomorrow = now + datetime.timedelta(days=1)
+    return tomorrow.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+
+# ─────────────────────────────────────────────
+# 중복 상주 방지 잠금
+# ─────────────────────────────────────────────
+
+def acquire_lock(path=DAEMON_LOCK_PATH):
+    """잠금 파일을 비차단으로 잠근다. 성공하면 열린 파일(보관해야 잠금 유지), 이미 잠겨 있으면 None."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    lock_file = open(path, "a+")
+    try:
+        lock_file.seek(0)
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    return lock_file
+
+
+# ─────────────────────────────────────────────
+# 상태 파일
+# ─────────────────────────────────────────────
+
+class DaemonStatus:
+    """상주 모드 상태. update() 할 때마다 heartbeat 를 찍고 파일 전체를 원자적으로 다시 쓴다."""
+
+    def __init__(self, path=DAEMON_STATUS_PATH, times=()):
+        self.path = path
+        self.state = {
+            "state": "starting",
+            "pid": os.getpid(),
+            "started": _now().isoformat(),
+            "times": list(times),
+            "next_run": None,
+            "run_started": None,
+            "runs": 0,
+            "failures": 0,
+            "last_run": None,
+            "heartbeat": None,
+        }
+
+    def update(self, **fields):
+        self.state.update(fields)
+        self.state["heartbeat"] = _now().isoformat()
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.state, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            log(f"  ⚠ 상주 모드 상태 저장 실패: {e}")
+
+
+def read_status(path=DAEMON_STATUS_PATH):
+    """상태 파일 내용에 "alive"(상주 중이고 heartbeat 가 최근인지) 를 더해 반환. 파일이 없으면 None."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            status = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    lock_file = acquire_lock()
+    if lock_file is not None:
+        # 잠금을 얻었다면 상주 프로세스가 없다
+        lock_file.close()
+        status["alive"] = False
+        return status
+
+    try:
+        heartbeat = datetime.datetime.fromisoformat(status.get("heartbeat") or "")
+        age = (_now() - heartbeat).total_seconds()
+    except ValueError:
+        age = None
+    status["heartbeat_age"] = age
+    status["alive"] = age is not None and age <= STALE_AFTER
+    return status
+
+
+# ─────────────────────────────────────────────
+# 스케줄러
+# ─────────────────────────────────────────────
+
+def _raise_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def run_daemon(job, times=None, run_on_start=None):
+    """정해진 시각마다 job() 을 실행하며 상주. Ctrl+C (또는 SIGTERM) 로 종료.
+
+    Args:
+        job: 1회 실행 함수. 항목별 결과 dict 를 반환 (값에 "실패" 가 있으면 실패로 센다)
+        times: 실행 시각 목록 (기본값 daemon.times)
+        run_on_start: 시작하자마자 한 번 실행할지 (기본값 daemon.run_on_start)
+
+    Returns:
+        int: 종료 코드 (0 정상 종료, 1 이미 상주 중, 2 설정 오류)
+    """
+    try:
+        schedule = parse_times(DAEMON.get("times", []) if times is None else times)
+    except ValueError as e:
+        log(f"  ✗ {e}")
+        return 2
+    if run_on_start is None:
+        run_on_start = bool(DAEMON.get("run_on_start"))
+
+    lock_file = acquire_lock()
+    if lock_file is None:
+        log(f"  ✗ 이미 상주 모드가 실행 중입니다 (잠금: {DAEMON_LOCK_PATH})")
+        return 1
+
+    if hasattr(signal, "SIGTERM"):
+        signal.signal(signal.SIGTERM, _raise_interrupt)
+
+    labels = [f"{hour:02d}:{minute:02d}" for hour, minute in schedule]
+    status = DaemonStatus(times=labels)
+    # 실행 전용 스레드 하나: 실행이 겹치지 않고, 그 스레드의 세션도 실행 사이에 유지된다.
+    runner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="daily-run")
+
+    log(f"상주 모드 시작 (pid {os.getpid()}, 실행 시각 {', '.join(labels)})")
+    log(f"  상태 파일: {DAEMON_STATUS_PATH}")
+    next_run = _now() if run_on_start else next_run_time(_now(), schedule)
+    try:
+        while True:
+            log(f"  다음 실행: {next_run.strftime('%Y-%m-%d %H:%M')}")
+            status.update(state="idle", next_run=next_run.isoformat(), run_started=None)
+            while _now() < next_run:
+                remaining = (next_run - _now()).total_seconds()
+                time.sleep(max(0.0, min(HEARTBEAT, remaining)))
+                status.update()
+
+            started = _now()
+            status.update(state="running", run_started=started.isoformat())
+            future = runner.submit(job)
+            while True:
+                try:
+                    results = future.result(timeout=HEARTBEAT)
+                    break
+                except FutureTimeout:
+                    status.update()
+                except Exception as e:
+                    log(f"  ✗ 실행 중 오류: {e}")
+                    results = {"실행": f"실패: {e}"}
+                    break
+
+            finished = _now()
+            failed = any("실패" in str(value) for value in results.values())
+            status.update(
+                runs=status.state["runs"] + 1,
+                failures=status.state["failures"] + (1 if failed else 0),
+                last_run={
+                    "started": started.isoformat(),
+                    "finished": finished.isoformat(),
+                    "elapsed_seconds": (finished - started).total_seconds(),
+                    "ok": not failed,
+                    "results": results,
+                },
+            )
+            # 실행이 끝난 시점 기준으로 다음 시각을 잡는다 (실행 중 지나간 시각은 건너뜀)
+            next_run = next_run_time(_now(), schedule)
+    except KeyboardInterrupt:
+        log("상주 모드 종료 요청. 진행 중인 실행이 있으면 끝날 때까지 기다립니다.")
+        status.update(state="stopping")
+        runner.shutdown(wait=True)
+    finally:
+        status.update(state="stopped", next_run=None, run_started=None)
+        lock_file.close()
+    log("상주 모드 종료.")
+    return 0
+
+
+def print_status():
+    """상태 파일을 사람이 읽기 좋게 출력. 상주 중이고 heartbeat 가 최근이면 0, 아니면 1."""
+    status = read_status()
+    if status is None:
+        print(f"상주 모드 상태 파일 없음: {DAEMON_STATUS_PATH}")
+        return 1
+
+    if status["alive"]:
+        state = status["state"]
+    elif "heartbeat_age" in status:
+        state = f"응답 없음 (heartbeat {status['heartbeat_age']:.0f}초 전)"
+    elif status["state"] == "stopped":
+        state = "stopped"
+    else:
+        state = "stopped (비정상 종료)"
+    print(f"상태      : {state}")
+    print(f"pid       : {status.get('pid')}")
+    print(f"시작      : {status.get('started')}")
+    print(f"실행 시각 : {', '.join(status.get('times') or [])}")
+    print(f"다음 실행 : {status.get('next_run') or '-'}")
+    if status.get("run_started"):
+        print(f"현재 실행 : {status['run_started']} 시작")
+    print(f"실행 횟수 : {status.get('runs', 0)} (실패 {status.get('failures', 0)})")
+    last_run = status.get("last_run")
+    if last_run:
+        print(f"마지막 실행: {last_run['started']} ~ {last_run['finished']}"
+              f" ({last_run['elapsed_seconds']:.0f}초, {'성공' if last_run['ok'] else '일부 실패'})")
+        for key, value in last_run["results"].items():
+            print(f"  {'✓' if '실패' not in str(value) else '✗'} {key}: {value}")
+    print(f"heartbeat : {status.get('heartbeat')}")
+    return 0 if status["alive"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(print_status())
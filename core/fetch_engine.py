@@ -0,0 +1,296 @@
+"""
+asyncio 기반 동시 요청 엔진.
+
+크롤러가 여러 URL 을 한꺼번에 제출하면 백그라운드 이벤트 루프가
+호스트별 동시 요청 상한(config.json 의 host_concurrency)과 전체 상한(max_in_flight)을
+지키면서 요청을 동시에 진행하고, 완료되는 순서대로 결과를 돌려준다.
+
+- 실제 요청은 기존 동기 함수(fetch_soup 등)를 워커 스레드에서 실행한다.
+  → requests 세션/재시도 로직을 그대로 재사용하고, 동기 호출부는 바뀌지 않는다.
+- 이벤트 루프는 프로세스당 하나(전용 데몬 스레드)만 띄워 모든 크롤러 스레드가 공유한다.
+  → 호스트별 상한이 크롤러 구분 없이 전역으로 적용된다.
+- 모든 크롤러의 작업이 하나의 우선순위 대기열을 거친다. 호스트 자리와 전체 자리(max_in_flight)가
+  비면 (우선순위, 제출 순서) 가 가장 앞선 작업부터 실행하므로, 목록 페이지처럼 다음 작업을 만들어 내는
+  요청이 이미 쌓인 상세 요청보다 먼저 나가고, 먼저 끝난 크롤러의 자리는 남은 크롤러 작업이 바로 쓴다.
+"""
+
+import time
+import heapq
+import asyncio
+import itertools
+import functools
+import contextlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from core.config import MAX_IN_FLIGHT, HOST_CONCURRENCY, host_key
+from core.metrics import metrics
+
+
+# 작업 우선순위 (작을수록 먼저)
+PRIORITY_LIST = 0          # 목록 페이지 (섹션/서브섹션/사설 목록): 결과가 다음 작업을 만든다
+PRIORITY_DETAIL = 1        # 기사 상세
+PRIORITY_BACKGROUND = 2    # 당장 필요하지 않은 작업
+
+_PRIORITY_NAMES = {
+    PRIORITY_LIST: "list",
+    PRIORITY_DETAIL: "detail",
+    PRIORITY_BACKGROUND: "background",
+}
+
+
+class PrioritySemaphore:
+    """대기 중인 작업을 (우선순위, 제출 순서) 순으로 깨우는 asyncio 세마포어.
+
+    이벤트 루프 스레드에서만 사용한다.
+    """
+
+    def __init__(self, value):
+        self._value = value
+        self._waiters = []      # heap of ((우선순위, 제출 순서, 제출 시각), future)
+
+    async def acquire(self, order):
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (order, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 자리를 넘겨받은 직후 취소되면 다음 대기자에게 돌려준다
+                self.release()
+            raise
+
+    def release(self):
+        while self._waiters:
+            _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._value += 1
+
+    def waiting(self):
+        return sum(1 for _, future in self._waiters if not future.done())
+
+
+_task = threading.local()    # 엔진 작업을 실행 중인 워커 스레드의 hold_host_slot 목록
+
+
+def _run_holding(call, holds):
+    _task.holds = holds
+    try:
+        return call()
+    finally:
+        _task.holds = None
+
+
+async def _release_after(semaphore, futures):
+    for future in futures:
+        try:
+            await asyncio.wrap_future(future)
+        except BaseException:
+            pass
+    semaphore.release()
+
+
+def hold_host_slot(future):
+    """현재 엔진 작업의 호스트 자리를 future(concurrent.futures.Future) 가 끝날 때까지 유지한다.
+
+    작업이 결과를 먼저 돌려주고도 같은 호스트로 보낸 요청이 아직 진행 중일 때 부른다
+    (헤지 요청에서 진 주 요청 등). 결과는 바로 전달되고, 자리는 그 요청이 끝난 뒤 풀린다.
+    엔진 작업 밖에서 부르면 아무 일도 하지 않고 False.
+    """
+    holds = getattr(_task, "holds", None)
+    if holds is None:
+        return False
+    holds.append(future)
+    return True
+
+
+class FetchEngine:
+    """호스트별 동시 요청 상한을 지키는 asyncio 요청 엔진."""
+
+    def __init__(self, max_in_flight=MAX_IN_FLIGHT, host_limits=None):
+        self.max_in_flight = max_in_flight
+        self.host_limits = dict(host_limits if host_limits is not None else HOST_CONCURRENCY)
+        self._loop = None
+        self._executor = None
+        self._host_semaphores = {}
+        self._slots = None
+        self._sequence = itertools.count()
+        self._start_lock = threading.Lock()
+
+    # ── 이벤트 루프 관리 ──
+
+    def _ensure_started(self):
+        """최초 사용 시 이벤트 루프 스레드와 워커 스레드 풀을 띄운다."""
+        if self._loop is not None:
+            return self._loop
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_in_flight, thread_name_prefix="fetch",
+                )
+                loop.set_default_executor(self._executor)
+                self._slots = PrioritySemaphore(self.max_in_flight)
+                thread = threading.Thread(
+                    target=loop.run_forever, name="fetch-engine", daemon=True,
+                )
+                thread.start()
+                self._loop = loop
+        return self._loop
+
+    def shutdown(self):
+        """이벤트 루프와 워커 스레드를 정리. 다시 사용하면 새로 띄운다."""
+        with self._start_lock:
+            loop, self._loop = self._loop, None
+            executor, self._executor = self._executor, None
+            self._host_semaphores = {}
+            self._slots = None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _host_semaphore(self, url):
+        """URL 호스트에 해당하는 세마포어. 이벤트 루프 스레드에서만 호출된다."""
+        key = host_key(url, self.host_limits)
+        semaphore = self._host_semaphores.get(key)
+        if semaphore is None:
+            limit = self.host_limits.get(key, self.host_limits.get("default", 4))
+            semaphore = PrioritySemaphore(max(1, int(limit)))
+            self._host_semaphores[key] = semaphore
+        return semaphore
+
+    async def _run_on_host(self, url, call, order):
+        host = self._host_semaphore(url)
+        await host.acquire(order)
+        holds = []
+        try:
+            await self._slots.acquire(order)
+            try:
+                metrics.record_stage(
+                    "queue", _PRIORITY_NAMES.get(order[0], str(order[0])),
+                    time.perf_counter() - order[2],
+                )
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(None, functools.partial(_run_holding, call, holds))
+            finally:
+                self._slots.release()
+        finally:
+            pending = [future for future in holds if not future.done()]
+            if pending:
+                # 작업이 남겨 둔 요청(hold_host_slot)이 끝날 때까지 호스트 자리를 유지한다
+                asyncio.ensure_future(_release_after(host, pending))
+            else:
+                host.release()
+
+    @contextlib.contextmanager
+    def host_slot(self, url, priority=PRIORITY_DETAIL):
+        """엔진 밖 스레드에서 보내는 요청이 url 호스트의 동시 요청 상한 자리를 함께 쓰도록 잡는다.
+
+        호스트 자리만 잡고 전체 자리(max_in_flight)와 워커 스레드는 쓰지 않으므로, 다른 호스트의
+        엔진 작업 안에서 불러도 서로 기다리며 멈추지 않는다 (헤지 요청 등).
+        같은 호스트의 엔진 작업 안에서 부르면 안 된다 (자기 자리를 기다리게 됨).
+        """
+        loop = self._ensure_started()
+        order = (priority, next(self._sequence), time.perf_counter())
+
+        async def acquire():
+            semaphore = self._host_semaphore(url)
+            await semaphore.acquire(order)
+            return semaphore
+
+        semaphore = asyncio.run_coroutine_threadsafe(acquire(), loop).result()
+        try:
+            yield
+        finally:
+            loop.call_soon_threadsafe(semaphore.release)
+
+    async def _run(self, url, call, batch_semaphore, order):
+        if batch_semaphore is None:
+            return await self._run_on_host(url, call, order)
+        async with batch_semaphore:
+            return await self._run_on_host(url, call, order)
+
+    def _submit(self, url, call, batch_semaphore=None, priority=PRIORITY_DETAIL):
+        loop = self._ensure_started()
+        # (우선순위, 제출 순서, 제출 시각) — 같은 우선순위는 먼저 제출한 작업부터
+        order = (priority, next(self._sequence), time.perf_counter())
+        return asyncio.run_coroutine_threadsafe(self._run(url, call, batch_semaphore, order), loop)
+
+    # ── 제출 API (동기 호출부용) ──
+
+    def submit(self, url, func, *args, priority=PRIORITY_DETAIL, **kwargs):
+        """func(*args, **kwargs) 를 url 호스트의 상한 안에서 실행하도록 제출.
+
+        priority 가 작은 작업부터 자리를 받는다 (PRIORITY_LIST / PRIORITY_DETAIL / PRIORITY_BACKGROUND).
+
+        Returns:
+            concurrent.futures.Future (result() 로 동기 대기 가능)
+        """
+        return self._submit(url, functools.partial(func, *args, **kwargs), priority=priority)
+
+    def batch_limit(self, limit):
+        """여러 번에 나눠 제출하는 작업들이 함께 쓰는 동시 실행 상한. limit 가 없으면 None."""
+        return asyncio.Semaphore(limit) if limit else None
+
+    def submit_in_batch(self, batch_limit, url, func, *args, priority=PRIORITY_DETAIL, **kwargs):
+        """submit 과 같되, batch_limit(batch_limit() 결과)을 공유하는 작업끼리 동시 실행 수를 제한."""
+        return self._submit(url, functools.partial(func, *args, **kwargs), batch_limit, priority)
+
+    def _submit_batch(self, func, items, url_of, limit, priority):
+        """items 를 제출하고 제출 순서대로 Future 목록을 반환. limit 는 이 묶음의 동시 실행 상한."""
+        url_of = url_of or (lambda item: item)
+        batch_semaphore = self.batch_limit(limit)
+        return [
+            self._submit(url_of(item), functools.partial(func, item), batch_semaphore, priority)
+            for item in items
+        ]
+
+    def map_as_completed(self, func, items, url_of=None, limit=None, priority=PRIORITY_DETAIL):
+        """items 각각에 func(item) 을 동시에 실행하고 완료되는 순서대로 결과를 yield.
+
+        Args:
+            func: item 하나를 받아 요청/파싱하는 동기 함수
+            items: 처리할 항목 목록 (기본적으로 항목 자체가 URL)
+            url_of: 항목에서 호스트 판별용 URL 을 꺼내는 함수 (기본: 항목 자체)
+            limit: 이 묶음의 동시 실행 상한 (None 이면 호스트/전체 상한만 적용)
+            priority: 작업 우선순위 (기본: PRIORITY_DETAIL)
+
+        Yields:
+            (item, result, error) — 실패 시 result 는 None, error 는 예외 객체
+        """
+        items = list(items)
+        futures = dict(zip(self._submit_batch(func, items, url_of, limit, priority), items))
+        for future in as_completed(futures):
+            item = futures[future]
+            try:
+                yield item, future.result(), None
+            except Exception as e:
+                yield item, None, e
+
+    def map_ordered(self, func, items, url_of=None, limit=None, priority=PRIORITY_DETAIL):
+        """map_as_completed 와 같이 동시에 실행하되, 결과를 items 순서대로 담은 리스트로 반환.
+
+        예외를 던진 작업이 있으면 items 순서상 첫 번째 예외를 다시 던진다.
+        """
+        futures = self._submit_batch(func, list(items), url_of, limit, priority)
+        return [future.result() for future in futures]
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """프로세스 공용 FetchEngine (최초 호출 시 생성)."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = FetchEngine()
+    return _engine
@@ -0,0 +1,79 @@
+"""
+여러 프로세스가 함께 쓰는 파일용 잠금 / 원자적 쓰기.
+
+매일 실행, 백필, 오프라인 재추출처럼 같은 파일(명언 저장소, 이전 수집 URL 색인 등)을
+여러 프로세스가 동시에 고칠 수 있다. 고치는 쪽은 파일마다 잠금 파일을 잡고, 잠금 안에서
+파일을 다시 읽은 뒤 합쳐서 write_atomic 으로 바꿔 끼운다.
+
+    with locked(path + ".lock"):
+        data = read(path)
+        ...
+        write_atomic(path, new_data)
+"""
+
+import os
+import tempfile
+import contextlib
+
+
+def acquire(path):
+    """잠금 파일을 배타적으로 잠근다. 다른 프로세스가 잡고 있으면 풀릴 때까지 기다린다. 열린 파일을 반환."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    lock_file = open(path, "a+")
+    try:
+        lock_file.seek(0)
+        if os.name == "nt":
+            import msvcrt
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue    # LK_LOCK 은 10초 동안 재시도한 뒤 실패한다 → 계속 기다림
+        else:
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+    except BaseException:
+        lock_file.close()
+        raise
+    return lock_file
+
+
+def release(lock_file):
+    """acquire 로 잡은 잠금을 풀고 파일을 닫는다."""
+    try:
+        if os.name == "nt":
+            import msvcrt
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+    finally:
+        lock_file.close()
+
+
+@contextlib.contextmanager
+def locked(path):
+    """with 블록 동안 잠금 파일 path 를 잡는다."""
+    lock_file = acquire(path)
+    try:
+        yield
+    finally:
+        release(lock_file)
+
+
+def write_atomic(path, data):
+    """임시 파일에 쓰고 디스크에 내린 뒤 바꿔 끼운다. 실패하면 임시 파일을 지운다.
+
+    임시 파일 이름은 쓸 때마다 새로 만든다 (다른 프로세스/스레드의 임시 파일과 겹치지 않게).
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{os.path.basename(path)}.", suffix=".tmp", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,173 @@
+"""
+헤지(hedged) 요청: 주 요청이 늦으면 대체 요청을 동시에 보내 먼저 쓸 만한 응답을 채택.
+
+영문 주식 뉴스의 외부 소스(Yahoo, PR Newswire 등)는 finviz 에 같은 기사의 사본이 있는 경우가 많다.
+외부 소스가 소스별 지연 백분위(기본 p90)보다 늦게 응답하면 finviz 사본을 병렬로 요청하고,
+먼저 본문을 돌려준 쪽을 쓴다. 진 쪽은 아직 시작 전이면 취소하고, 이미 진행 중이면 결과를 버린다.
+
+소스별 지연 시간과 승리 횟수를 기록해 대기 임계값을 실행 중에 맞춰 간다.
+(표본이 min_samples 개 미만이면 initial_delay 를 쓴다.)
+
+헤지 요청은 요청 엔진의 호스트 자리(FetchEngine.host_slot)를 잡고 보내므로 finviz.com 의
+동시 요청 상한(host_concurrency)을 넘지 않는다. 주 요청은 호출한 엔진 작업이 이미 잡은
+그 호스트 자리 안에서 실행되고, 헤지가 이겨 먼저 돌아가도 주 요청이 끝날 때까지 자리를
+유지한다 (hold_host_slot). 대기 임계값은 주 요청이 실제로 시작된 때부터 잰다.
+"""
+
+import time
+import functools
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from core.config import HEDGE
+from core.fetch_engine import get_engine, hold_host_slot
+
+
+class LatencyTracker:
+    """소스별 지연 시간 표본과 헤지 승리 횟수를 기록."""
+
+    def __init__(self, percentile, min_samples, initial_delay, max_delay, window=200):
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples = {}
+        self._wins = {}
+
+    def record(self, source, seconds):
+        with self._lock:
+            self._samples.setdefault(source, deque(maxlen=self.window)).append(seconds)
+
+    def record_win(self, source, winner):
+        """source 요청에서 winner("primary" / "hedge")가 채택된 횟수를 센다."""
+        with self._lock:
+            wins = self._wins.setdefault(source, {"primary": 0, "hedge": 0})
+            wins[winner] += 1
+
+    def threshold(self, source):
+        """source 의 대기 임계값(초): 지연 백분위, 표본이 적으면 initial_delay."""
+        with self._lock:
+            samples = sorted(self._samples.get(source, ()))
+        if len(samples) < self.min_samples:
+            return self.initial_delay
+        index = min(len(samples) - 1, int(len(samples) * self.percentile / 100))
+        return min(samples[index], self.max_delay)
+
+    def stats(self):
+        """{source: {"requests", "p50", "p90", "primary", "hedge"}}"""
+        with self._lock:
+            sources = set(self._samples) | set(self._wins)
+            result = {}
+            for source in sorted(sources):
+                samples = sorted(self._samples.get(source, ()))
+                wins = self._wins.get(source, {"primary": 0, "hedge": 0})
+                result[source] = {
+                    "requests": len(samples),
+                    "p50": samples[len(samples) // 2] if samples else None,
+                    "p90": samples[min(len(samples) - 1, int(len(samples) * 0.9))] if samples else None,
+                    "primary": wins["primary"],
+                    "hedge": wins["hedge"],
+                }
+            return result
+
+
+tracker = LatencyTracker(
+    percentile=HEDGE.get("percentile", 90),
+    min_samples=HEDGE.get("min_samples", 10),
+    initial_delay=HEDGE.get("initial_delay", 2.0),
+    max_delay=HEDGE.get("max_delay", 8.0),
+)
+
+# 헤지 요청 전용 스레드 풀. 요청 엔진 워커 안에서 호출되므로 엔진 풀과 분리해
+# 워커가 자기 풀의 빈 자리를 기다리며 멈추는 일이 없게 한다.
+_executor = ThreadPoolExecutor(max_workers=HEDGE.get("workers", 16), thread_name_prefix="hedge")
+
+
+def _timed(source, func):
+    start = time.monotonic()
+    try:
+        return func()
+    finally:
+        tracker.record(source, time.monotonic() - start)
+
+
+def _in_host_slot(url, func, decided=None):
+    """url 호스트의 엔진 자리를 잡고 func() 실행. 자리를 기다리는 동안 승부가 났으면 요청하지 않는다."""
+    with get_engine().host_slot(url):
+        if decided is not None and decided.is_set():
+            return None
+        return func()
+
+
+def hedged_call(primary, hedge, source, hedge_source, usable, hedge_url):
+    """
+    primary() 를 실행하고, threshold(source) 안에 쓸 만한 결과가 없으면 hedge() 를 병렬로 실행.
+
+    Args:
+        primary, hedge: 인자 없는 동기 함수 (요청 + 파싱)
+        source, hedge_source: 지연 시간을 기록할 소스 이름 (예: 도메인)
+        usable: 결과가 채택할 만한지 판단하는 함수
+        hedge_url: hedge() 가 요청하는 URL (그 호스트의 동시 요청 상한 자리를 잡는다)
+
+    Returns:
+        (winner, result, other) — winner 는 "primary" / "hedge",
+        other 는 진 쪽의 결과 (끝나지 않았거나 실행하지 않았으면 None)
+    """
+    decided = threading.Event()
+    # 지연 시간은 호스트 자리를 잡은 뒤부터 잰다 (자리 대기는 소스 지연이 아님)
+    hedge = functools.partial(_in_host_slot, hedge_url, functools.partial(_timed, hedge_source, hedge), decided)
+    started = threading.Event()
+
+    def run_primary():
+        started.set()
+        return _timed(source, primary)
+
+    primary_future = _executor.submit(run_primary)
+    # 헤지 스레드 풀의 빈 자리를 기다린 시간은 소스 지연이 아니므로 시작된 뒤부터 잰다
+    while not started.wait(0.05):
+        if primary_future.done():
+            break
+    done, _ = wait([primary_future], timeout=tracker.threshold(source))
+
+    if done:
+        result = _result_or_none(primary_future)
+        if usable(result):
+            tracker.record_win(source, "primary")
+            return "primary", result, None
+        # 주 요청이 빨리 끝났지만 쓸 수 없는 결과 → 대체 요청을 순차로
+        other = hedge()
+        tracker.record_win(source, "hedge")
+        return "hedge", other, result
+
+    hedge_future = _executor.submit(hedge)
+    pending = {primary_future: "primary", hedge_future: "hedge"}
+    finished = {}
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            name = pending.pop(future)
+            finished[name] = _result_or_none(future)
+            if usable(finished[name]):
+                decided.set()
+                for loser in pending:
+                    loser.cancel()
+                if not primary_future.done():
+                    # 진 주 요청이 끝날 때까지 그 호스트의 엔진 자리를 풀지 않는다
+                    hold_host_slot(primary_future)
+                tracker.record_win(source, name)
+                other = "hedge" if name == "primary" else "primary"
+                return name, finished[name], finished.get(other)
+
+    # 둘 다 쓸 수 없는 결과
+    tracker.record_win(source, "hedge")
+    return "hedge", finished.get("hedge"), finished.get("primary")
+
+
+def _result_or_none(future):
+    try:
+        return future.result()
+    except Exception:
+        return None
@@ -0,0 +1,279 @@
+"""
+디스크 HTTP 캐시 (조건부 GET: ETag / Last-Modified).
+
+같은 날 재실행(크래시 후 재시도 등) 시 섹션 페이지·사설·기사 상세를 처음부터 다시
+받지 않도록, 응답 본문과 검증자(ETag, Last-Modified)를 NEWS_DIR 아래 SQLite 파일에 저장한다.
+
+- CachingAdapter 를 requests 세션에 mount 하면 fetch_soup/fetch_text 호출부는 그대로 캐시를 쓴다.
+- 저장된 검증자가 있으면 If-None-Match / If-Modified-Since 를 붙여 재검증하고,
+  304 응답이면 저장된 본문으로 응답을 만든다.
+- 바뀌지 않는 기사 페이지(네이버 n.news.naver.com 기사, finviz /news/ 페이지)는
+  ttl_rules 에 지정한 시간(초) 동안 네트워크 없이 캐시에서 바로 응답한다.
+- 전체 크기가 max_mb 를 넘으면 가장 오래 사용하지 않은 항목부터 지운다(LRU).
+  조회는 읽기만 하고, 사용 시각은 모아 두었다가 저장할 때나 일정 수가 쌓이면 한 번에 기록한다.
+- 적중/재검증/미스/절약 바이트 수를 세어 실행 결과 요약에 보고한다.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from core.config import HTTP_CACHE, HTTP_CACHE_PATH
+from core.connection_pool import PooledAdapter
+
+
+# 본문을 디코딩해 저장하므로 전송 관련 헤더는 저장하지 않는다.
+_SKIP_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "connection"}
+
+# 조회 때 모아 둔 사용 시각을 이만큼 쌓이면 한 번에 기록한다 (LRU 정리 순서에만 쓰이므로 근사치면 충분)
+_TOUCH_BATCH = 64
+
+
+class HttpCache:
+    """SQLite 기반 HTTP 응답 저장소 (크기 제한 LRU)."""
+
+    def __init__(self, path, max_bytes, default_ttl=0, ttl_rules=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttl_rules = dict(ttl_rules or {})
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "revalidated": 0, "misses": 0, "bytes_saved": 0}
+        self._touched = {}      # url → 아직 기록하지 않은 사용 시각
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " url TEXT PRIMARY KEY,"
+            " headers TEXT NOT NULL,"
+            " body BLOB NOT NULL,"
+            " etag TEXT,"
+            " last_modified TEXT,"
+            " stored_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL,"
+            " size INTEGER NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed_at)"
+        )
+        self._conn.commit()
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        self._total_bytes = row[0]
+
+    # ── 조회 / 저장 ──
+
+    def ttl_for(self, url):
+        """url 에 적용할 신선도 유지 시간(초). ttl_rules 의 부분 문자열 규칙을 따른다."""
+        for pattern, ttl in self.ttl_rules.items():
+            if pattern in url:
+                return ttl
+        return self.default_ttl
+
+    def get(self, url):
+        """저장된 항목 dict 또는 None. LRU 사용 시각은 모아 두었다가 한 번에 기록한다 (_flush_touched_locked)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT headers, body, etag, last_modified, stored_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._touched[url] = time.time()
+            if len(self._touched) >= _TOUCH_BATCH:
+                self._flush_touched_locked()
+                self._conn.commit()
+        headers, body, etag, last_modified, stored_at = row
+        return {
+            "headers": json.loads(headers),
+            "body": body,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": stored_at,
+        }
+
+    def put(self, url, headers, body):
+        """응답을 저장하고 필요하면 LRU 정리. 한 항목이 한도를 넘으면 저장하지 않는다."""
+        size = len(body)
+        if size > self.max_bytes:
+            return
+        headers = CaseInsensitiveDict(headers)
+        kept = {k: v for k, v in headers.items() if k.lower() not in _SKIP_HEADERS}
+        now = time.time()
+        with self._lock:
+            self._touched.pop(url, None)
+            self._flush_touched_locked()
+            old = self._conn.execute(
+                "SELECT size FROM responses WHERE url = ?", (url,),
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (url, headers, body, etag, last_modified, stored_at, accessed_at, size)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, json.dumps(kept), sqlite3.Binary(body),
+                 headers.get("ETag"), headers.get("Last-Modified"),
+                 now, now, size),
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict_locked()
+            self._conn.commit()
+
+    def refresh(self, url):
+        """304 재검증 성공 시 저장 시각을 갱신 (TTL 을 다시 시작)."""
+        with self._lock:
+            now = time.time()
+            self._touched.pop(url, None)
+            self._flush_touched_locked()
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, url),
+            )
+            self._conn.commit()
+
+    def _flush_touched_locked(self):
+        """모아 둔 사용 시각을 기록 (커밋은 호출한 쪽에서)."""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE responses SET accessed_at = ? WHERE url = ?",
+                [(accessed, url) for url, accessed in self._touched.items()],
+            )
+            self._touched = {}
+
+    def _evict_locked(self):
+        """가장 오래 사용하지 않은 항목부터 지워 한도의 90% 이하로 줄인다."""
+        target = self.max_bytes * 0.9
+        rows = self._conn.execute(
+            "SELECT url, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        victims = []
+        for url, size in rows:
+            if self._total_bytes <= target:
+                break
+            victims.append((url,))
+            self._total_bytes -= size
+        self._conn.executemany("DELETE FROM responses WHERE url = ?", victims)
+
+    # ── 통계 ──
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self._counters[name] += amount
+
+    def reset_counters(self):
+        with self._lock:
+            self._counters = {"hits": 0, "revalidated": 0, "misses": 0, "bytes_saved": 0}
+
+    def stats(self):
+        """{"hits", "revalidated", "misses", "bytes_saved"} 사본."""
+        with self._lock:
+            return dict(self._counters)
+
+
+class CachingAdapter(PooledAdapter):
+    """HttpCache 를 투명하게 적용하는 requests 어댑터 (GET 만 캐시).
+
+    신선한 항목은 네트워크로 보내지 않으므로 속도 제한(throttle)도 거치지 않는다.
+    """
+
+    def __init__(self, cache, **kwargs):
+        self.cache = cache
+        super().__init__(**kwargs)
+
+    def send(self, request, stream=False, **kwargs):
+        if request.method != "GET" or stream:
+            return super().send(request, stream=stream, **kwargs)
+
+        url = request.url
+        try:
+            entry = self.cache.get(url)
+        except sqlite3.Error:
+            entry = None
+        ttl = self.cache.ttl_for(url)
+
+        if entry is not None:
+            # 신선한 항목: 네트워크 없이 바로 응답
+            if ttl > 0 and time.time() - entry["stored_at"] < ttl:
+                self.cache.count("hits")
+                self.cache.count("bytes_saved", len(entry["body"]))
+                return self._cached_response(request, entry)
+            # 검증자가 있으면 조건부 GET
+            request = request.copy()
+            if entry["etag"]:
+                request.headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                request.headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            response.close()
+            self.cache.refresh(url)
+            self.cache.count("revalidated")
+            self.cache.count("bytes_saved", len(entry["body"]))
+            return self._cached_response(request, entry)
+
+        self.cache.count("misses")
+        if response.status_code == 200:
+            has_validator = "ETag" in response.headers or "Last-Modified" in response.headers
+            if has_validator or ttl > 0:
+                try:
+                    self.cache.put(url, response.headers, response.content)
+                except sqlite3.Error:
+                    pass
+        return response
+
+    def _cached_response(self, request, entry):
+        """저장된 항목으로 200 응답 객체를 만든다."""
+        response = Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = entry["body"]
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache():
+    """프로세스 공용 HttpCache. 비활성화되었거나 열 수 없으면 None."""
+    global _cache
+    if _cache is None and HTTP_CACHE.get("enabled"):
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = HttpCache(
+                        HTTP_CACHE_PATH,
+                        max_bytes=int(HTTP_CACHE.get("max_mb", 200) * 1024 * 1024),
+                        default_ttl=HTTP_CACHE.get("default_ttl", 0),
+                        ttl_rules=HTTP_CACHE.get("ttl_rules"),
+                    )
+                except (OSError, sqlite3.Error):
+                    # 캐시를 못 열어도 크롤링은 계속 (캐시 없이 동작)
+                    return None
+    return _cache
+
+
+def cache_stats():
+    """실행 결과 요약용 캐시 통계. 캐시를 쓰지 않으면 None."""
+    return _cache.stats() if _cache is not None else None
+
+
+def reset_cache_stats():
+    """캐시 통계를 0 으로 (상주 모드에서 실행마다 따로 집계)."""
+    if _cache is not None:
+        _cache.reset_counters()
@@ -1,142 +1,500 @@
 """
 공통 HTTP 유틸리티 모듈
-모든 크롤링 스크립트에서 공유하는 requests + BeautifulSoup 래퍼 및 로깅.
+모든 크롤링 스크립트에서 공유하는 requests + BeautifulSoup 래퍼 및 로깅(core.logging_utils 재노출).
+HTML 파서는 lxml / selectolax 가 설치되어 있으면 자동으로 사용한다 (없으면 html.parser).
+BeautifulSoup / selectolax 는 첫 파싱 때 불러온다 (첫 요청 전 시작 시간을 줄이기 위해).
 Selenium/ChromeDriver 없이 동작.
 """
 
-import sys
+import re
 import time
-import logging
+import codecs
+import functools
+import importlib.util
+import threading
 import requests
-from urllib3.util.retry import Retry
-from requests.adapters import HTTPAdapter
-from bs4 import BeautifulSoup
+from concurrent.futures import wait, FIRST_COMPLETED
+from urllib.parse import urlsplit
 
 from core.config import (
     HEADERS, FINVIZ_HEADERS,
     DEFAULT_TIMEOUT, RETRY_COUNT, RETRY_BACKOFF,
-    INTERNET_CHECK_URL, INTERNET_CHECK_TIMEOUT,
-    ARTICLE_DETAIL_DELAY,
+    INTERNET_PROBES,
+    DETAIL_CONCURRENCY, HTML_PARSER,
 )
+from core.fetch_engine import get_engine, PRIORITY_LIST, PRIORITY_DETAIL
+from core.rate_limit import get_rate_limiter
+from core.http_cache import CachingAdapter, get_http_cache
+from core.connection_pool import PooledAdapter, SessionFactory, ThrottledRetry
+from core.article_memo import article_memo
+from core.metrics import metrics
+from core.seen_index import seen_index
+from core.snapshots import get_snapshot_store
+from core.logging_utils import log, setup_file_logging  # 크롤러용 재노출
 
 
 # ─────────────────────────────────────────────
-# 로깅 설정
+# HTTP 세션 (재시도 로직 내장)
+#   연결 풀은 모든 스레드가 공유하고, requests.Session 은 스레드마다 따로 쓴다
+#   (core.connection_pool 참고).
 # ─────────────────────────────────────────────
 
-logger = logging.getLogger("news_crawling")
-logger.setLevel(logging.DEBUG)
+def _create_adapter():
+    """재시도 로직이 적용된 공용 어댑터 생성.
 
-# 콘솔 핸들러
-_console_handler = logging.StreamHandler(sys.stdout)
-_console_handler.setLevel(logging.INFO)
-_console_formatter = logging.Formatter("%(message)s")
-_console_handler.setFormatter(_console_formatter)
-logger.addHandler(_console_handler)
+    디스크 HTTP 캐시가 켜져 있으면 캐시 어댑터를 써서 모든 GET 에 투명하게 적용한다.
+    속도 제한은 어댑터가 실제로 네트워크에 요청할 때만 기다린다 (신선한 캐시 적중은 토큰을 쓰지 않음).
+    429/5xx 재시도도 시도마다 토큰을 쓴다 (ThrottledRetry).
+    """
+    retry = ThrottledRetry(
+        total=RETRY_COUNT,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"],
+        throttle=_wait_rate_limit,
+    )
+    cache = get_http_cache()
+    if cache is not None:
+        return CachingAdapter(cache, throttle=_wait_rate_limit, max_retries=retry)
+    return PooledAdapter(throttle=_wait_rate_limit, max_retries=retry)
 
-# 파일 핸들러는 setup_file_logging()에서 동적으로 추가
-_file_handler = None
 
+_sessions = SessionFactory(_create_adapter)
+_offline_day = None   # use_snapshots 로 지정한 스냅샷 날짜 (None 이면 네트워크)
 
-def setup_file_logging(log_path):
-    """로그 파일 핸들러를 설정. 즉시 기록(flush)."""
-    global _file_handler
-    if _file_handler is not None:
-        logger.removeHandler(_file_handler)
-    _file_handler = logging.FileHandler(log_path, encoding="utf-8")
-    _file_handler.setLevel(logging.DEBUG)
-    _file_formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
-    _file_handler.setFormatter(_file_formatter)
-    logger.addHandler(_file_handler)
 
+def get_session():
+    """현재 스레드의 requests.Session (공용 연결 풀 사용)."""
+    return _sessions.session()
 
-def log(msg=""):
-    """콘솔 + 파일에 동시 기록. 기존 인터페이스 호환."""
-    if msg:
-        logger.info(msg)
-    else:
-        logger.info("")
 
+def use_snapshots(day):
+    """이후 모든 요청을 day(YYYY-MM-DD) 의 원본 HTML 스냅샷(core.snapshots)으로 응답한다.
 
-# ─────────────────────────────────────────────
-# HTTP 세션 (재시도 로직 내장)
-# ─────────────────────────────────────────────
+    오프라인 재추출용. 네트워크, HTTP 캐시, 속도 제한을 쓰지 않고 스냅샷도 다시 기록하지 않는다.
+    요청하기 전에(프로세스 시작 직후) 부른다.
+    """
+    global _sessions, _offline_day
+    from core.snapshots import SnapshotAdapter
+    adapter = SnapshotAdapter(day)
+    _offline_day = day
+    _sessions = SessionFactory(lambda: adapter)
 
-def _create_session():
-    """재시도 로직이 적용된 requests.Session 생성."""
-    session = requests.Session()
-    retry = Retry(
-        total=RETRY_COUNT,
-        backoff_factor=RETRY_BACKOFF,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["GET", "HEAD"],
+
+def _retry_count(response):
+    """urllib3 가 이 응답을 받기까지 재시도한 횟수 (캐시 응답이면 0)."""
+    retries = getattr(response.raw, "retries", None)
+    return len(retries.history) if retries is not None else 0
+
+
+def _get(url, timeout, headers):
+    """GET 응답. 같은 URL·헤더로 미리 받은 응답(prefetch)이 있으면 요청하지 않고 그 응답을 쓴다."""
+    hdrs = headers if headers is not None else HEADERS
+    response = _take_prefetched(url, hdrs)
+    if response is not None:
+        return response
+    return _fetch(url, timeout, hdrs)
+
+
+def _fetch(url, timeout, hdrs):
+    """GET → 상태 확인. 요청 시간/크기/재시도를 지표(metrics)에 기록한다 (속도 제한은 어댑터에서)."""
+    _rate_waits.seconds = 0.0
+    start = time.perf_counter()
+    try:
+        response = get_session().get(url, headers=hdrs, timeout=timeout)
+        response.raise_for_status()
+    except Exception:
+        metrics.record_request(url, _elapsed(start), error=True)
+        raise
+    metrics.record_request(
+        url, _elapsed(start),
+        size=len(response.content),
+        retries=_retry_count(response),
+        cached=response.raw is None,
     )
-    adapter = HTTPAdapter(max_retries=retry)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    return session
+    _snapshot(url, response, response.content)
+    return response
+
+
+_rate_waits = threading.local()   # 이 스레드의 현재 요청이 속도 제한으로 기다린 시간
+
 
+def _elapsed(start):
+    """start 이후 요청 시간 (어댑터 안에서 속도 제한으로 기다린 시간은 빼고, 따로 기록된다)."""
+    waited = getattr(_rate_waits, "seconds", 0.0)
+    _rate_waits.seconds = 0.0
+    return max(0.0, time.perf_counter() - start - waited)
 
-_session = _create_session()
 
+def _wait_rate_limit(url):
+    """호스트별 토큰 버킷 대기. 공용 어댑터가 네트워크로 보내기 직전에 부른다 (PooledAdapter.throttle).
 
-def fetch_soup(url, timeout=DEFAULT_TIMEOUT, headers=None, delay=0):
+    오프라인 모드에서는 스냅샷 어댑터가 응답하므로 불리지 않지만, 혹시 불려도 기다리지 않는다.
+    """
+    if _offline_day is None:
+        waited = get_rate_limiter().acquire(url)
+        metrics.record_rate_wait(url, waited)
+        _rate_waits.seconds = getattr(_rate_waits, "seconds", 0.0) + waited
+
+
+def _snapshot(url, response, body, partial=False):
+    """응답 본문을 원본 HTML 스냅샷 대기열에 넣는다 (core.snapshots, 쓰기는 백그라운드)."""
+    if _offline_day is not None:
+        return
+    store = get_snapshot_store()
+    if store is not None:
+        store.submit(url, response, body, partial=partial)
+
+
+def fetch_soup(url, timeout=DEFAULT_TIMEOUT, headers=None, target=None, parse_only=None, page_type=None):
     """
     URL에서 HTML을 가져와 BeautifulSoup 객체로 반환.
     HTTP 레벨 재시도(3회, 백오프 0.5s) 자동 적용.
+    요청 전 호스트별 토큰 버킷(config.json 의 rate_limits)으로 속도를 제한한다.
+
+    target / parse_only 는 필요한 부분만 파싱하기 위한 힌트 (make_soup 참고).
+    page_type 은 파싱 시간을 기록할 페이지 종류 이름 (없으면 호스트 이름).
     """
-    if delay > 0:
-        time.sleep(delay)
-    hdrs = headers if headers is not None else HEADERS
-    response = _session.get(url, headers=hdrs, timeout=timeout)
-    response.raise_for_status()
-    return BeautifulSoup(response.text, "html.parser")
+    response = _get(url, timeout, headers)
+    with metrics.stage("parse", page_type or urlsplit(url).hostname or ""):
+        return make_soup(
+            response.content, _declared_charset(response),
+            target=target, parse_only=parse_only,
+        )
 
 
-def fetch_text(url, timeout=DEFAULT_TIMEOUT, headers=None, delay=0):
+def fetch_text(url, timeout=DEFAULT_TIMEOUT, headers=None):
     """URL에서 응답 텍스트(HTML)를 반환."""
-    if delay > 0:
-        time.sleep(delay)
+    return _get(url, timeout, headers).text
+
+
+STREAM_CHUNK = 8192   # fetch_stream 이 한 번에 읽는 본문 크기(바이트)
+
+
+def fetch_stream(url, consume, timeout=DEFAULT_TIMEOUT, headers=None, chunk_size=STREAM_CHUNK):
+    """
+    응답 본문을 받는 대로 텍스트 조각으로 디코딩해 consume(text) 에 넘긴다.
+    consume 이 참을 반환하면 나머지 본문은 받지 않고 연결을 닫는다.
+
+    페이지 앞부분만 필요한 경우(영어 명언 등)에 전체를 받아 트리를 만들지 않기 위한 것.
+    속도 제한/재시도/지표 기록은 fetch_soup 과 같지만, 스트리밍 요청은 HTTP 캐시와
+    미리 받은 응답(prefetch)을 거치지 않는다. 중간에 끊은 연결은 풀에 돌아가지 않는다.
+
+    Returns:
+        읽은 본문 바이트 수 (압축 해제 후)
+    """
     hdrs = headers if headers is not None else HEADERS
-    response = _session.get(url, headers=hdrs, timeout=timeout)
-    response.raise_for_status()
-    return response.text
+    _rate_waits.seconds = 0.0
+    start = time.perf_counter()
+    chunks = []
+    partial = False
+    try:
+        with get_session().get(url, headers=hdrs, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            try:
+                decoder = codecs.getincrementaldecoder(_declared_charset(response) or "utf-8")("replace")
+            except LookupError:
+                decoder = codecs.getincrementaldecoder("utf-8")("replace")
+            for chunk in response.iter_content(chunk_size):
+                chunks.append(chunk)
+                if consume(decoder.decode(chunk)):
+                    partial = True
+                    break
+            else:
+                rest = decoder.decode(b"", True)
+                if rest:
+                    consume(rest)
+    except Exception:
+        metrics.record_request(url, _elapsed(start), error=True)
+        raise
+    body = b"".join(chunks)
+    metrics.record_request(url, _elapsed(start), size=len(body), retries=_retry_count(response))
+    _snapshot(url, response, body, partial=partial)
+    return len(body)
+
 
+# ─────────────────────────────────────────────
+# HTML 파서 백엔드
+#   lxml 이 있으면 lxml, 없으면 html.parser 로 BeautifulSoup 트리를 만든다.
+#   selectolax 가 있으면 target 셀렉터에 해당하는 부분만 잘라 내어 파싱한다.
+# ─────────────────────────────────────────────
 
-def check_internet(url=INTERNET_CHECK_URL, timeout=INTERNET_CHECK_TIMEOUT):
-    """인터넷 연결 여부를 확인."""
+def _module_available(name):
     try:
-        _session.head(url, timeout=timeout, headers=HEADERS)
-        return True
-    except requests.RequestException:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
         return False
 
 
+def _choose_parser():
+    """config.json 의 html_parser 값에 따라 BeautifulSoup 파서 이름을 결정."""
+    if HTML_PARSER in ("lxml", "auto", "selectolax") and _module_available("lxml"):
+        return "lxml"
+    return "html.parser"
+
+
+@functools.lru_cache(maxsize=None)
+def _slicer():
+    """selectolax 의 HTML 파서 클래스 (없거나 html_parser 로 꺼져 있으면 None). 처음 부를 때 import."""
+    if HTML_PARSER not in ("auto", "selectolax"):
+        return None
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+        return LexborHTMLParser
+    except ImportError:
+        pass
+    try:
+        from selectolax.parser import HTMLParser
+        return HTMLParser
+    except ImportError:
+        return None
+
+
+_BS4_PARSER = _choose_parser()
+
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
+
+
+def _declared_charset(response):
+    """Content-Type 헤더에 명시된 charset (없으면 None → 문서 내 meta 로 판별)."""
+    match = _CHARSET_RE.search(response.headers.get("Content-Type", ""))
+    return match.group(1) if match else None
+
+
+def _slice_markup(content, encoding, target):
+    """selectolax 로 target 셀렉터에 해당하는 요소의 HTML 만 잘라 반환. 실패 시 None.
+
+    target 이 목록이면 find_with_fallback 처럼 앞에서부터 처음 매칭되는 셀렉터를 쓴다.
+    """
+    try:
+        text = content.decode(encoding or "utf-8")
+    except (UnicodeDecodeError, LookupError):
+        return None
+    selectors = (target,) if isinstance(target, str) else target
+    tree = _slicer()(text)
+    for selector in selectors:
+        node = tree.css_first(selector)
+        if node is not None:
+            return node.html
+    return None
+
+
+def make_soup(content, encoding=None, target=None, parse_only=None):
+    """
+    HTML 바이트(또는 문자열)로 BeautifulSoup 객체를 만든다.
+
+    - 바이트를 그대로 파서에 넘겨 response.text 디코딩/문자셋 추정 단계를 건너뛴다.
+      (encoding 이 있으면 그 문자셋으로, 없으면 문서의 meta charset 으로 해석)
+    - target: 필요한 부분의 CSS 셀렉터(또는 우선순위 순 후보 목록). selectolax 가 있으면
+      그 요소만 잘라 파싱한다. 결과는 잘라 낸 요소를 담은 문서라 soup.find /
+      find_with_fallback 을 그대로 쓸 수 있다. 매칭되는 요소가 없거나 selectolax 가 없으면
+      전체를 파싱한다.
+    - parse_only: BeautifulSoup 의 SoupStrainer (html.parser / lxml 모두 지원)
+    """
+    from bs4 import BeautifulSoup
+
+    if target and _slicer() is not None and isinstance(content, bytes):
+        markup = _slice_markup(content, encoding, target)
+        if markup is not None:
+            return BeautifulSoup(markup, _BS4_PARSER, parse_only=parse_only)
+    if isinstance(content, bytes):
+        return BeautifulSoup(content, _BS4_PARSER, from_encoding=encoding, parse_only=parse_only)
+    return BeautifulSoup(content, _BS4_PARSER, parse_only=parse_only)
+
+
+# ─────────────────────────────────────────────
+# 동시 요청 (asyncio 엔진 위의 동기 래퍼)
+# ─────────────────────────────────────────────
+
+def fetch_soup_many(urls, timeout=DEFAULT_TIMEOUT, headers=None):
+    """
+    여러 URL 을 동시에 요청해 완료되는 순서대로 결과를 yield.
+    호스트별 동시 요청 상한(config.json 의 host_concurrency)이 적용된다.
+
+    Yields:
+        (url, soup, error) — 실패 시 soup 는 None, error 는 예외 객체
+    """
+    func = functools.partial(fetch_soup, timeout=timeout, headers=headers)
+    return get_engine().map_as_completed(func, urls)
+
+
+def fetch_text_many(urls, timeout=DEFAULT_TIMEOUT, headers=None):
+    """fetch_soup_many 와 같되 응답 텍스트(HTML)를 yield."""
+    func = functools.partial(fetch_text, timeout=timeout, headers=headers)
+    return get_engine().map_as_completed(func, urls)
+
+
+def map_as_completed(func, items, url_of=None, limit=None, priority=PRIORITY_DETAIL):
+    """
+    items 각각에 func(item) (요청 + 파싱)을 동시에 실행하고 완료 순서대로 yield.
+    크롤러의 상세 수집처럼 "URL 하나 → 결과 하나" 인 작업을 묶어 제출할 때 사용.
+    목록 페이지는 priority=PRIORITY_LIST 로 제출해 다른 크롤러의 상세 요청보다 먼저 나가게 한다.
+
+    Yields:
+        (item, result, error)
+    """
+    return get_engine().map_as_completed(
+        func, items, url_of=url_of, limit=limit, priority=priority,
+    )
+
+
+def map_ordered(func, items, url_of=None, limit=None, priority=PRIORITY_DETAIL):
+    """map_as_completed 와 같이 동시에 실행하고, 결과를 items 순서대로 리스트로 반환."""
+    return get_engine().map_ordered(func, items, url_of=url_of, limit=limit, priority=priority)
+
+
+# ─────────────────────────────────────────────
+# 미리 받기 (prefetch) + 인터넷 연결 확인
+#   연결 확인을 크롤러의 첫 목록 페이지 요청으로 대신해, 확인이 끝나면 첫 페이지도 이미 받아 둔 상태가 된다.
+# ─────────────────────────────────────────────
+
+PREFETCH_TTL = 120    # 미리 받은 응답을 쓸 수 있는 시간(초)
+
+_prefetched = {}      # url → (headers, Future, 제출 시각)
+_prefetch_lock = threading.Lock()
+
+
+def prefetch(url, headers=None, timeout=DEFAULT_TIMEOUT, priority=PRIORITY_LIST):
+    """url 을 요청 엔진에 미리 제출하고 Future 를 반환.
+
+    PREFETCH_TTL 안에 같은 url·헤더로 fetch_soup / fetch_text 하면 다시 요청하지 않고 이 응답을 쓴다
+    (아직 받는 중이면 기다린다. 실패했으면 평소처럼 새로 요청한다).
+    """
+    hdrs = headers if headers is not None else HEADERS
+    future = get_engine().submit(url, _fetch, url, timeout, hdrs, priority=priority)
+    with _prefetch_lock:
+        _prefetched[url] = (hdrs, future, time.monotonic())
+    return future
+
+
+def _take_prefetched(url, headers):
+    """미리 받은(받는 중인) 응답. 없거나, 헤더가 다르거나, 오래되었거나, 실패했으면 None."""
+    with _prefetch_lock:
+        entry = _prefetched.get(url)
+    if entry is None:
+        return None
+    hdrs, future, submitted = entry
+    if hdrs != headers or time.monotonic() - submitted > PREFETCH_TTL:
+        return None
+    try:
+        return future.result()
+    except Exception:
+        return None
+
+
+def clear_prefetched():
+    """미리 받은 응답을 모두 버린다 (상주 모드에서 실행마다)."""
+    with _prefetch_lock:
+        _prefetched.clear()
+
+
+def _reachable(future):
+    """요청이 HTTP 응답을 받았는지 (오류 상태 코드여도 서버까지 닿았으면 연결된 것)."""
+    error = future.exception()
+    return error is None or isinstance(error, requests.HTTPError)
+
+
+def _head(url, timeout, headers):
+    """DNS/TLS 연결 예열용 HEAD 요청 (공용 연결 풀에 연결이 남는다)."""
+    return get_session().head(url, timeout=timeout, headers=headers)
+
+
+def probe_internet(probes=INTERNET_PROBES):
+    """
+    수집 대상(config.INTERNET_PROBES)에 동시에 요청해 인터넷 연결을 확인.
+
+    GET 은 prefetch 로 제출되어 크롤러의 첫 목록 페이지 요청을 겸하고, HEAD 는 연결만 미리 맺는다.
+    하나라도 응답하면 바로 반환하며, 나머지 요청은 계속 진행된다.
+
+    Returns:
+        처음 응답한 호스트 이름 (모두 실패하면 None)
+    """
+    engine = get_engine()
+    futures = {}
+    for method, url, headers, timeout in probes:
+        if method == "GET":
+            future = prefetch(url, headers, timeout)
+        else:
+            future = engine.submit(url, _head, url, timeout, headers, priority=PRIORITY_LIST)
+        futures[future] = urlsplit(url).hostname
+
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if _reachable(future):
+                return futures[future]
+    return None
+
+
+
 # ─────────────────────────────────────────────
 # 공통: 기사 날짜 추출
 # ─────────────────────────────────────────────
 
+def parse_article_dates(soup):
+    """
+    네이버 기사 페이지 soup 에서 작성일/수정일을 추출.
+
+    Returns:
+        (published_date, modified_date) — 없으면 각각 None
+    """
+    date_elements = soup.find_all(class_="media_end_head_info_datestamp_time")
+
+    published_date = None
+    modified_date = None
+
+    if len(date_elements) >= 1:
+        published_date = date_elements[0].get_text(strip=True)
+    if len(date_elements) >= 2:
+        mod_el = soup.find(class_="_ARTICLE_MODIFY_DATE_TIME")
+        if mod_el:
+            modified_date = mod_el.get_text(strip=True)
+
+    return published_date, modified_date
+
+
+def _fetch_article_dates(url):
+    soup = fetch_soup(url, target=".media_end_head", page_type="naver_article")
+    with metrics.stage("extract", "naver_article"):
+        return parse_article_dates(soup)
+
+
 def fetch_article_dates(url):
     """
     네이버 개별 기사 페이지에서 작성일/수정일을 추출.
+    같은 실행 안에서 이미 가져온 기사는 메모(article_memo)의 값을 재사용한다.
 
     Returns:
         (published_date, modified_date) or (None, None)
     """
     try:
-        soup = fetch_soup(url, delay=ARTICLE_DETAIL_DELAY)
-        date_elements = soup.find_all(class_="media_end_head_info_datestamp_time")
+        return article_memo.get_or_fetch(url, _fetch_article_dates)
+    except Exception:
+        return None, None
 
-        published_date = None
-        modified_date = None
 
-        if len(date_elements) >= 1:
-            published_date = date_elements[0].get_text(strip=True)
-        if len(date_elements) >= 2:
-            mod_el = soup.find(class_="_ARTICLE_MODIFY_DATE_TIME")
-            if mod_el:
-                modified_date = mod_el.get_text(strip=True)
+def enrich_article_dates(records, limit=DETAIL_CONCURRENCY):
+    """
+    기사 목록 각각의 작성일/수정일을 동시에 수집해 published_date/modified_date 키로 채운다.
+    URL 이 없는 기사는 (None, None). 레코드 순서는 바꾸지 않는다.
+    이전 날 수집해 아카이브에 남은 기사(seen_index.apply_previous 가 채운 archived)는 요청하지 않고 그 값을 쓴다.
+    """
+    for record in records:
+        record["published_date"], record["modified_date"] = None, None
+    reused = [
+        record for record in records
+        if record.get("archived") and record["archived"]["published"]
+    ]
+    for record in reused:
+        record["published_date"] = record["archived"]["published"]
+        record["modified_date"] = record["archived"]["modified"]
+    seen_index.count(reused=len(reused))
 
-        return published_date, modified_date
-    except Exception:
-        return None, None
+    targets = [record for record in records if record["url"] and not record["published_date"]]
+    dates = map_ordered(
+        fetch_article_dates, [record["url"] for record in targets], limit=limit,
+    )
+    for record, (published_date, modified_date) in zip(targets, dates):
+        record["published_date"] = published_date
+        record["modified_date"] = modified_date
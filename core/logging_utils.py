@@ -0,0 +1,64 @@
+"""
+공통 로깅 (콘솔 + 실행 로그 파일).
+
+requests / BeautifulSoup 를 import 하지 않는 가벼운 모듈이라, 진입점(daily_runner)과
+상주 모드는 무거운 모듈을 불러오기 전에 바로 로그를 남길 수 있다.
+크롤러는 예전처럼 core.http_utils 에서 log 를 가져와도 된다 (같은 함수).
+"""
+
+import sys
+import logging
+
+
+logger = logging.getLogger("news_crawling")
+logger.setLevel(logging.DEBUG)
+
+# 콘솔 핸들러
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setLevel(logging.INFO)
+_console_formatter = logging.Formatter("%(message)s")
+_console_handler.setFormatter(_console_formatter)
+logger.addHandler(_console_handler)
+
+# 파일 핸들러는 setup_file_logging()에서 동적으로 추가
+_file_handler = None
+
+
+def setup_file_logging(log_path):
+    """로그 파일 핸들러를 설정. 즉시 기록(flush). 이전 로그 파일은 닫는다."""
+    global _file_handler
+    if _file_handler is not None:
+        logger.removeHandler(_file_handler)
+        _file_handler.close()
+    _file_handler = logging.FileHandler(log_path, encoding="utf-8")
+    _file_handler.setLevel(logging.DEBUG)
+    _file_formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S")
+    _file_handler.setFormatter(_file_formatter)
+    logger.addHandler(_file_handler)
+
+
+def current_log_path():
+    """지금 기록 중인 로그 파일 경로 (파일 로그를 쓰지 않으면 None)."""
+    return _file_handler.baseFilename if _file_handler is not None else None
+
+
+def close_file_logging():
+    """로그 파일 핸들러를 떼고 닫는다 (이후 콘솔에만 기록)."""
+    global _file_handler
+    if _file_handler is not None:
+        logger.removeHandler(_file_handler)
+        _file_handler.close()
+        _file_handler = None
+
+
+def log(msg=""):
+    """콘솔 + 파일에 동시 기록. 기존 인터페이스 호환."""
+    if msg:
+        logger.info(msg)
+    else:
+        logger.info("")
+
+
+def quiet_console():
+    """콘솔 출력을 끈다 (파일 로그는 그대로). 벤치마크 등에서 사용."""
+    logger.removeHandler(_console_handler)
@@ -0,0 +1,204 @@
+"""
+실행 지표(metrics) 수집.
+
+하루 실행이 느렸을 때 어느 단계(요청 대기, 특정 호스트, 파싱, 중복 제거, 파일 쓰기)가
+원인인지 알 수 있도록 실행 중 다음 값을 모은다.
+
+- 호스트별: 요청 수, 받은 바이트, 실패 수, 재시도 수, 캐시 응답 수,
+  요청 지연 히스토그램과 p50/p95/p99, 속도 제한(rate_limits) 대기 시간
+- 단계별(parse / extract): 페이지 종류별 소요 시간
+- 요청 엔진 대기열(queue): 우선순위별로 작업이 자리를 받기까지 기다린 시간
+- 크롤러별 단계(phase) 소요 시간
+
+daily_runner 가 실행 로그 옆에 JSON 파일로 저장하고, 실행 결과 요약에 짧은 표를 출력한다.
+"""
+
+import json
+import math
+import time
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+
+# 지연 히스토그램 구간 상한(초). 마지막 구간은 그 이상 전부.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0)
+
+
+def percentile(sorted_values, p):
+    """정렬된 목록의 p 백분위 값 (nearest-rank). 비어 있으면 None."""
+    if not sorted_values:
+        return None
+    rank = math.ceil(len(sorted_values) * p / 100.0)
+    return sorted_values[min(len(sorted_values), max(rank, 1)) - 1]
+
+
+class Metrics:
+    """스레드 안전 실행 지표 저장소."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._hosts = {}
+            self._stages = {}
+            self._phases = {}
+            self._started = time.time()
+
+    # ── 기록 ──
+
+    def _host(self, url):
+        host = (urlsplit(url).hostname or "").lower() or "(unknown)"
+        stat = self._hosts.get(host)
+        if stat is None:
+            stat = {
+                "requests": 0, "bytes": 0, "errors": 0, "retries": 0, "cached": 0,
+                "rate_wait": 0.0, "latencies": [],
+            }
+            self._hosts[host] = stat
+        return stat
+
+    def record_request(self, url, seconds, size=0, retries=0, cached=False, error=False):
+        """요청 하나의 결과를 기록. seconds 는 속도 제한 대기를 뺀 요청 시간."""
+        with self._lock:
+            stat = self._host(url)
+            stat["requests"] += 1
+            stat["bytes"] += size
+            stat["retries"] += retries
+            stat["cached"] += int(cached)
+            stat["errors"] += int(error)
+            stat["latencies"].append(seconds)
+
+    def record_rate_wait(self, url, seconds):
+        """속도 제한(토큰 버킷)으로 기다린 시간을 기록."""
+        if seconds > 0:
+            with self._lock:
+                self._host(url)["rate_wait"] += seconds
+
+    def record_stage(self, stage, label, seconds):
+        """stage("parse", "extract" 등) 의 label(페이지 종류) 소요 시간을 기록."""
+        with self._lock:
+            stat = self._stages.setdefault(stage, {}).setdefault(label, {"count": 0, "seconds": 0.0})
+            stat["count"] += 1
+            stat["seconds"] += seconds
+
+    @contextmanager
+    def stage(self, stage, label):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(stage, label, time.perf_counter() - start)
+
+    @contextmanager
+    def phase(self, crawler, name):
+        """크롤러 단계 소요 시간을 잰다. 같은 단계를 여러 번 실행하면 합산한다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                phases = self._phases.setdefault(crawler, {})
+                phases[name] = phases.get(name, 0.0) + elapsed
+
+    # ── 조회 ──
+
+    def snapshot(self):
+        """JSON 으로 저장할 수 있는 지표 사본."""
+        with self._lock:
+            hosts = {}
+            for host, stat in sorted(self._hosts.items()):
+                latencies = sorted(stat["latencies"])
+                histogram = {f"<={bound}s": 0 for bound in LATENCY_BUCKETS}
+                histogram[f">{LATENCY_BUCKETS[-1]}s"] = 0
+                for value in latencies:
+                    for bound in LATENCY_BUCKETS:
+                        if value <= bound:
+                            histogram[f"<={bound}s"] += 1
+                            break
+                    else:
+                        histogram[f">{LATENCY_BUCKETS[-1]}s"] += 1
+                hosts[host] = {
+                    "requests": stat["requests"],
+                    "bytes": stat["bytes"],
+                    "errors": stat["errors"],
+                    "retries": stat["retries"],
+                    "cached": stat["cached"],
+                    "rate_wait_seconds": round(stat["rate_wait"], 3),
+                    "latency_seconds": {
+                        "p50": percentile(latencies, 50),
+                        "p95": percentile(latencies, 95),
+                        "p99": percentile(latencies, 99),
+                        "max": latencies[-1] if latencies else None,
+                        "total": sum(latencies),
+                    },
+                    "latency_histogram": histogram,
+                }
+            stages = {
+                stage: {
+                    label: {"count": stat["count"], "seconds": round(stat["seconds"], 4)}
+                    for label, stat in sorted(labels.items())
+                }
+                for stage, labels in self._stages.items()
+            }
+            phases = {
+                crawler: {name: round(seconds, 3) for name, seconds in names.items()}
+                for crawler, names in self._phases.items()
+            }
+            return {
+                "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self._started)),
+                "hosts": hosts,
+                "stages": stages,
+                "phases": phases,
+            }
+
+    def write_json(self, path, extra=None):
+        """지표를 JSON 파일로 저장. extra 는 최상위에 덧붙일 값(실행 결과 등)."""
+        data = self.snapshot()
+        if extra:
+            data.update(extra)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def summary_lines(self, top=8):
+        """실행 결과 요약용 짧은 표 (호스트별 요청/지연, 크롤러 단계별 시간)."""
+        data = self.snapshot()
+        lines = []
+        hosts = sorted(data["hosts"].items(), key=lambda kv: -kv[1]["latency_seconds"]["total"])
+        if hosts:
+            lines.append(f"  {'호스트':<24}{'요청':>5}{'MB':>7}{'p50':>7}{'p95':>7}{'p99':>7}{'재시도':>6}{'대기(s)':>8}")
+            for host, stat in hosts[:top]:
+                latency = stat["latency_seconds"]
+                lines.append(
+                    f"  {host[:24]:<24}{stat['requests']:>5}{stat['bytes'] / 1048576:>7.1f}"
+                    f"{_seconds(latency['p50'])}{_seconds(latency['p95'])}{_seconds(latency['p99'])}"
+                    f"{stat['retries']:>6}{stat['rate_wait_seconds']:>8.1f}"
+                )
+        for crawler, names in data["phases"].items():
+            text = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in names.items())
+            lines.append(f"  [{crawler}] {text}")
+        parse = data["stages"].get("parse", {})
+        if parse:
+            text = ", ".join(
+                f"{label} {stat['seconds']:.2f}s/{stat['count']}"
+                for label, stat in sorted(parse.items(), key=lambda kv: -kv[1]["seconds"])[:top]
+            )
+            lines.append(f"  [파싱] {text}")
+        queue = data["stages"].get("queue", {})
+        if queue:
+            text = ", ".join(
+                f"{label} 평균 {stat['seconds'] / stat['count']:.2f}s/{stat['count']}"
+                for label, stat in queue.items()
+            )
+            lines.append(f"  [대기열] {text}")
+        return lines
+
+
+def _seconds(value):
+    return f"{value:>7.2f}" if value is not None else f"{'-':>7}"
+
+
+metrics = Metrics()
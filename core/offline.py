@@ -0,0 +1,215 @@
+"""
+오프라인 재추출: 원본 HTML 스냅샷(core.snapshots)으로 지난 날짜의 파일을 다시 만든다.
+
+셀렉터를 고친 뒤 지난 날짜의 파일을 고치려고 네트워크로 다시 수집할 필요가 없다.
+요청은 그날 매니페스트에 있는 URL 이면 스냅샷 본문으로 응답하고, 없으면 요청 실패로 처리된다
+(이전 수집 기사라 그날 상세를 받지 않은 경우 등). 크롤러의 main() 을 그대로 실행하므로
+추출 함수(crawl_section_headlines, crawl_subsection_articles, fetch_editorial_content,
+crawl_finviz_news, fetch_article_detail 등)를 고치면 그 결과가 그대로 반영된다.
+
+- 날짜 하나는 프로세스 하나가 맡는다 (ProcessPoolExecutor). 파싱은 CPU 작업이라
+  여러 날을 코어 수만큼 동시에 처리한다.
+- 영어 명언은 모든 날이 같은 연도별 저장소를 쓰므로 풀 밖(이 프로세스)에서 날짜순으로 하나씩 처리한다.
+- 텍스트 파일과 기사 아카이브는 그날 것으로 다시 쓴다. 이전 수집 URL 색인은 읽기만 한다.
+- 날짜별 로그: LOGS_DIR/offline/{날짜}_재추출로그.txt
+
+Usage:
+    python -m core.offline 2026-02-19                               # 하루
+    python -m core.offline 2026-02-01 2026-02-28                    # 기간 (스냅샷이 있는 날만)
+    python -m core.offline 2026-02-01 2026-02-28 --targets headline economics --workers 4
+    python -m core.run_headline_crawling --offline 2026-02-19       # 크롤러 하나, 하루
+    python daily_runner.py --offline 2026-02-01 2026-02-28          # 전체 대상, 기간
+"""
+
+import os
+import sys
+import time
+import argparse
+import datetime
+import importlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from core.config import (
+    LOGS_DIR, SNAPSHOT_DIR,
+    MIN_EXPECTED_HEADLINES, MIN_EXPECTED_ECONOMICS,
+    MIN_EXPECTED_OPINIONS, MIN_EXPECTED_STOCK_NEWS,
+)
+from core.logging_utils import log, setup_file_logging, current_log_path, close_file_logging, quiet_console
+
+
+# 대상 → (이름, 모듈, main 함수, 최소 기대 수집 수). 영어 명언은 날짜를 받지 않는다 (페이지의 날짜로 저장).
+TARGETS = {
+    "quote": ("영어 명언", "core.crawling_english_saying", "insert_latest_quote", None),
+    "headline": ("헤드라인", "core.run_headline_crawling", "main", MIN_EXPECTED_HEADLINES),
+    "economics": ("경제 뉴스", "core.run_economics_crawling", "main", MIN_EXPECTED_ECONOMICS),
+    "opinions": ("사설", "core.run_opinions_crawling", "main", MIN_EXPECTED_OPINIONS),
+    "stock": ("영문 주식 뉴스", "core.run_eng_stock_check", "main", MIN_EXPECTED_STOCK_NEWS),
+}
+
+
+def use_snapshots(day):
+    """이 프로세스의 모든 요청을 day 의 스냅샷으로 응답하게 하고, 실행 단위 상태를 비운다."""
+    from core.http_utils import use_snapshots as _use_snapshots, clear_prefetched
+    from core.article_memo import article_memo
+    from core.seen_index import seen_index
+    from core.metrics import metrics
+
+    _use_snapshots(day)
+    seen_index.read_only = True
+    seen_index.reset_counters()
+    article_memo.clear()
+    metrics.reset()
+    clear_prefetched()
+
+
+def parse_offline_day(description, argv=None):
+    """크롤러 단독 실행용 인자 처리. --offline YYYY-MM-DD 가 있으면 스냅샷 모드로 바꾸고 그 날짜를 반환."""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--offline", metavar="YYYY-MM-DD", help="그날 원본 HTML 스냅샷으로 다시 추출 (네트워크 사용 안 함)")
+    args = parser.parse_args(argv)
+    if args.offline is None:
+        return None
+    try:
+        datetime.date.fromisoformat(args.offline)
+    except ValueError:
+        parser.error(f"--offline 형식 오류: {args.offline!r} (YYYY-MM-DD)")
+    use_snapshots(args.offline)
+    return args.offline
+
+
+def _run_target(key, day):
+    """대상 하나를 day 의 스냅샷으로 실행 (use_snapshots 후에 부른다). 결과 문자열."""
+    name, module, func_name, min_expected = TARGETS[key]
+    func = getattr(importlib.import_module(module), func_name)
+    try:
+        value = func() if key == "quote" else func(day)
+    except Exception as e:
+        log(f"  ✗ {name} 재추출 실패: {e}")
+        return f"실패: {e}"
+    if key == "quote":
+        return "성공" if value else "실패"
+    if not value:
+        return "실패"
+    if value < min_expected:
+        return f"{value}개 (기대 {min_expected}개 이상)"
+    return f"{value}개"
+
+
+def run_day(day, targets):
+    """날짜 하나를 스냅샷으로 다시 추출 (프로세스 풀 작업). {대상 이름: 결과 문자열}
+
+    영어 명언(quote)은 넣지 않는다 (reextract 가 풀 밖에서 처리).
+    그날 로그 파일에 기록하고, 끝나면 부른 쪽의 로그 파일로 되돌린다 (워커 1개일 때는 이 프로세스에서 실행).
+    """
+    log_dir = os.path.join(LOGS_DIR, "offline")
+    os.makedirs(log_dir, exist_ok=True)
+    previous_log = current_log_path()
+    setup_file_logging(os.path.join(log_dir, f"{day}_재추출로그.txt"))
+    try:
+        log(f"=== {day} 오프라인 재추출 ({', '.join(targets)}) ===")
+        use_snapshots(day)
+        return {TARGETS[key][0]: _run_target(key, day) for key in targets}
+    finally:
+        if previous_log is not None:
+            setup_file_logging(previous_log)
+        else:
+            close_file_logging()
+
+
+def replay_quotes(days):
+    """days 의 영어 명언 페이지를 날짜순으로 하나씩 다시 추출. {날짜: 결과 문자열}
+
+    연도별 명언 저장소를 여러 프로세스가 동시에 쓰지 않도록 이 프로세스에서만 실행한다.
+    """
+    results = {}
+    for day in days:
+        use_snapshots(day)
+        results[day] = _run_target("quote", day)
+    return results
+
+
+def _init_worker():
+    # 여러 날의 로그가 콘솔에 섞이지 않도록 작업 프로세스는 날짜별 로그 파일에만 기록
+    quiet_console()
+
+
+def snapshot_days(start, end=None):
+    """start~end(포함) 중 스냅샷 매니페스트가 있는 날짜."""
+    from core.snapshots import SnapshotStore
+
+    end = end or start
+    return [day for day in SnapshotStore(SNAPSHOT_DIR).days() if start <= day <= end]
+
+
+def reextract(days, targets=tuple(TARGETS), workers=None):
+    """days 를 프로세스 풀에서 동시에 다시 추출. {날짜: {대상 이름: 결과 문자열}} (날짜순)
+
+    영어 명언은 풀이 끝난 뒤 이 프로세스에서 날짜순으로 처리한다 (replay_quotes).
+    """
+    pooled = [key for key in targets if key != "quote"]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(days)))
+    results = {day: {} for day in days}
+    if pooled and workers == 1:
+        for day in days:
+            results[day] = run_day(day, pooled)
+    elif pooled:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = {pool.submit(run_day, day, pooled): day for day in days}
+            for future in as_completed(futures):
+                day = futures[future]
+                try:
+                    results[day] = future.result()
+                except Exception as e:
+                    results[day] = {"재추출": f"실패: {e}"}
+                log(f"  {day}: " + ", ".join(f"{name} {value}" for name, value in results[day].items()))
+
+    if "quote" in targets:
+        name = TARGETS["quote"][0]
+        for day, value in replay_quotes(days).items():
+            results[day] = {name: value, **results[day]}
+    return results
+
+
+def run_offline(start, end=None, targets=None, workers=None):
+    """start~end 의 스냅샷이 있는 날을 다시 추출하고 요약을 남긴다. 실패한 날이 없으면 0, 있으면 1."""
+    targets = list(targets or TARGETS)
+    days = snapshot_days(start, end)
+    if not days:
+        log(f"✗ {start} ~ {end or start} 에 스냅샷이 없습니다 ({SNAPSHOT_DIR})")
+        return 1
+
+    log(f"오프라인 재추출: {days[0]} ~ {days[-1]} ({len(days)}일, 대상 {', '.join(targets)})")
+    started = time.perf_counter()
+    results = reextract(days, targets, workers)
+    elapsed = time.perf_counter() - started
+
+    failed = 0
+    log("")
+    for day, day_results in results.items():
+        bad = [value for value in day_results.values() if "실패" in value or "기대" in value]
+        failed += bool(bad)
+        log(f"  {'✗' if bad else '✓'} {day}: "
+            + ", ".join(f"{name} {value}" for name, value in day_results.items()))
+    log(f"재추출 완료: {len(days)}일, {elapsed:.1f}초 (날짜별 로그: {os.path.join(LOGS_DIR, 'offline')})")
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m core.offline", description="원본 HTML 스냅샷으로 지난 날짜 재추출")
+    parser.add_argument("start", metavar="FROM", help="시작 날짜 YYYY-MM-DD")
+    parser.add_argument("end", metavar="TO", nargs="?", help="끝 날짜 YYYY-MM-DD (기본: FROM 하루)")
+    parser.add_argument("--targets", nargs="+", choices=list(TARGETS), help="재추출할 대상 (기본: 전체)")
+    parser.add_argument("--workers", type=int, help="동시에 처리할 날짜 수 (기본: CPU 코어 수)")
+    args = parser.parse_args(argv)
+    for value in (args.start, args.end):
+        if value is None:
+            continue
+        try:
+            datetime.date.fromisoformat(value)
+        except ValueError:
+            parser.error(f"날짜 형식 오류: {value!r} (YYYY-MM-DD)")
+    return run_offline(args.start, args.end, args.targets, args.workers)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""
+영어 명언 과거분 일괄 수집 (백필).
+
+매일 실행은 Hackers영어 명언 게시판 첫 페이지의 최신 명언 하나만 받으므로, 실행하지 못한 날의
+명언은 그대로 빠진다. 백필은 게시판 목록 페이지(config.QUOTE_PAGE_URL)를 차례로 넘기며
+페이지마다 (날짜, 영어, 한국어) 를 모두 뽑아 연도별 저장소(core.quote_store)에 넣는다.
+
+- 페이지는 workers 개씩 묶어 요청 엔진으로 동시에 받는다 (공용 세션/연결 풀).
+  www.hackers.co.kr 의 호스트별 동시 요청 상한(host_concurrency)과 요청 속도(rate_limits)가
+  그대로 적용된다.
+- 묶음이 끝날 때마다 연도별로 날짜순 add_many → 텍스트 파일 render 를 하고,
+  다음에 받을 페이지를 체크포인트(cache/quote_backfill.json)에 기록한다.
+  중단 후 다시 실행하면 그 페이지부터 이어 받는다. 게시판은 새 글이 앞에 붙으므로 며칠 뒤
+  이어 받으면 몇 개가 뒤로 밀려 다시 보일 뿐 빠지지는 않는다 (이미 있는 날짜는 건너뜀).
+- 앞 페이지에서 새 명언을 받은 뒤 이번 실행에서 이미 본 날짜뿐인 페이지(마지막 페이지를 반복해서
+  보여 주는 경우)가 나오면 끝까지 받은 것으로 보고 경고와 함께 완료를 기록한다.
+  명언이 없는 페이지와 그 밖의 반복은 실패로 보고 그 페이지에서 멈춘다 (완료로 기록하지 않음).
+- 완료 후 다시 실행하면 1페이지부터 받아, 모든 명언이 이미 저장된 페이지가 나오면 멈춘다
+  (그사이 실행하지 못한 날만 채움).
+
+Usage:
+    python -m core.quote_backfill                     # 체크포인트에서 이어서 끝까지
+    python -m core.quote_backfill --pages 20          # 이번 실행은 20페이지까지만
+    python -m core.quote_backfill --since 2025-01-01  # 이 날짜보다 오래된 명언이 나오면 멈춤
+    python -m core.quote_backfill --restart           # 체크포인트를 무시하고 1페이지부터
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import datetime
+
+from core.config import (
+    QUOTE_PAGE_URL, QUOTE_HEADERS, QUOTE_BACKFILL_PATH, HOST_CONCURRENCY, host_key,
+)
+from core.fetch_engine import PRIORITY_BACKGROUND
+from core.quote_store import QuoteStore
+from core.crawling_english_saying import extract_quotes, page_lines
+from core.logging_utils import log
+
+
+def page_url(page):
+    return QUOTE_PAGE_URL.format(page=page)
+
+
+def default_workers():
+    """동시에 받을 페이지 수 기본값 = 게시판 호스트의 동시 요청 상한."""
+    url = page_url(1)
+    return max(1, int(HOST_CONCURRENCY.get(host_key(url, HOST_CONCURRENCY), HOST_CONCURRENCY.get("default", 4))))
+
+
+def fetch_quote_page(page):
+    """목록 페이지 하나의 (date, english, korean) 목록 (페이지 순서)."""
+    from core.http_utils import fetch_soup
+    soup = fetch_soup(page_url(page), headers=QUOTE_HEADERS, page_type="hackers_quote")
+    return extract_quotes(page_lines(soup))
+
+
+# ─────────────────────────────────────────────
+# 체크포인트
+# ─────────────────────────────────────────────
+
+def load_checkpoint(path=QUOTE_BACKFILL_PATH):
+    """{"next_page", "finished", ...}. 없거나 읽을 수 없으면 처음부터."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if int(state.get("next_page", 1)) >= 1:
+            return state
+    except (OSError, ValueError, TypeError, AttributeError):
+        pass
+    return {"next_page": 1, "finished": False}
+
+
+def save_checkpoint(state, path=QUOTE_BACKFILL_PATH):
+    state["updated"] = datetime.datetime.now().replace(microsecond=0).isoformat()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+# ─────────────────────────────────────────────
+# 백필
+# ─────────────────────────────────────────────
+
+class _Stores:
+    """연도별 QuoteStore 를 한 번씩만 열어 둔다."""
+
+    def __init__(self):
+        self._stores = {}
+
+    def get(self, date):
+        year = int(date[:4])
+        if year not in self._stores:
+            self._stores[year] = QuoteStore(year)
+        return self._stores[year]
+
+    def known(self, date):
+        return date in self.get(date)
+
+    def merge(self, quotes):
+        """연도별로 날짜순 add_many 후 새로 추가된 해의 텍스트 파일을 다시 만든다. {year: 추가 수}"""
+        by_year = {}
+        for quote in quotes:
+            by_year.setdefault(int(quote[0][:4]), []).append(quote)
+        added = {}
+        for year, entries in sorted(by_year.items()):
+            store = self.get(entries[0][0])
+            count = store.add_many(sorted(entries))
+            if count:
+                store.render()
+                added[year] = count
+        return added
+
+
+def backfill(max_pages=None, workers=None, since=None, restart=False, checkpoint_path=QUOTE_BACKFILL_PATH):
+    """게시판 목록 페이지를 넘기며 빠진 명언을 저장소에 채운다.
+
+    Args:
+        max_pages: 이번 실행에서 받을 최대 페이지 수 (None 이면 끝까지)
+        workers: 동시에 받을 페이지 수 (기본값: 게시판 호스트의 host_concurrency)
+        since: "YYYY-MM-DD". 이보다 오래된 명언이 있는 페이지까지 받고 멈춘다
+        restart: 체크포인트를 무시하고 1페이지부터
+
+    Returns:
+        dict: pages(받은 페이지 수), added({연도: 추가 수}), finished, failed_page
+    """
+    from core.http_utils import map_as_completed
+
+    workers = max(1, workers or default_workers())
+    state = {"next_page": 1, "finished": False} if restart else load_checkpoint(checkpoint_path)
+    # 이미 끝까지 받았다면 최신 페이지부터 이미 저장된 명언이 나올 때까지만 받는다
+    catch_up = bool(state.get("finished"))
+    page = 1 if catch_up else int(state["next_page"])
+    last_page = page + max_pages - 1 if max_pages else None
+    stores = _Stores()
+    seen_dates = set()
+    progressed = False     # 이번 실행에서 새 날짜를 가져온 페이지가 있었는지
+    summary = {"pages": 0, "added": {}, "finished": False, "failed_page": None}
+
+    log(f"영어 명언 백필 시작 ({'새 명언 확인' if catch_up else f'{page}페이지부터'}, 동시 {workers}페이지)")
+    stop = False
+    while not stop:
+        pages = list(range(page, page + workers if last_page is None else min(page + workers, last_page + 1)))
+        if not pages:
+            break
+        results, errors = {}, {}
+        for item, quotes, error in map_as_completed(
+            fetch_quote_page, pages, url_of=page_url, limit=workers, priority=PRIORITY_BACKGROUND,
+        ):
+            if error is not None:
+                errors[item] = error
+            else:
+                results[item] = quotes
+
+        # 페이지 순서대로 확인: 실패한 페이지 앞까지만 반영하고 체크포인트도 거기서 멈춘다
+        batch = []
+        for current in pages:
+            if current in errors:
+                log(f"  ✗ {current}페이지 수집 실패: {errors[current]}")
+                summary["failed_page"] = current
+                stop = True
+                break
+            quotes = results[current]
+            dates = {date for date, _, _ in quotes}
+            if not dates:
+                # 빈 페이지는 게시판 끝이 아니라 수집/파싱 실패로 본다 (다음 실행에서 다시 받는다)
+                log(f"  ✗ {current}페이지에 명언이 없음 (수집/파싱 실패로 보고 멈춤)")
+                summary["failed_page"] = current
+                stop = True
+                break
+            if not dates - seen_dates:
+                # 마지막 페이지를 넘기면 게시판이 끝 페이지를 다시 보여준다. 앞 페이지에서 새 명언을
+                # 받은 뒤에만 끝으로 보고, 그 밖의 반복은 오류로 둔다.
+                if current > 1 and progressed:
+                    log(f"  ⚠ {current}페이지가 앞 페이지의 명언을 반복함 → 게시판 끝으로 보고 멈춤")
+                    state["finished"] = stop = True
+                else:
+                    log(f"  ✗ {current}페이지가 앞 페이지의 명언을 반복함 (게시판 끝으로 보지 않고 멈춤)")
+                    summary["failed_page"] = current
+                    stop = True
+                break
+            progressed = True
+            seen_dates |= dates
+            batch.extend(quotes)
+            page = current + 1
+            summary["pages"] += 1
+            if catch_up and all(stores.known(date) for date in dates):
+                stop = True
+                break
+            if since and min(dates) < since:
+                stop = True
+                break
+
+        for year, count in stores.merge(batch).items():
+            summary["added"][year] = summary["added"].get(year, 0) + count
+        if batch:
+            log(f"  {page - 1}페이지까지 확인 (가장 오래된 명언 {min(date for date, _, _ in batch)})")
+        if not catch_up:
+            state["next_page"] = page
+        save_checkpoint(state, checkpoint_path)
+        if last_page is not None and page > last_page:
+            break
+
+    summary["finished"] = bool(state["finished"])
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m core.quote_backfill", description="영어 명언 과거분 일괄 수집")
+    parser.add_argument("--pages", type=int, help="이번 실행에서 받을 최대 페이지 수")
+    parser.add_argument("--workers", type=int, help="동시에 받을 페이지 수 (기본: host_concurrency)")
+    parser.add_argument("--since", metavar="YYYY-MM-DD", help="이 날짜보다 오래된 명언이 나오면 멈춤")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 1페이지부터")
+    args = parser.parse_args(argv)
+    if args.since:
+        try:
+            datetime.date.fromisoformat(args.since)
+        except ValueError:
+            parser.error(f"--since 형식 오류: {args.since!r} (YYYY-MM-DD)")
+
+    start = time.perf_counter()
+    summary = backfill(args.pages, args.workers, args.since, args.restart)
+    added = summary["added"]
+    log(f"영어 명언 백필 종료: {summary['pages']}페이지, {sum(added.values())}개 추가"
+        f" ({time.perf_counter() - start:.1f}초)")
+    for year, count in sorted(added.items()):
+        log(f"  {year}년 +{count}")
+    if summary["finished"]:
+        log("  게시판 끝까지 확인 완료 (다음 실행부터는 새 명언만 확인)")
+    elif summary["failed_page"] is None:
+        log(f"  다음 실행은 {load_checkpoint()['next_page']}페이지부터 이어서 받습니다.")
+    return 1 if summary["failed_page"] is not None else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+"""
+영어 명언 저장소 (연도별 추가 전용 기록 + 날짜 색인 + 텍스트 파일 생성).
+
+바탕화면의 `{YYYY}년 영어 명언 모음.txt` 는 사람이 읽는 화면(최신 날짜가 위)이고,
+실제 기록은 NEWS_DIR/quotes 에 연도별로 둔다.
+
+- {YYYY}.jsonl: 명언 한 줄에 하나 ({"date", "english", "korean"}). 끝에 덧붙이기만 한다.
+- {YYYY}.idx:  날짜 색인. 헤더(매직 + 색인이 반영한 기록 길이) 뒤에 그해 날짜(1월 1일~12월 31일)마다
+               8바이트 칸 하나 = 기록 안 위치 + 1 (0 이면 없음). 크기가 고정이라 날짜 조회는
+               파일 크기와 상관없이 칸 하나를 읽는 것으로 끝난다.
+- 텍스트 파일은 색인 순서(날짜 역순)로 임시 파일에 다시 써서 os.replace 로 바꾼다.
+  중간에 멈춰도 이전 파일이 그대로 남고, 반쯤 쓴 파일은 남지 않는다.
+
+기록을 덧붙인 뒤 색인을 쓰기 전에 멈추면, 다음에 열 때 색인이 반영하지 못한 기록 끝부분만 읽어
+색인을 맞춘다 (끝이 잘린 줄은 지운다). 저장소가 없고 예전 텍스트 파일만 있으면 그 내용을 읽어 옮긴다.
+
+매일 실행과 백필(core.quote_backfill)처럼 여러 프로세스가 같은 해를 동시에 쓸 수 있으므로,
+모든 조회/추가/텍스트 파일 생성은 연도별 잠금 파일({YYYY}.lock)을 잡고 그 안에서 색인을 다시 읽는다.
+"""
+
+import os
+import re
+import json
+import datetime
+import threading
+import contextlib
+from array import array
+
+from core.config import QUOTES_DIR, QUOTE_STORE_DIR
+from core.file_lock import acquire, release, write_atomic
+
+
+_MAGIC = b"DGQIDX01"
+_HEADER_SIZE = len(_MAGIC) + 8
+_SLOTS = 366
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def view_path(year, view_dir=None):
+    """연도별 텍스트 파일 경로."""
+    return os.path.join(view_dir or QUOTES_DIR, f"{year}년 영어 명언 모음.txt")
+
+
+class QuoteStore:
+    """한 해의 명언 저장소. 잠금을 잡을 때마다 색인을 읽고, 기록과 어긋나 있으면 맞춘다."""
+
+    def __init__(self, year, store_dir=None, view_dir=None):
+        self.year = year
+        store_dir = store_dir or QUOTE_STORE_DIR
+        self.records_path = os.path.join(store_dir, f"{year}.jsonl")
+        self.index_path = os.path.join(store_dir, f"{year}.idx")
+        self.lock_path = os.path.join(store_dir, f"{year}.lock")
+        self.view_path = view_path(year, view_dir)
+        self._slots = None
+        self._committed = 0
+        self._thread_lock = threading.RLock()
+        self._lock_file = None
+        self._migrations = {}   # 옮길 다른 해 명언 (잠금을 푼 뒤 그해 저장소에 넣는다)
+
+    # ── 잠금 ──
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """연도별 잠금 파일을 잡고(같은 인스턴스 안에서는 다시 잡아도 됨) 색인을 새로 읽는다."""
+        with self._thread_lock:
+            if self._lock_file is not None:
+                yield
+                return
+            self._lock_file = acquire(self.lock_path)
+            try:
+                # 다른 프로세스가 그사이 덧붙였을 수 있으므로 잠금 안에서 색인을 다시 읽는다
+                self._slots = None
+                self._load()
+                yield
+            finally:
+                lock_file, self._lock_file = self._lock_file, None
+                release(lock_file)
+            migrations, self._migrations = self._migrations, {}
+        # 다른 해 저장소는 이 해의 잠금을 푼 뒤에 쓴다 (두 해의 잠금을 함께 잡지 않음)
+        store_dir, view_dir = os.path.dirname(self.records_path), os.path.dirname(self.view_path)
+        for year, entries in migrations.items():
+            other = QuoteStore(year, store_dir, view_dir)
+            if other.add_many(entries):
+                other.render()
+
+    # ── 색인 ──
+
+    def _slot(self, date):
+        day = datetime.date.fromisoformat(date)
+        if day.year != self.year:
+            raise ValueError(f"{date} 는 {self.year}년 명언이 아닙니다.")
+        return day.timetuple().tm_yday - 1
+
+    def _load(self):
+        if self._slots is not None:
+            return
+        slots, committed = array("Q", bytes(8 * _SLOTS)), 0
+        try:
+            with open(self.index_path, "rb") as f:
+                data = f.read()
+            if len(data) == _HEADER_SIZE + 8 * _SLOTS and data.startswith(_MAGIC):
+                committed = int.from_bytes(data[len(_MAGIC):_HEADER_SIZE], "little")
+                slots = array("Q", data[_HEADER_SIZE:])
+        except OSError:
+            pass
+        self._slots, self._committed = slots, committed
+
+        if not os.path.exists(self.records_path):
+            self._slots, self._committed = array("Q", bytes(8 * _SLOTS)), 0
+            self._migrate_view()
+            return
+        size = os.path.getsize(self.records_path)
+        if committed > size:
+            # 기록 파일이 바뀌었다 (복원 등) → 처음부터 다시 색인
+            self._slots, self._committed = array("Q", bytes(8 * _SLOTS)), 0
+        if self._committed < size:
+            self._index_tail()
+
+    def _index_tail(self):
+        """색인이 반영하지 못한 기록 끝부분을 읽어 색인에 넣는다. 끝이 잘린 줄은 지운다."""
+        with open(self.records_path, "rb+") as f:
+            f.seek(self._committed)
+            offset = self._committed
+            for line in f:
+                if not line.endswith(b"\n"):
+                    f.truncate(offset)
+                    break
+                try:
+                    record = json.loads(line)
+                    slot = self._slot(record["date"])
+                except (ValueError, KeyError):
+                    slot = None
+                if slot is not None and not self._slots[slot]:
+                    self._slots[slot] = offset + 1
+                offset += len(line)
+        self._committed = offset
+        self._save_index()
+
+    def _save_index(self):
+        header = _MAGIC + self._committed.to_bytes(8, "little")
+        write_atomic(self.index_path, header + self._slots.tobytes())
+
+    def _migrate_view(self):
+        """저장소가 없을 때 예전 텍스트 파일에 있던 명언을 옮긴다.
+
+        다른 해 날짜의 명언(연초에 받은 전년도 12월 31일 명언 등)은 그해 저장소로 옮기고
+        그해 텍스트 파일도 다시 만든다.
+        """
+        try:
+            with open(self.view_path, "r", encoding="utf-8") as f:
+                lines = [line.strip() for line in f if line.strip()]
+        except OSError:
+            return
+        by_year = {}
+        for i, line in enumerate(lines):
+            if _DATE_RE.match(line) and i + 2 < len(lines) and not _DATE_RE.match(lines[i + 1]):
+                try:
+                    year = datetime.date.fromisoformat(line).year
+                except ValueError:
+                    continue
+                by_year.setdefault(year, []).append((line, lines[i + 1], lines[i + 2]))
+        for year, entries in by_year.items():
+            entries.reverse()  # 텍스트 파일은 최신이 위 → 오래된 것부터 기록
+            if year == self.year:
+                self._append(entries)
+            else:
+                self._migrations.setdefault(year, []).extend(entries)
+
+    # ── 조회 / 추가 ──
+
+    def __contains__(self, date):
+        slot = self._slot(date)
+        with self._locked():
+            return bool(self._slots[slot])
+
+    def get(self, date):
+        """date 의 명언 {"date", "english", "korean"} (없으면 None)."""
+        slot = self._slot(date)
+        with self._locked():
+            position = self._slots[slot]
+            if not position:
+                return None
+            with open(self.records_path, "rb") as f:
+                f.seek(position - 1)
+                return json.loads(f.readline())
+
+    def add(self, date, english, korean):
+        """명언 하나를 추가. 새로 추가했으면 True, 이미 있는 날짜면 False."""
+        return self.add_many([(date, english, korean)]) == 1
+
+    def add_many(self, entries):
+        """(date, english, korean) 들을 기록 끝에 한 번에 덧붙이고 색인에 넣는다.
+
+        이미 있는 날짜와 목록 안에서 중복된 날짜는 건너뛴다. 날짜가 다른 해면 ValueError.
+
+        Returns:
+            새로 추가한 수
+        """
+        with self._locked():
+            return self._append(entries)
+
+    def _append(self, entries):
+        """add_many 본체 (잠금을 잡은 상태에서 부른다)."""
+        lines, slots = [], []
+        for date, english, korean in entries:
+            slot = self._slot(date)
+            if self._slots[slot] or slot in slots:
+                continue
+            lines.append(json.dumps(
+                {"date": date, "english": english, "korean": korean}, ensure_ascii=False,
+            ).encode("utf-8") + b"\n")
+            slots.append(slot)
+        if not lines:
+            return 0
+
+        data = b"".join(lines)
+        os.makedirs(os.path.dirname(self.records_path), exist_ok=True)
+        with open(self.records_path, "ab") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            # 덧붙인 위치는 쓴 뒤의 파일 크기로 계산한다 (열 때의 tell() 은 덧붙일 위치가 아닐 수 있음)
+            offset = os.fstat(f.fileno()).st_size - len(data)
+        for slot, line in zip(slots, lines):
+            self._slots[slot] = offset + 1
+            offset += len(line)
+        self._committed = offset
+        self._save_index()
+        return len(lines)
+
+    def records(self):
+        """저장된 명언을 날짜 역순(최신 먼저)으로."""
+        with self._locked():
+            positions = [position for position in reversed(self._slots) if position]
+            if not positions:
+                return []
+            records = []
+            with open(self.records_path, "rb") as f:
+                for position in positions:
+                    f.seek(position - 1)
+                    records.append(json.loads(f.readline()))
+            return records
+
+    def render(self):
+        """텍스트 파일을 날짜 역순으로 다시 만든다 (원자적 교체)."""
+        with self._locked():
+            parts = [f"{self.year}년 영어 명언 모음\n\n"]
+            for record in self.records():
+                parts.append(f"{record['date']}\n{record['english']}\n\n{record['korean']}\n\n\n")
+            write_atomic(self.view_path, "".join(parts).encode("utf-8"))
@@ -0,0 +1,92 @@
+"""
+호스트별 토큰 버킷 요청 속도 제한.
+
+요청 전에 고정 시간(time.sleep)을 쉬는 대신, 호스트(도메인)마다 토큰 버킷을 두고
+버킷에 토큰이 없을 때만 기다린다.
+
+- burst : 쉬지 않고 연달아 보낼 수 있는 요청 수 (버킷 크기)
+- rate  : 초당 보충되는 토큰 수 (지속 요청 속도)
+
+서로 다른 호스트(예: yahoo 와 prnewswire)는 각자의 버킷을 쓰므로 서로의 대기를 떠안지 않는다.
+전체 요청 속도는 별도의 전역 버킷(rate_limit_total)으로 한 번 더 제한한다.
+여러 스레드가 동시에 요청해도 예약 방식이라 버킷 한도를 넘지 않는다.
+"""
+
+import time
+import threading
+
+from core.config import RATE_LIMITS, RATE_LIMIT_TOTAL, host_key
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (예약 방식)."""
+
+    def __init__(self, rate, burst):
+        self.rate = max(float(rate), 1e-6)
+        self.burst = max(float(burst), 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """토큰 하나를 예약하고, 그 토큰을 쓸 수 있을 때까지 기다려야 할 시간(초)을 반환.
+
+        토큰이 모자라면 잔량이 음수가 되어 다음 예약자는 그만큼 더 기다린다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """호스트별 버킷 + 전역 버킷으로 요청 속도를 제한."""
+
+    def __init__(self, limits=None, total=None):
+        self.limits = dict(limits if limits is not None else RATE_LIMITS)
+        total = total if total is not None else RATE_LIMIT_TOTAL
+        self._total = TokenBucket(total["rate"], total["burst"]) if total else None
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, url):
+        key = host_key(url, self.limits)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                setting = self.limits.get(key) or self.limits.get("default")
+                if not setting:
+                    return None
+                bucket = TokenBucket(setting["rate"], setting["burst"])
+                self._buckets[key] = bucket
+            return bucket
+
+    def acquire(self, url):
+        """url 로 요청을 보내도 될 때까지 대기. 실제로 기다린 시간(초)을 반환."""
+        wait = 0.0
+        bucket = self._bucket(url)
+        if bucket is not None:
+            wait = bucket.reserve()
+        if self._total is not None:
+            wait = max(wait, self._total.reserve())
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """프로세스 공용 RateLimiter (최초 호출 시 생성)."""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                _limiter = RateLimiter()
+    return _limiter
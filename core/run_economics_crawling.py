@@ -7,20 +7,19 @@ Selenium/ChromeDriver 없이 동작.
 """
 
 import os
-import datetime
 import time
-from difflib import SequenceMatcher
+import datetime
 
 from core.config import (
-    ECONOMICS_DIR, NAVER_ECONOMICS_URL, SECTION_CRAWL_DELAY,
-    find_with_fallback,
+    ECONOMICS_DIR, NAVER_ECONOMICS_URL, SECTION_CONCURRENCY,
+    SELECTORS, find_with_fallback,
 )
-from core.http_utils import fetch_soup, fetch_article_dates, log
-
-
-def are_similar(str1, str2, threshold=0.8):
-    """두 문자열의 유사도를 비교하여 중복 여부를 판단."""
-    return SequenceMatcher(None, str1, str2).ratio() > threshold
+from core.http_utils import fetch_soup, enrich_article_dates, map_ordered, log
+from core.fetch_engine import PRIORITY_LIST
+from core.title_index import TitleIndex
+from core.metrics import metrics
+from core.archive import store_records
+from core.seen_index import apply_previous, filter_repeats, repeat_note, remember_captures
 
 
 def get_economics_subsections():
@@ -32,7 +31,7 @@ def get_economics_subsections():
     """
     subsections = []
     try:
-        soup = fetch_soup(NAVER_ECONOMICS_URL)
+        soup = fetch_soup(NAVER_ECONOMICS_URL, page_type="naver_section")
 
         nav_section = soup.find(class_="ct_snb_nav")
         if nav_section is None:
@@ -64,7 +63,10 @@ def crawl_subsection_articles(subsection_data):
     """
     articles = []
     try:
-        soup = fetch_soup(subsection_data["url"], delay=SECTION_CRAWL_DELAY)
+        soup = fetch_soup(
+            subsection_data["url"], target=SELECTORS["latest_section"], page_type="naver_subsection",
+        )
+        extract_start = time.perf_counter()
 
         latest_section = find_with_fallback(soup, "latest_section")
         if latest_section is None:
@@ -104,22 +106,28 @@ def crawl_subsection_articles(subsection_data):
                 except Exception:
                     continue
 
+        metrics.record_stage("extract", "naver_subsection", time.perf_counter() - extract_start)
+
     except Exception as e:
         log(f"  [{subsection_data['subsection']}] 기사 수집 실패: {e}")
 
     return articles
 
 
-def main():
+def main(day=None):
     """
     경제 뉴스 크롤링 메인 함수.
 
+    Args:
+        day: 수집일 "YYYY-MM-DD" (기본: 오늘). 오프라인 재추출(core.offline)에서 그날 스냅샷으로 다시 만들 때 지정
+
     Returns:
         int: 수집된 총 기사 수
     """
-    today = datetime.datetime.today().strftime('%Y-%m-%d')
-    year = datetime.datetime.today().strftime('%Y')
-    month = datetime.datetime.today().strftime('%m')
+    run_date = datetime.datetime.strptime(day, '%Y-%m-%d') if day else datetime.datetime.today()
+    today = run_date.strftime('%Y-%m-%d')
+    year = run_date.strftime('%Y')
+    month = run_date.strftime('%m')
 
     directory = os.path.join(ECONOMICS_DIR, year, month)
     os.makedirs(directory, exist_ok=True)
@@ -127,27 +135,42 @@ def main():
     economics_file_path = os.path.join(directory, f'{today}_경제_영역별_뉴스_모음.txt')
 
     # 1) 서브섹션 목록 수집
-    all_section_data = get_economics_subsections()
-
-    # 2) 각 서브섹션별 기사 수집 (중복 제거)
+    # 2) 각 서브섹션별 기사 동시 수집 → 서브섹션 순서대로 중복 제거 (실행마다 같은 결과)
+    with metrics.phase("economics", "subsections"):
+        all_section_data = get_economics_subsections()
+        subsection_results = map_ordered(
+            crawl_subsection_articles,
+            all_section_data,
+            url_of=lambda section_data: section_data["url"],
+            limit=SECTION_CONCURRENCY,
+            priority=PRIORITY_LIST,
+        )
+
+    #    (TitleIndex: 기존 기사 전체와 비교하는 것과 같은 판정을 후보 검색으로 빠르게)
     all_article_data = []
-    for section_data in all_section_data:
-        articles = crawl_subsection_articles(section_data)
-        before = len(all_article_data)
-        for article in articles:
-            duplicate = False
-            for existing in all_article_data:
-                if are_similar(existing["title"], article["title"]) or existing["url"] == article["url"]:
-                    duplicate = True
-                    break
-            if not duplicate:
-                all_article_data.append(article)
-        added = len(all_article_data) - before
-
-        log(f"  [{section_data['subsection']:6s}] {added:3d}개 수집")
-
-    # 3) 파일 작성
-    with open(economics_file_path, 'w', encoding='utf-8') as file:
+    title_index = TitleIndex()
+    with metrics.phase("economics", "dedup"):
+        for section_data, articles in zip(all_section_data, subsection_results):
+            before = len(all_article_data)
+            for article in articles:
+                if not title_index.is_duplicate(article["title"], article["url"]):
+                    title_index.add(article["title"], article["url"])
+                    all_article_data.append(article)
+            added = len(all_article_data) - before
+
+            log(f"  [{section_data['subsection']:6s}] {added:3d}개 수집")
+
+    # 3) 기사 상세(작성일/수정일) 동시 수집 (이전 날 수집한 기사는 아카이브 값 재사용)
+    with metrics.phase("economics", "article_dates"):
+        repeats = apply_previous(all_article_data, today)
+        enrich_article_dates(all_article_data)
+    if repeats:
+        log(f"  [이전 수집] {repeats}개")
+
+    written = filter_repeats(all_article_data)
+
+    # 4) 파일 작성
+    with metrics.phase("economics", "write"), open(economics_file_path, 'w', encoding='utf-8') as file:
         file.write(f"=== {today} 경제 영역별 뉴스 모음 ===\n\n\n")
 
         file.write("목차:\n")
@@ -156,29 +179,43 @@ def main():
         file.write("\n\n")
 
         current_subsection = None
-        for data in all_article_data:
+        for data in written:
             if current_subsection != data['subsection']:
                 current_subsection = data['subsection']
                 file.write(f"=== {current_subsection} ===\n\n")
 
-            published_date, modified_date = None, None
-            if data["url"]:
-                published_date, modified_date = fetch_article_dates(data["url"])
-
             file.write(f"제목: {data['title']}\n")
             file.write(f"내용: {data['summary']}\n")
             file.write(f"언론사: {data['press']}\n")
-            if published_date:
-                file.write(f"작성일: {published_date}\n")
-            if modified_date:
-                file.write(f"수정일: {modified_date}\n")
+            if data["published_date"]:
+                file.write(f"작성일: {data['published_date']}\n")
+            if data["modified_date"]:
+                file.write(f"수정일: {data['modified_date']}\n")
+            file.write(repeat_note(data))
             file.write(f"링크: {data['url']}\n\n")
             file.write("=" * 50 + "\n\n")
 
-    log(f"  ✓ 경제 뉴스 {len(all_article_data)}개 → {economics_file_path}")
-    return len(all_article_data)
+    log(f"  ✓ 경제 뉴스 {len(written)}개 → {economics_file_path}")
+
+    with metrics.phase("economics", "archive"):
+        stored = store_records("economics", today, [
+            {
+                "category": data["subsection"], "title": data["title"], "summary": data["summary"],
+                "press": data["press"], "url": data["url"],
+                "published": data["published_date"], "modified": data["modified_date"],
+            }
+            for data in written
+        ])
+        remembered = remember_captures([data["url"] for data in all_article_data], today)
+    if stored is None:
+        log("  ⚠ 경제 뉴스 아카이브 저장 실패")
+    if not remembered:
+        log("  ⚠ 경제 뉴스 수집 URL 색인 저장 실패")
+    return len(written)
 
 
 if __name__ == "__main__":
-    log("=== 경제 뉴스 크롤링 시작 ===")
-    main()
+    from core.offline import parse_offline_day
+    day = parse_offline_day("경제 뉴스 크롤링")
+    log(f"=== 경제 뉴스 크롤링 시작{f' (오프라인 {day})' if day else ''} ===")
+    main(day)
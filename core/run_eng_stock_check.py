@@ -11,12 +11,19 @@ JS 렌더링이 필요한 소스는 제목/URL만 수집 (graceful degradation)
 """
 
 import os
-import datetime
 import time
+import datetime
 import re
+from itertools import zip_longest
+from urllib.parse import urlsplit
 
-from core.config import STOCK_NEWS_DIR, FINVIZ_HEADERS, FINVIZ_TIMEOUT
-from core.http_utils import fetch_soup, log
+from core.config import STOCK_NEWS_DIR, FINVIZ_NEWS_URL, FINVIZ_HEADERS, FINVIZ_TIMEOUT, HEDGE
+from core.http_utils import fetch_soup, map_as_completed, log
+from core.fetch_engine import get_engine
+from core.hedged_fetch import hedged_call, tracker
+from core.metrics import metrics
+from core.archive import store_records
+from core.seen_index import seen_index, apply_previous, filter_repeats, repeat_note, remember_captures
 
 
 def crawl_finviz_news():
@@ -29,10 +36,13 @@ def crawl_finviz_news():
     news_data = []
     try:
         soup = fetch_soup(
-            "https://finviz.com/news.ashx?v=3",
+            FINVIZ_NEWS_URL,
             headers=FINVIZ_HEADERS,
             timeout=FINVIZ_TIMEOUT,
+            target="#news",
+            page_type="finviz_news",
         )
+        extract_start = time.perf_counter()
 
         news_div = soup.find(id="news")
         if news_div is None:
@@ -75,6 +85,11 @@ def crawl_finviz_news():
                     if news_url and not news_url.startswith("http"):
                         finviz_url = "https://finviz.com" + news_url
                         news_url = finviz_url
+                    else:
+                        # 외부 기사라도 href 가 finviz 래퍼(/news/...)면 fallback/헤지용으로 보관
+                        href = anchors[0].get("href", "")
+                        if href.startswith("/news/"):
+                            finviz_url = "https://finviz.com" + href
 
                     news_title = anchors[0].get_text(strip=True)
 
@@ -101,6 +116,7 @@ def crawl_finviz_news():
                 except Exception:
                     continue
 
+        metrics.record_stage("extract", "finviz_news", time.perf_counter() - extract_start)
         log(f"  finviz {len(news_data)}개 수집")
 
     except Exception as e:
@@ -117,7 +133,10 @@ def _fetch_from_finviz_page(url):
         (time_str, body_str) or (None, None) if parsing fails
     """
     try:
-        soup = fetch_soup(url, headers=FINVIZ_HEADERS, timeout=FINVIZ_TIMEOUT, delay=1)
+        soup = fetch_soup(
+            url, headers=FINVIZ_HEADERS, timeout=FINVIZ_TIMEOUT,
+            target=".news-content", page_type="finviz_article",
+        )
         nc = soup.find(class_="news-content")
         if nc is None:
             return None, None
@@ -156,36 +175,19 @@ def _fetch_from_finviz_page(url):
         return None, None
 
 
-def fetch_article_detail(data):
+def _fetch_from_source(url):
     """
-    개별 뉴스 소스에 따라 기사 상세(시간, 본문)를 추출.
-
-    finviz 내부 URL은 finviz 페이지에서 직접 파싱.
-    외부 URL은 해당 소스 사이트에서 파싱 시도 후,
-    실패하면 finviz 내부 페이지로 fallback.
-
-    Args:
-        data: dict with 'url' key
+    외부 소스 사이트(Yahoo, PR Newswire 등)에서 기사 시간/본문을 추출.
 
     Returns:
-        (time_str, body_str)
+        (time_str, body_str) — 실패하거나 지원하지 않는 소스면 빈 문자열
     """
-    url = data.get("url", "")
     article_time = ""
     article_body = ""
 
     try:
-        # finviz 내부 뉴스 페이지 (finviz.com/news/...)
-        if "finviz.com/news/" in url:
-            t, b = _fetch_from_finviz_page(url)
-            if t:
-                article_time = t
-            if b:
-                article_body = b
-            return article_time, article_body
-
         if "finance.yahoo.com" in url:
-            soup = fetch_soup(url, delay=1)
+            soup = fetch_soup(url)
 
             time_el = soup.find(class_="byline-attr-meta-time")
             if time_el:
@@ -205,7 +207,7 @@ def fetch_article_detail(data):
                             article_body = first_p[:300] + "..." if len(first_p) > 300 else first_p
 
         elif "www.prnewswire.co.uk" in url or "www.prnewswire.com" in url:
-            soup = fetch_soup(url, delay=1)
+            soup = fetch_soup(url)
 
             time_el = soup.find(class_="mb-no")
             if time_el:
@@ -221,7 +223,7 @@ def fetch_article_detail(data):
                         article_body = text[:300] + "..." if len(text) > 300 else text
 
         elif "www.businesswire.com" in url:
-            soup = fetch_soup(url, delay=1)
+            soup = fetch_soup(url)
 
             story = soup.find(class_="bw-release-story")
             if story:
@@ -231,7 +233,7 @@ def fetch_article_detail(data):
                     article_body = text[:300] + "..." if len(text) > 300 else text
 
         elif "www.globenewswire.com" in url:
-            soup = fetch_soup(url, delay=1)
+            soup = fetch_soup(url)
 
             time_el = soup.find(class_="article-published-source")
             if time_el:
@@ -245,7 +247,7 @@ def fetch_article_detail(data):
                     article_body = text[:300] + "..." if len(text) > 300 else text
 
         elif "www.investopedia.com" in url:
-            soup = fetch_soup(url, delay=1)
+            soup = fetch_soup(url)
 
             time_el = soup.find(class_="mntl-attribution__item-date")
             if time_el:
@@ -259,7 +261,7 @@ def fetch_article_detail(data):
                     article_body = text[:300] + "..." if len(text) > 300 else text
 
         elif "www.newsfilecorp.com" in url:
-            soup = fetch_soup(url, delay=1)
+            soup = fetch_soup(url)
 
             release_el = soup.find(id="release")
             if release_el:
@@ -279,29 +281,134 @@ def fetch_article_detail(data):
     except Exception:
         pass
 
+    return article_time, article_body
+
+
+def _finviz_detail(finviz_url):
+    """_fetch_from_finviz_page 결과를 (time_str, body_str) 빈 문자열 형태로 정리."""
+    t, b = _fetch_from_finviz_page(finviz_url)
+    return t or "", b or ""
+
+
+def _has_body(detail):
+    return bool(detail and detail[1])
+
+
+def fetch_article_detail(data):
+    """
+    개별 뉴스 소스에 따라 기사 상세(시간, 본문)를 추출.
+
+    finviz 내부 URL은 finviz 페이지에서 직접 파싱.
+    외부 URL은 해당 소스 사이트에서 파싱 시도 후,
+    실패하면 finviz 내부 페이지로 fallback.
+    헤지 모드(config.json 의 hedge)에서는 외부 소스가 소스별 지연 백분위보다 늦으면
+    finviz 페이지를 병렬로 요청해 먼저 본문을 돌려준 쪽을 쓴다.
+
+    Args:
+        data: dict with 'url' key
+
+    Returns:
+        (time_str, body_str)
+    """
+    url = data.get("url", "")
+    finviz_url = data.get("finviz_url", "")
+
+    # finviz 내부 뉴스 페이지 (finviz.com/news/...)
+    if "finviz.com/news/" in url:
+        return _finviz_detail(url)
+
+    if finviz_url and HEDGE.get("enabled"):
+        winner, detail, other = hedged_call(
+            lambda: _fetch_from_source(url),
+            lambda: _finviz_detail(finviz_url),
+            source=urlsplit(url).hostname or "",
+            hedge_source="finviz.com",
+            usable=_has_body,
+            hedge_url=finviz_url,
+        )
+        primary = detail if winner == "primary" else other
+        hedge = other if winner == "primary" else detail
+        primary_time, primary_body = primary or ("", "")
+        hedge_time, hedge_body = hedge or ("", "")
+        return primary_time or hedge_time, primary_body or hedge_body
+
+    article_time, article_body = _fetch_from_source(url)
+
     # 외부 소스에서 본문을 못 가져온 경우, finviz 내부 페이지로 fallback
-    if not article_body:
-        finviz_url = data.get("finviz_url", "")
-        if finviz_url:
-            t, b = _fetch_from_finviz_page(finviz_url)
-            if t and not article_time:
-                article_time = t
-            if b:
-                article_body = b
+    if not article_body and finviz_url:
+        with get_engine().host_slot(finviz_url):
+            t, b = _finviz_detail(finviz_url)
+        if t and not article_time:
+            article_time = t
+        if b:
+            article_body = b
 
     return article_time, article_body
 
 
-def main():
+def fetch_all_details(news_data):
+    """
+    모든 뉴스의 기사 상세를 대상 도메인별로 묶어 동시에 수집하고 time/body 를 채운다.
+
+    도메인마다 host_concurrency / rate_limits(config.json) 설정이 따로 적용되므로,
+    느리거나 요청을 제한하는 소스(Yahoo, Investopedia)가 PR Newswire·GlobeNewswire 를 막지 않는다.
+    도메인별로 번갈아 제출해 모든 도메인이 처음부터 함께 진행되게 한다.
+    이전 날 수집해 아카이브에 남은 기사(archived)는 요청하지 않고 저장된 시각/본문을 쓴다.
+    """
+    reused = [data for data in news_data if data.get("archived")]
+    for data in reused:
+        data["time"] = data["archived"]["published"] or ""
+        data["body"] = data["archived"]["body"] or ""
+    seen_index.count(reused=len(reused))
+
+    groups = {}
+    for data in news_data:
+        if data.get("archived"):
+            continue
+        domain = urlsplit(data.get("url", "")).hostname or ""
+        groups.setdefault(domain, []).append(data)
+
+    interleaved = [
+        data
+        for round_items in zip_longest(*groups.values())
+        for data in round_items
+        if data is not None
+    ]
+
+    results = map_as_completed(
+        fetch_article_detail, interleaved, url_of=lambda data: data.get("url", ""),
+    )
+    for data, detail, error in results:
+        article_time, article_body = detail if error is None else ("", "")
+        data["time"] = article_time
+        data["body"] = article_body
+
+    for domain, items in sorted(groups.items(), key=lambda kv: -len(kv[1])):
+        with_body = sum(1 for data in items if data["body"])
+        log(f"  [{domain or '(없음)'}] {len(items)}개 (본문 {with_body}개)")
+    if reused:
+        log(f"  [이전 수집] {len(reused)}개 (아카이브 재사용)")
+
+    for source, stat in tracker.stats().items():
+        if stat["hedge"]:
+            log(f"  [헤지] {source}: 주 요청 {stat['primary']}승 / finviz {stat['hedge']}승"
+                f" (p90 {stat['p90'] or 0:.1f}초)")
+
+
+def main(day=None):
     """
     영문 주식 뉴스 크롤링 메인 함수.
 
+    Args:
+        day: 수집일 "YYYY-MM-DD" (기본: 오늘). 오프라인 재추출(core.offline)에서 그날 스냅샷으로 다시 만들 때 지정
+
     Returns:
         int: 수집된 총 뉴스 수
     """
-    today = datetime.datetime.today().strftime('%Y-%m-%d')
-    year = datetime.datetime.today().strftime('%Y')
-    month = datetime.datetime.today().strftime('%m')
+    run_date = datetime.datetime.strptime(day, '%Y-%m-%d') if day else datetime.datetime.today()
+    today = run_date.strftime('%Y-%m-%d')
+    year = run_date.strftime('%Y')
+    month = run_date.strftime('%m')
 
     base_dir = STOCK_NEWS_DIR
     directory = os.path.join(base_dir, year, month)
@@ -310,7 +417,8 @@ def main():
     file_path = os.path.join(directory, f'{today}_Stock_News.txt')
 
     # 1) finviz 뉴스 목록 수집
-    news_data = crawl_finviz_news()
+    with metrics.phase("stock", "finviz_list"):
+        news_data = crawl_finviz_news()
 
     if not news_data:
         log("  ✗ 수집된 뉴스가 없습니다.")
@@ -318,28 +426,46 @@ def main():
             file.write(f"=== {today} Latest 30 Stock News ===\n\n수집된 뉴스가 없습니다.\n")
         return 0
 
-    # 2) 각 뉴스의 상세 정보 수집
-    for data in news_data:
-        article_time, article_body = fetch_article_detail(data)
-        data["time"] = article_time
-        data["body"] = article_body
+    # 2) 각 뉴스의 상세 정보 수집 (도메인별 동시 수집, 이전 날 수집한 기사는 아카이브 값 재사용)
+    with metrics.phase("stock", "details"):
+        apply_previous(news_data, today)
+        fetch_all_details(news_data)
+
+    written = filter_repeats(news_data)
 
     # 3) 파일 작성
-    with open(file_path, 'w', encoding='utf-8') as file:
+    with metrics.phase("stock", "write"), open(file_path, 'w', encoding='utf-8') as file:
         file.write(f"=== {today} Latest 30 Stock News ===\n\n\n")
-        for data in news_data:
+        for data in written:
             file.write(f"Title: {data['title']}\n")
             file.write(f"Press: {data['press']}\n")
             file.write(f"Labels: {', '.join(data['labels'])}\n")
             file.write(f"Date: {data['time']}\n")
             file.write(f"Content: {data['body']}\n")
+            file.write(repeat_note(data, label="Seen"))
             file.write(f"Link: {data['url']}\n\n")
             file.write("=" * 50 + "\n\n")
 
-    log(f"  ✓ 주식 뉴스 {len(news_data)}개 → {file_path}")
-    return len(news_data)
+    log(f"  ✓ 주식 뉴스 {len(written)}개 → {file_path}")
+
+    with metrics.phase("stock", "archive"):
+        stored = store_records("stock", today, [
+            {
+                "title": data["title"], "body": data["body"], "press": data["press"],
+                "url": data["url"], "published": data["time"], "labels": data["labels"],
+            }
+            for data in written
+        ])
+        remembered = remember_captures([data["url"] for data in news_data], today)
+    if stored is None:
+        log("  ⚠ 주식 뉴스 아카이브 저장 실패")
+    if not remembered:
+        log("  ⚠ 주식 뉴스 수집 URL 색인 저장 실패")
+    return len(written)
 
 
 if __name__ == "__main__":
-    log("=== 영문 주식 뉴스 크롤링 시작 ===")
-    main()
+    from core.offline import parse_offline_day
+    day = parse_offline_day("영문 주식 뉴스 크롤링")
+    log(f"=== 영문 주식 뉴스 크롤링 시작{f' (오프라인 {day})' if day else ''} ===")
+    main(day)
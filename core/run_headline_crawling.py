@@ -7,14 +7,18 @@ Selenium/ChromeDriver 없이 동작.
 """
 
 import os
-import datetime
 import time
+import datetime
 
 from core.config import (
-    HEADLINES_DIR, NAVER_SECTIONS, SECTION_CRAWL_DELAY,
+    HEADLINES_DIR, NAVER_SECTIONS, SECTION_CONCURRENCY,
     find_with_fallback, find_all_with_fallback,
 )
-from core.http_utils import fetch_soup, fetch_article_dates, log
+from core.http_utils import fetch_soup, enrich_article_dates, map_ordered, log
+from core.fetch_engine import PRIORITY_LIST
+from core.metrics import metrics
+from core.archive import store_records
+from core.seen_index import apply_previous, filter_repeats, repeat_note, remember_captures
 
 
 def crawl_section_headlines(section_name, section_url):
@@ -26,7 +30,8 @@ def crawl_section_headlines(section_name, section_url):
     """
     results = []
     try:
-        soup = fetch_soup(section_url)
+        soup = fetch_soup(section_url, target=".as_section_headline", page_type="naver_section")
+        extract_start = time.perf_counter()
 
         headline_section = find_with_fallback(soup, "headline_section")
         if headline_section is None:
@@ -66,6 +71,7 @@ def crawl_section_headlines(section_name, section_url):
             except Exception:
                 continue
 
+        metrics.record_stage("extract", "naver_section", time.perf_counter() - extract_start)
         log(f"  [{section_name:6s}] {len(results)}개 수집")
 
     except Exception as e:
@@ -74,35 +80,54 @@ def crawl_section_headlines(section_name, section_url):
     return results
 
 
-def main():
+def main(day=None):
     """
     헤드라인 크롤링 메인 함수.
 
+    Args:
+        day: 수집일 "YYYY-MM-DD" (기본: 오늘). 오프라인 재추출(core.offline)에서 그날 스냅샷으로 다시 만들 때 지정
+
     Returns:
         int: 수집된 총 헤드라인 수
     """
-    today = datetime.datetime.today().strftime('%Y-%m-%d')
-    year = datetime.datetime.today().strftime('%Y')
-    month = datetime.datetime.today().strftime('%m')
+    run_date = datetime.datetime.strptime(day, '%Y-%m-%d') if day else datetime.datetime.today()
+    today = run_date.strftime('%Y-%m-%d')
+    year = run_date.strftime('%Y')
+    month = run_date.strftime('%m')
 
     directory = os.path.join(HEADLINES_DIR, year, month)
     os.makedirs(directory, exist_ok=True)
 
     headline_file_path = os.path.join(directory, f'{today}_헤드라인_모음.txt')
 
-    # 모든 섹션의 헤드라인 수집
+    # 모든 섹션의 헤드라인 동시 수집 → NAVER_SECTIONS 순서대로 병합
+    sections = list(NAVER_SECTIONS.items())
+    with metrics.phase("headline", "sections"):
+        section_results = map_ordered(
+            lambda section: crawl_section_headlines(*section),
+            sections,
+            url_of=lambda section: section[1],
+            limit=SECTION_CONCURRENCY,
+            priority=PRIORITY_LIST,
+        )
+
     all_headlines = []
-    section_names = []
+    for headlines in section_results:
+        all_headlines.extend(headlines)
+
+    # 기사 상세(작성일/수정일) 동시 수집 → 파일은 원래 섹션 순서대로 작성
+    # (이전 날 수집한 기사는 아카이브에 남은 작성일/수정일 재사용)
+    with metrics.phase("headline", "article_dates"):
+        repeats = apply_previous(all_headlines, today)
+        enrich_article_dates(all_headlines)
+    if repeats:
+        log(f"  [이전 수집] {repeats}개")
 
-    for section_name, section_url in NAVER_SECTIONS.items():
-        headlines = crawl_section_headlines(section_name, section_url)
-        if headlines:
-            section_names.append(section_name)
-            all_headlines.extend(headlines)
-        time.sleep(SECTION_CRAWL_DELAY)
+    written = filter_repeats(all_headlines)
+    section_names = list(dict.fromkeys(data["tab"] for data in written))
 
     # 파일 작성
-    with open(headline_file_path, 'w', encoding='utf-8') as file:
+    with metrics.phase("headline", "write"), open(headline_file_path, 'w', encoding='utf-8') as file:
         file.write(f"=== {today} 헤드라인 모음 ===\n\n\n")
 
         file.write("목차:\n")
@@ -111,29 +136,43 @@ def main():
         file.write("\n\n")
 
         current_tab = None
-        for data in all_headlines:
+        for data in written:
             if current_tab != data['tab']:
                 current_tab = data['tab']
                 file.write(f"=== {current_tab} ===\n\n")
 
-            published_date, modified_date = None, None
-            if data["url"]:
-                published_date, modified_date = fetch_article_dates(data["url"])
-
             file.write(f"제목: {data['headline']}\n")
             file.write(f"내용: {data['summary']}\n")
             file.write(f"언론사: {data['press']}\n")
-            if published_date:
-                file.write(f"작성일: {published_date}\n")
-            if modified_date:
-                file.write(f"수정일: {modified_date}\n")
+            if data["published_date"]:
+                file.write(f"작성일: {data['published_date']}\n")
+            if data["modified_date"]:
+                file.write(f"수정일: {data['modified_date']}\n")
+            file.write(repeat_note(data))
             file.write(f"링크: {data['url']}\n\n")
             file.write("=" * 50 + "\n\n")
 
-    log(f"  ✓ 헤드라인 {len(all_headlines)}개 → {headline_file_path}")
-    return len(all_headlines)
+    log(f"  ✓ 헤드라인 {len(written)}개 → {headline_file_path}")
+
+    with metrics.phase("headline", "archive"):
+        stored = store_records("headline", today, [
+            {
+                "category": data["tab"], "title": data["headline"], "summary": data["summary"],
+                "press": data["press"], "url": data["url"],
+                "published": data["published_date"], "modified": data["modified_date"],
+            }
+            for data in written
+        ])
+        remembered = remember_captures([data["url"] for data in all_headlines], today)
+    if stored is None:
+        log("  ⚠ 헤드라인 아카이브 저장 실패")
+    if not remembered:
+        log("  ⚠ 헤드라인 수집 URL 색인 저장 실패")
+    return len(written)
 
 
 if __name__ == "__main__":
-    log("=== 헤드라인 크롤링 시작 ===")
-    main()
+    from core.offline import parse_offline_day
+    day = parse_offline_day("헤드라인 크롤링")
+    log(f"=== 헤드라인 크롤링 시작{f' (오프라인 {day})' if day else ''} ===")
+    main(day)
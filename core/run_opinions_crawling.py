@@ -10,60 +10,133 @@ Selenium/ChromeDriver 없이 동작.
 
 import os
 import datetime
-import time
+from concurrent.futures import as_completed
 
 from core.config import (
-    OPINIONS_DIR, TARGET_PRESS,
-    EDITORIAL_LIST_DELAY, EDITORIAL_DETAIL_DELAY,
+    OPINIONS_DIR, TARGET_PRESS, EDITORIAL_CONCURRENCY,
     find_with_fallback,
 )
-from core.http_utils import fetch_soup, log
+from core.http_utils import fetch_soup, parse_article_dates, log
+from core.article_memo import article_memo
+from core.fetch_engine import get_engine, PRIORITY_LIST
+from core.metrics import metrics
+from core.archive import store_records
+from core.seen_index import seen_index, previous_captures, repeat_note, remember_captures, REPEATS
 
 
-def fetch_editorial_list():
+def editorial_list_url(office_id, date_str):
+    """언론사(officeId)의 해당 날짜(YYYYMMDD) 사설 목록 페이지 URL."""
+    return (
+        f"https://news.naver.com/opinion/editorial"
+        f"?officeId={office_id}&date={date_str}"
+    )
+
+
+def fetch_press_editorial_list(press_name, office_id, date_str):
     """
-    대상 언론사별로 사설 페이지를 요청하여 사설 목록을 수집.
+    한 언론사의 사설 페이지를 요청하여 사설 URL 목록을 수집.
 
     Returns:
-        list of (url, press_name)
+        list of url (실패 시 빈 리스트)
     """
-    editorial_urls = []
-    today_str = datetime.datetime.today().strftime('%Y%m%d')
-
-    for press_name, office_id in TARGET_PRESS.items():
-        try:
-            url = (
-                f"https://news.naver.com/opinion/editorial"
-                f"?officeId={office_id}&date={today_str}"
-            )
-            soup = fetch_soup(url)
-
-            editorial_list = find_with_fallback(soup, "editorial_list")
-            if editorial_list is None:
-                log(f"  [{press_name}] 사설 목록을 찾을 수 없습니다.")
+    urls = []
+    try:
+        soup = fetch_soup(editorial_list_url(office_id, date_str), page_type="editorial_list")
+
+        editorial_list = find_with_fallback(soup, "editorial_list")
+        if editorial_list is None:
+            log(f"  [{press_name}] 사설 목록을 찾을 수 없습니다.")
+            return urls
+
+        items = editorial_list.find_all(class_="opinion_editorial_item")
+        for item in items:
+            try:
+                link_el = item.find("a", href=True)
+                if link_el:
+                    href = link_el.get("href", "")
+                    if href and not href.startswith("http"):
+                        href = "https://news.naver.com" + href
+                    urls.append(href)
+            except Exception:
                 continue
 
-            items = editorial_list.find_all(class_="opinion_editorial_item")
-            count = 0
-            for item in items:
-                try:
-                    link_el = item.find("a", href=True)
-                    if link_el:
-                        href = link_el.get("href", "")
-                        if href and not href.startswith("http"):
-                            href = "https://news.naver.com" + href
-                        editorial_urls.append((href, press_name))
-                        count += 1
-                except Exception:
-                    continue
+        log(f"  [{press_name:10s}] {len(urls)}개 수집")
 
-            log(f"  [{press_name:10s}] {count}개 수집")
-            time.sleep(EDITORIAL_LIST_DELAY)
+    except Exception as e:
+        log(f"  [{press_name}] 사설 수집 실패: {e}")
+
+    return urls
 
-        except Exception as e:
-            log(f"  [{press_name}] 사설 수집 실패: {e}")
 
-    return editorial_urls
+def crawl_editorials(date_str):
+    """
+    대상 언론사별 사설 목록 수집과 사설 상세 수집을 파이프라인으로 진행.
+
+    언론사 목록 요청을 모두 동시에 보내고, 목록 하나가 도착하는 즉시 그 사설들의
+    상세 요청을 제출한다 (다른 언론사 목록이 아직 오는 중이어도 상세 수집이 시작됨).
+    상세 요청은 editorial_concurrency 개까지만 동시에 진행된다.
+    결과는 TARGET_PRESS 순서대로 다시 모으고, 중복 URL 은 처음 나온 것만 남긴다.
+    이전 날 수집해 아카이브에 남은 사설은 상세를 요청하지 않고 저장된 제목/날짜/본문을 쓴다
+    (content 의 seen_day 에 처음 수집일).
+
+    Returns:
+        list of (url, press_name, content) — content 는 fetch_editorial_content 결과
+    """
+    engine = get_engine()
+    presses = list(TARGET_PRESS.items())
+    today = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}"
+
+    list_futures = {
+        engine.submit(
+            editorial_list_url(office_id, date_str),
+            fetch_press_editorial_list, press_name, office_id, date_str,
+            priority=PRIORITY_LIST,
+        ): idx
+        for idx, (press_name, office_id) in enumerate(presses)
+    }
+
+    detail_limit = engine.batch_limit(EDITORIAL_CONCURRENCY)
+    detail_futures = {}
+    reused = {}
+    previous = {}
+    press_urls = [[] for _ in presses]
+
+    for future in as_completed(list_futures):
+        idx = list_futures[future]
+        press_urls[idx] = future.result()
+        previous.update(previous_captures(press_urls[idx], today))
+        for url in press_urls[idx]:
+            if url in detail_futures or url in reused:
+                continue
+            archived = previous.get(url, {}).get("archived")
+            if archived:
+                reused[url] = {
+                    "title": archived["title"],
+                    "published_date": archived["published"],
+                    "modified_date": archived["modified"],
+                    "body": archived["body"] or "",
+                }
+            else:
+                detail_futures[url] = engine.submit_in_batch(
+                    detail_limit, url, fetch_editorial_content, url,
+                )
+    seen_index.count(reused=len(reused))
+    if reused:
+        log(f"  [이전 수집] {len(reused)}개 (아카이브 재사용)")
+
+    editorials = []
+    seen_urls = set()
+    for (press_name, _), urls in zip(presses, press_urls):
+        for url in urls:
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+            content = reused[url] if url in reused else detail_futures[url].result()
+            if content is not None:
+                content["seen_day"] = previous[url]["day"] if url in previous else None
+            editorials.append((url, press_name, content))
+
+    return editorials
 
 
 def fetch_editorial_content(url):
@@ -74,24 +147,17 @@ def fetch_editorial_content(url):
         dict or None
     """
     try:
-        soup = fetch_soup(url, delay=EDITORIAL_DETAIL_DELAY)
-
-        title_el = soup.find(class_="media_end_head_headline")
-        title = title_el.get_text(strip=True) if title_el else ""
+        soup = fetch_soup(url, page_type="editorial_article")
 
-        date_elements = soup.find_all(class_="media_end_head_info_datestamp_time")
-        published_date = None
-        modified_date = None
+        with metrics.stage("extract", "editorial_article"):
+            title_el = soup.find(class_="media_end_head_headline")
+            title = title_el.get_text(strip=True) if title_el else ""
 
-        if len(date_elements) >= 1:
-            published_date = date_elements[0].get_text(strip=True)
-        if len(date_elements) >= 2:
-            mod_el = soup.find(class_="_ARTICLE_MODIFY_DATE_TIME")
-            if mod_el:
-                modified_date = mod_el.get_text(strip=True)
+            published_date, modified_date = parse_article_dates(soup)
+            article_memo.put(url, (published_date, modified_date))
 
-        body_el = find_with_fallback(soup, "article_body")
-        body = body_el.get_text(strip=True) if body_el else ""
+            body_el = find_with_fallback(soup, "article_body")
+            body = body_el.get_text(strip=True) if body_el else ""
 
         return {
             "title": title,
@@ -105,46 +171,47 @@ def fetch_editorial_content(url):
         return None
 
 
-def main():
+def main(day=None):
     """
     사설 크롤링 메인 함수.
 
+    Args:
+        day: 수집일 "YYYY-MM-DD" (기본: 오늘). 오프라인 재추출(core.offline)에서 그날 스냅샷으로 다시 만들 때 지정
+
     Returns:
         int: 수집된 총 사설 수
     """
-    today = datetime.datetime.today().strftime('%Y-%m-%d')
-    year = datetime.datetime.today().strftime('%Y')
-    month = datetime.datetime.today().strftime('%m')
+    run_date = datetime.datetime.strptime(day, '%Y-%m-%d') if day else datetime.datetime.today()
+    today = run_date.strftime('%Y-%m-%d')
+    year = run_date.strftime('%Y')
+    month = run_date.strftime('%m')
 
     directory = os.path.join(OPINIONS_DIR, year, month)
     os.makedirs(directory, exist_ok=True)
 
     opinion_file_path = os.path.join(directory, f'{today}_사설 모음.txt')
 
-    # 1) 대상 언론사별 사설 목록 수집
-    editorial_urls = fetch_editorial_list()
+    # 1) 대상 언론사별 사설 목록 + 상세 수집 (파이프라인, 중복 제거)
+    with metrics.phase("opinions", "editorials"):
+        editorials = crawl_editorials(run_date.strftime('%Y%m%d'))
 
-    # 중복 제거
-    seen_urls = set()
-    unique_urls = []
-    for url, press in editorial_urls:
-        if url not in seen_urls:
-            unique_urls.append((url, press))
-            seen_urls.add(url)
-    editorial_urls = unique_urls
-
-    if not editorial_urls:
+    if not editorials:
         log("  ✗ 수집된 사설이 없습니다.")
         with open(opinion_file_path, 'w', encoding='utf-8') as file:
             file.write(f"=== {today} 사설 모음 ===\n\n수집된 사설이 없습니다.\n")
         return 0
 
-    # 2) 각 사설 상세 수집 및 파일 작성
-    with open(opinion_file_path, 'w', encoding='utf-8') as file:
+    written = [
+        (url, press_name, content)
+        for url, press_name, content in editorials
+        if not (REPEATS == "drop" and content is not None and content["seen_day"])
+    ]
+
+    # 2) 언론사 순서대로 파일 작성
+    with metrics.phase("opinions", "write"), open(opinion_file_path, 'w', encoding='utf-8') as file:
         file.write(f"=== {today} 사설 모음 ===\n\n\n")
 
-        for idx, (url, press_name) in enumerate(editorial_urls):
-            content = fetch_editorial_content(url)
+        for url, press_name, content in written:
             if content is None:
                 file.write(f"사설 수집 실패: {url}\n\n")
                 continue
@@ -155,14 +222,35 @@ def main():
                 file.write(f"작성일: {content['published_date']}\n")
             if content['modified_date']:
                 file.write(f"수정일: {content['modified_date']}\n")
+            file.write(repeat_note(content))
             file.write(f"링크: {url}\n\n")
             file.write(f"내용:\n{content['body']}\n\n")
             file.write("=" * 50 + "\n\n")
 
-    log(f"  ✓ 사설 {len(editorial_urls)}개 → {opinion_file_path}")
-    return len(editorial_urls)
+    log(f"  ✓ 사설 {len(written)}개 → {opinion_file_path}")
+
+    with metrics.phase("opinions", "archive"):
+        stored = store_records("opinion", today, [
+            {
+                "category": "사설", "title": content["title"], "body": content["body"],
+                "press": press_name, "url": url,
+                "published": content["published_date"], "modified": content["modified_date"],
+            }
+            for url, press_name, content in written
+            if content is not None
+        ])
+        remembered = remember_captures(
+            [url for url, _, content in editorials if content is not None], today,
+        )
+    if stored is None:
+        log("  ⚠ 사설 아카이브 저장 실패")
+    if not remembered:
+        log("  ⚠ 사설 수집 URL 색인 저장 실패")
+    return len(written)
 
 
 if __name__ == "__main__":
-    log("=== 사설 크롤링 시작 ===")
-    main()
+    from core.offline import parse_offline_day
+    day = parse_offline_day("사설 크롤링")
+    log(f"=== 사설 크롤링 시작{f' (오프라인 {day})' if day else ''} ===")
+    main(day)
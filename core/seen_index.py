@@ -0,0 +1,262 @@
+"""
+이전 날 수집한 기사 URL 색인 (증분 수집).
+
+네이버 헤드라인·경제 뉴스와 finviz 뉴스는 전날 목록이 상당 부분 그대로 남아 있어,
+매일 어제 받은 기사 상세 페이지를 다시 받게 된다. 이 색인은 수집한 기사 URL 을
+NEWS_DIR/cache/seen_urls.bin 에 남겨, 다음 날부터는 상세 수집 전에 "이전에 수집한 기사"를 가려낸다.
+
+- 파일 형식: 정규화 URL(article_memo.canonical_url) 의 64비트 해시를 정렬한 배열 +
+  처음/마지막 수집일(date ordinal) 배열. 항목당 16바이트라 몇 년 치(수십만 URL)도 수 MB 이고,
+  조회는 이진 탐색(bisect)이다. retention_days 동안 다시 나오지 않은 URL 은 저장할 때 지운다.
+- 이전 수집 기사의 상세(작성일/수정일, 주식 뉴스 시각/본문, 사설 제목/본문)는 기사 아카이브
+  (core.archive) 에 남아 있으면 그 값을 재사용하고 요청하지 않는다. 아카이브에 없으면 평소처럼 받는다.
+- repeats 설정: "keep" 평소대로 기록 (기본, 파일 내용이 색인이 없을 때와 같다) / "mark" 파일에 이전 수집일 표시
+  / "drop" 그날 파일에서 제외.
+- 같은 날 다시 실행하면 오늘 수집한 URL 은 "이전 수집"으로 보지 않는다.
+- 여러 프로세스가 함께 기록한다: 기록할 때마다 잠금 파일(seen_urls.bin.lock)을 잡고 파일을 다시 읽어 합친다
+  (core.file_lock). 손상된 파일은 seen_urls.bin.corrupt 로 옮겨 두고 빈 색인으로 다시 시작한다.
+"""
+
+import os
+import sys
+import bisect
+import sqlite3
+import hashlib
+import datetime
+import threading
+from array import array
+
+from core.config import SEEN_INDEX, SEEN_INDEX_PATH
+from core.article_memo import canonical_url
+from core.archive import get_archive
+from core.file_lock import locked, write_atomic
+from core.logging_utils import log
+
+
+_MAGIC = b"DGSEEN01"
+REPEAT_MODES = ("keep", "mark", "drop")
+
+
+def url_hash(url):
+    """정규화 URL 의 64비트 해시."""
+    digest = hashlib.blake2b(canonical_url(url).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _ordinal(day):
+    return datetime.date.fromisoformat(day).toordinal()
+
+
+class SeenIndex:
+    """정렬된 URL 해시 파일. 스레드 안전하며, 처음 조회할 때 파일을 읽는다.
+
+    기록(remember)은 잠금 파일로 다른 프로세스와 차례를 맞춘다. 파일은 통째로 바꿔 끼우므로
+    조회는 잠금 없이 읽어도 반쯤 쓴 파일을 보지 않는다.
+    """
+
+    def __init__(self, path, retention_days=730):
+        self.path = path
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._hashes = array("Q")
+        self._first = array("I")
+        self._last = array("I")
+        self._counters = {"repeats": 0, "reused": 0}
+        self.read_only = False  # 오프라인 재추출: 조회만 하고 기록하지 않음 (이미 그날 기록됨)
+
+    # ── 파일 ──
+
+    def _read(self):
+        """파일을 읽어 (hashes, first, last). 없으면 빈 배열, 형식이 맞지 않으면 ValueError."""
+        hashes, first, last = array("Q"), array("I"), array("I")
+        try:
+            f = open(self.path, "rb")
+        except FileNotFoundError:
+            return hashes, first, last
+        with f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError("파일 형식이 아님")
+            count = int.from_bytes(f.read(4), "little")
+            try:
+                for values in (hashes, first, last):
+                    values.fromfile(f, count)
+            except EOFError:
+                raise ValueError("파일이 잘림") from None
+        if sys.byteorder != "little":
+            for values in (hashes, first, last):
+                values.byteswap()
+        return hashes, first, last
+
+    def _load_locked(self, repair=False):
+        """파일을 다시 읽는다. 손상된 파일은 경고를 남기고 빈 색인으로 시작한다.
+
+        repair 면 (잠금 파일을 잡고 기록하기 직전) 손상된 파일을 {path}.corrupt 로 옮겨 두어
+        다음 저장이 그 내용을 말없이 덮어쓰지 않게 하고, 읽기 오류(OSError)는 그대로 던진다.
+        """
+        try:
+            self._hashes, self._first, self._last = self._read()
+        except OSError as e:
+            if repair:
+                raise
+            log(f"⚠ 이전 수집 URL 색인을 읽지 못함 ({self.path}): {e} → 빈 색인으로 조회")
+            self._hashes, self._first, self._last = array("Q"), array("I"), array("I")
+        except ValueError as e:
+            log(f"⚠ 이전 수집 URL 색인이 손상됨 ({self.path}): {e} → 빈 색인으로 시작")
+            self._hashes, self._first, self._last = array("Q"), array("I"), array("I")
+            if repair:
+                os.replace(self.path, f"{self.path}.corrupt")
+                log(f"  손상된 색인 파일을 {self.path}.corrupt 로 옮김")
+        self._loaded = True
+
+    def _ensure_loaded(self):
+        with self._lock:
+            if not self._loaded:
+                self._load_locked()
+
+    def _save_locked(self):
+        parts = [_MAGIC, len(self._hashes).to_bytes(4, "little")]
+        for values in (self._hashes, self._first, self._last):
+            if sys.byteorder != "little":
+                values = array(values.typecode, values)
+                values.byteswap()
+            parts.append(values.tobytes())
+        write_atomic(self.path, b"".join(parts))
+
+    # ── 조회 / 기록 ──
+
+    def first_seen(self, url, today):
+        """today 이전에 수집한 URL 이면 처음 수집일(YYYY-MM-DD), 아니면 None."""
+        self._ensure_loaded()
+        key = url_hash(url)
+        with self._lock:
+            idx = bisect.bisect_left(self._hashes, key)
+            if idx < len(self._hashes) and self._hashes[idx] == key:
+                if self._first[idx] < _ordinal(today):
+                    return datetime.date.fromordinal(self._first[idx]).isoformat()
+        return None
+
+    def remember(self, urls, today):
+        """오늘 수집한 URL 들을 기록하고 파일에 저장. 오래된 항목은 이때 지운다.
+
+        여러 크롤러 프로세스가 동시에 기록하므로 잠금 파일({path}.lock)을 잡고
+        그 안에서 파일을 다시 읽은 뒤 합친다.
+        """
+        day = _ordinal(today)
+        keys = sorted({url_hash(url) for url in urls if url})
+        with self._lock, locked(f"{self.path}.lock"):
+            self._load_locked(repair=True)
+
+            new_keys = []
+            for key in keys:
+                idx = bisect.bisect_left(self._hashes, key)
+                if idx < len(self._hashes) and self._hashes[idx] == key:
+                    self._last[idx] = max(self._last[idx], day)
+                else:
+                    new_keys.append(key)
+
+            cutoff = day - self.retention_days
+            hashes = list(self._hashes) + new_keys
+            first = list(self._first) + [day] * len(new_keys)
+            last = list(self._last) + [day] * len(new_keys)
+            # 기존 배열과 새 해시는 각각 정렬되어 있어 정렬이 사실상 병합이다.
+            order = sorted(
+                (i for i in range(len(hashes)) if last[i] >= cutoff),
+                key=hashes.__getitem__,
+            )
+            self._hashes = array("Q", (hashes[i] for i in order))
+            self._first = array("I", (first[i] for i in order))
+            self._last = array("I", (last[i] for i in order))
+            self._save_locked()
+
+    def count(self, repeats=0, reused=0):
+        with self._lock:
+            self._counters["repeats"] += repeats
+            self._counters["reused"] += reused
+
+    def reset_counters(self):
+        with self._lock:
+            self._counters = {"repeats": 0, "reused": 0}
+
+    def stats(self):
+        """{"urls": 색인 URL 수, "repeats": 이전 수집 기사 수, "reused": 상세 요청을 아낀 수}"""
+        with self._lock:
+            return {"urls": len(self._hashes), **self._counters}
+
+
+seen_index = SeenIndex(SEEN_INDEX_PATH, SEEN_INDEX.get("retention_days", 730))
+REPEATS = SEEN_INDEX.get("repeats") if SEEN_INDEX.get("repeats") in REPEAT_MODES else "keep"
+
+
+# ─────────────────────────────────────────────
+# 크롤러용 함수
+# ─────────────────────────────────────────────
+
+def previous_captures(urls, today):
+    """urls 중 이전 날 수집한 URL → {"day": 처음 수집일, "archived": 아카이브 행 dict 또는 None}.
+
+    색인이 꺼져 있으면 빈 dict.
+    """
+    if not SEEN_INDEX.get("enabled"):
+        return {}
+    previous = {}
+    for url in urls:
+        if url and url not in previous:
+            day = seen_index.first_seen(url, today)
+            if day:
+                previous[url] = {"day": day, "archived": None}
+    if previous:
+        archive = get_archive()
+        if archive is not None:
+            try:
+                found = archive.latest_by_url(previous)
+            except (OSError, sqlite3.Error):
+                found = {}
+            for url, row in found.items():
+                if row["day"] < today:
+                    previous[url]["archived"] = row
+    seen_index.count(repeats=len(previous))
+    return previous
+
+
+def apply_previous(records, today):
+    """기사 레코드마다 seen_day(이전 수집일 또는 None) 와 archived(재사용할 아카이브 행 또는 None) 를 채운다.
+
+    Returns:
+        이전 수집 기사 수
+    """
+    previous = previous_captures([record["url"] for record in records], today)
+    for record in records:
+        found = previous.get(record["url"])
+        record["seen_day"] = found["day"] if found else None
+        record["archived"] = found["archived"] if found else None
+    return sum(1 for record in records if record["seen_day"])
+
+
+def filter_repeats(records):
+    """repeats 가 "drop" 이면 이전 수집 기사를 뺀 목록, 아니면 그대로."""
+    if REPEATS != "drop":
+        return records
+    return [record for record in records if not record.get("seen_day")]
+
+
+def repeat_note(record, label="이전 수집"):
+    """repeats 가 "mark" 이고 이전 수집 기사면 파일에 덧붙일 한 줄, 아니면 빈 문자열."""
+    if REPEATS == "mark" and record.get("seen_day"):
+        return f"{label}: {record['seen_day']}\n"
+    return ""
+
+
+def remember_captures(urls, today):
+    """오늘 수집한 URL 을 색인에 기록. 실패해도 크롤링 결과에는 영향이 없다.
+
+    Returns:
+        성공하면 True
+    """
+    if not SEEN_INDEX.get("enabled") or seen_index.read_only:
+        return True
+    try:
+        seen_index.remember(urls, today)
+        return True
+    except OSError:
+        return False
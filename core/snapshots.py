@@ -0,0 +1,482 @@
+"""
+원본 HTML 스냅샷 보관소 (내용 주소 기반 + 압축).
+
+셀렉터가 깨져 수집 개수 경고(validate_count)가 나와도 그날 받은 HTML 이 남아 있지 않으면
+다음 실행까지 기다려야 고칠 수 있다. 그래서 공용 세션으로 받은 모든 응답 본문을
+NEWS_DIR/snapshots 에 남긴다.
+
+- objects/ab/<sha256>: 본문 SHA-256 이 이름인 압축 파일. 같은 본문은 날짜가 달라도 한 번만 저장한다.
+  첫 줄(헤더)에 압축 방식과 사전 이름을 적는다. zstandard 가 설치되어 있으면 zstd, 없으면 zlib.
+- manifests/YYYY-MM-DD.jsonl: 그날 실행에서 받은 URL → 해시, 응답 헤더, 받은 시각, 페이지 종류.
+  파일 이름은 실행 날짜(set_snapshot_day, daily_runner 가 실행 시작 때 정함)라서 자정을 넘겨 받은
+  응답도 그날 파일들과 같은 매니페스트에 남는다. 실행 날짜가 없으면 받은 날짜를 쓴다.
+  같은 URL 을 다시 받으면 한 줄 더 붙고, 읽을 때는 마지막 줄을 쓴다.
+- dicts/<페이지 종류>.<id>.dict: 페이지 종류별 zstd 사전 (`python -m core.snapshots train`).
+  같은 종류의 페이지는 스크립트/내비게이션이 거의 같아서 사전을 쓰면 압축률이 크게 오른다.
+  사전이 있으면 새로 저장하는 본문에 쓰고, 헤더에 사전 이름을 남겨 풀 때 같은 사전을 쓴다.
+- 쓰기는 백그라운드 스레드 하나가 한다. 크롤러는 대기열에 넣기만 하고, 대기열이 가득 차면
+  (디스크가 느린 경우) 그 페이지는 건너뛰고 수만 센다. 실행이 끝날 때 flush 로 남은 쓰기를 기다린다.
+
+Usage:
+    python -m core.snapshots stats [--day YYYY-MM-DD]
+    python -m core.snapshots train [--days 14] [--size 112640]
+    python -m core.snapshots show URL [--day YYYY-MM-DD] > page.html
+"""
+
+import io
+import os
+import re
+import sys
+import json
+import zlib
+import queue
+import atexit
+import hashlib
+import argparse
+import datetime
+import functools
+import threading
+import importlib.util
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from core.config import SNAPSHOTS, SNAPSHOT_DIR
+from core.file_lock import write_atomic
+from core.logging_utils import log
+
+
+_MAGIC = b"DGSNAP1"
+_SKIP_HEADERS = {"set-cookie"}
+# 본문은 압축을 푼 상태로 저장하므로 다시 응답을 만들 때 전송 관련 헤더는 뺀다.
+_TRANSPORT_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "connection"}
+_MIN_TRAIN_SAMPLES = 8
+
+
+@functools.lru_cache(maxsize=None)
+def _zstd():
+    """zstandard 모듈 (설치되어 있지 않으면 None)."""
+    if importlib.util.find_spec("zstandard") is None:
+        return None
+    import zstandard
+    return zstandard
+
+
+def page_kind(url):
+    """사전을 나눌 페이지 종류: 호스트 + 첫 경로 (예: n.news.naver.com/mnews, finviz.com/news)."""
+    parts = urlsplit(url)
+    host = parts.hostname or ""
+    if host.startswith("www."):
+        host = host[len("www."):]
+    segment = parts.path.strip("/").split("/", 1)[0]
+    return f"{host}/{segment}" if segment else host
+
+
+def _safe_name(kind):
+    return re.sub(r"[^0-9A-Za-z]+", "_", kind).strip("_") or "page"
+
+
+class SnapshotStore:
+    """스냅샷 보관소. submit 은 어느 스레드에서 불러도 되고, 실제 쓰기는 전용 스레드가 한다."""
+
+    def __init__(self, root, level=10, use_dicts=True, queue_size=256):
+        self.root = root
+        self.level = level
+        self.use_dicts = use_dicts
+        self.objects_dir = os.path.join(root, "objects")
+        self.manifests_dir = os.path.join(root, "manifests")
+        self.dicts_dir = os.path.join(root, "dicts")
+        self.codec = "zstd" if _zstd() is not None else "zlib"
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._counters_lock = threading.Lock()
+        self._counters = self._zero_counters()
+        self._dicts = None          # 페이지 종류 → 최신 사전 이름 (쓰기 스레드 전용)
+        self._dict_cache = {}       # 사전 이름 → 사전 바이트
+        self._compressors = {}      # 사전 이름("" = 사전 없음) → zstd 압축기 (쓰기 스레드 전용)
+        self.run_day = None         # 매니페스트 날짜 (None 이면 받은 날짜)
+
+    @staticmethod
+    def _zero_counters():
+        return {"pages": 0, "stored": 0, "deduped": 0, "dropped": 0, "errors": 0,
+                "raw_bytes": 0, "stored_bytes": 0}
+
+    def _count(self, **amounts):
+        with self._counters_lock:
+            for name, amount in amounts.items():
+                self._counters[name] += amount
+
+    def stats(self):
+        with self._counters_lock:
+            return dict(self._counters)
+
+    def reset_counters(self):
+        with self._counters_lock:
+            self._counters = self._zero_counters()
+
+    # ── 쓰기 (크롤러 스레드 → 대기열 → 쓰기 스레드) ──
+
+    def submit(self, url, response, body, partial=False):
+        """응답 하나를 저장 대기열에 넣는다. 기다리지 않으며, 대기열이 가득 차면 건너뛴다.
+
+        partial: 본문을 끝까지 받지 않은 응답 (fetch_stream 조기 종료)
+        """
+        entry = {
+            "url": url,
+            "fetched": datetime.datetime.now().replace(microsecond=0).isoformat(),
+            "kind": page_kind(url),
+            "status": response.status_code,
+            "headers": {
+                name: value for name, value in response.headers.items()
+                if name.lower() not in _SKIP_HEADERS
+            },
+        }
+        if response.url and response.url != url:
+            entry["final_url"] = response.url
+        if response.raw is None:
+            entry["cached"] = True
+        if partial:
+            entry["partial"] = True
+        day = self.run_day or entry["fetched"][:10]
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait((entry, body, day))
+        except queue.Full:
+            self._count(dropped=1)
+
+    def flush(self):
+        """대기열에 넣은 스냅샷이 모두 쓰일 때까지 기다린다."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _ensure_thread(self):
+        if self._thread is None:
+            with self._thread_lock:
+                if self._thread is None:
+                    thread = threading.Thread(target=self._run, name="snapshot-writer", daemon=True)
+                    thread.start()
+                    atexit.register(self.flush)
+                    self._thread = thread
+
+    def _run(self):
+        while True:
+            entry, body, day = self._queue.get()
+            try:
+                self._write(entry, body, day)
+            except Exception as e:
+                self._count(errors=1)
+                log(f"  ⚠ HTML 스냅샷 저장 실패 ({entry['url']}): {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, entry, body, day):
+        digest = hashlib.sha256(body).hexdigest()
+        path = self.object_path(digest)
+        if os.path.exists(path):
+            self._count(pages=1, deduped=1, raw_bytes=len(body))
+        else:
+            data = self._compress(body, entry["kind"])
+            write_atomic(path, data)
+            self._count(pages=1, stored=1, raw_bytes=len(body), stored_bytes=len(data))
+        entry["hash"] = digest
+        entry["size"] = len(body)
+        os.makedirs(self.manifests_dir, exist_ok=True)
+        with open(os.path.join(self.manifests_dir, f"{day}.jsonl"), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    # ── 압축 ──
+
+    def object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest)
+
+    def _latest_dicts(self):
+        """페이지 종류별 가장 최근에 학습한 사전 이름."""
+        latest = {}
+        try:
+            names = os.listdir(self.dicts_dir)
+        except OSError:
+            return latest
+        for name in names:
+            if not name.endswith(".dict"):
+                continue
+            safe_kind = name[:-len(".dict")].rsplit(".", 1)[0]
+            mtime = os.path.getmtime(os.path.join(self.dicts_dir, name))
+            if safe_kind not in latest or mtime > latest[safe_kind][0]:
+                latest[safe_kind] = (mtime, name[:-len(".dict")])
+        return {kind: name for kind, (_, name) in latest.items()}
+
+    def _dict_data(self, name):
+        data = self._dict_cache.get(name)
+        if data is None:
+            with open(os.path.join(self.dicts_dir, f"{name}.dict"), "rb") as f:
+                data = self._dict_cache[name] = f.read()
+        return data
+
+    def _compress(self, body, kind):
+        zstandard = _zstd() if self.codec == "zstd" else None
+        if zstandard is None:
+            return _MAGIC + b" zlib -\n" + zlib.compress(body, min(9, max(1, self.level)))
+        dict_name = ""
+        if self.use_dicts:
+            if self._dicts is None:
+                self._dicts = self._latest_dicts()
+            dict_name = self._dicts.get(_safe_name(kind), "")
+        compressor = self._compressors.get(dict_name)
+        if compressor is None:
+            dict_data = (
+                zstandard.ZstdCompressionDict(self._dict_data(dict_name)) if dict_name else None
+            )
+            compressor = zstandard.ZstdCompressor(level=self.level, dict_data=dict_data)
+            self._compressors[dict_name] = compressor
+        header = _MAGIC + f" zstd {dict_name or '-'}\n".encode("ascii")
+        return header + compressor.compress(body)
+
+    # ── 읽기 ──
+
+    def read(self, digest):
+        """해시에 해당하는 원본 본문 바이트. 없으면 FileNotFoundError."""
+        with open(self.object_path(digest), "rb") as f:
+            data = f.read()
+        header, _, payload = data.partition(b"\n")
+        magic, codec, dict_name = header.decode("ascii").split(" ")
+        if magic.encode("ascii") != _MAGIC:
+            raise ValueError(f"스냅샷 형식 오류: {digest}")
+        if codec == "zlib":
+            return zlib.decompress(payload)
+        zstandard = _zstd()
+        if zstandard is None:
+            raise RuntimeError("zstd 로 압축된 스냅샷입니다. zstandard 패키지를 설치하세요.")
+        dict_data = zstandard.ZstdCompressionDict(self._dict_data(dict_name)) if dict_name != "-" else None
+        return zstandard.ZstdDecompressor(dict_data=dict_data).decompress(payload)
+
+    def days(self):
+        """매니페스트가 있는 날짜 목록 (오래된 순)."""
+        try:
+            names = os.listdir(self.manifests_dir)
+        except OSError:
+            return []
+        return sorted(name[:-len(".jsonl")] for name in names if name.endswith(".jsonl"))
+
+    def manifest(self, day):
+        """그날 받은 {url: 항목}. 같은 URL 이 여러 번 있으면 마지막 항목."""
+        entries = {}
+        try:
+            with open(os.path.join(self.manifests_dir, f"{day}.jsonl"), "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # 쓰다 끊긴 마지막 줄
+                    entries[entry["url"]] = entry
+        except OSError:
+            pass
+        return entries
+
+    # ── 사전 학습 ──
+
+    def train(self, days=14, dict_size=112_640, max_samples=200):
+        """최근 days 일치 스냅샷으로 페이지 종류별 zstd 사전을 학습해 dicts 에 저장.
+
+        Returns:
+            {페이지 종류: 사전 이름} (표본이 모자란 종류는 빠짐)
+        """
+        zstandard = _zstd()
+        if zstandard is None:
+            raise RuntimeError("사전 학습에는 zstandard 패키지가 필요합니다.")
+        samples = {}
+        for day in self.days()[-days:]:
+            for entry in self.manifest(day).values():
+                if entry.get("partial"):
+                    continue
+                hashes = samples.setdefault(entry["kind"], {})
+                if len(hashes) < max_samples:
+                    hashes[entry["hash"]] = None
+        trained = {}
+        os.makedirs(self.dicts_dir, exist_ok=True)
+        for kind, hashes in sorted(samples.items()):
+            if len(hashes) < _MIN_TRAIN_SAMPLES:
+                continue
+            bodies = []
+            for digest in hashes:
+                try:
+                    bodies.append(self.read(digest))
+                except (OSError, ValueError):
+                    continue
+            try:
+                trained_dict = zstandard.train_dictionary(dict_size, bodies)
+            except zstandard.ZstdError as e:
+                log(f"  ⚠ {kind} 사전 학습 실패: {e}")
+                continue
+            name = f"{_safe_name(kind)}.{trained_dict.dict_id():08x}"
+            write_atomic(os.path.join(self.dicts_dir, f"{name}.dict"), trained_dict.as_bytes())
+            trained[kind] = name
+        self._dicts = None  # 다음 쓰기부터 새 사전 사용
+        return trained
+
+
+# ─────────────────────────────────────────────
+# 오프라인 재추출 (스냅샷으로 응답하는 requests 어댑터)
+# ─────────────────────────────────────────────
+
+def _prepared_url(url):
+    """requests 가 실제로 보내는 형태의 URL (퍼센트 인코딩 등) — 매니페스트 URL 과 맞춰 보기 위함."""
+    try:
+        return requests.Request("GET", url).prepare().url
+    except requests.RequestException:
+        return url
+
+
+class SnapshotAdapter(BaseAdapter):
+    """day 의 스냅샷으로 GET 에 응답하는 requests 어댑터. 네트워크를 쓰지 않는다.
+
+    그날 받지 않은 URL 은 ConnectionError 로, 크롤러에는 요청 실패와 같게 보인다.
+    """
+
+    def __init__(self, day, store=None):
+        super().__init__()
+        self.day = day
+        self.store = store or SnapshotStore(SNAPSHOT_DIR)
+        self._entries = None
+        self._lock = threading.Lock()
+
+    def entries(self):
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    self._entries = {
+                        _prepared_url(url): entry for url, entry in self.store.manifest(self.day).items()
+                    }
+        return self._entries
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        entry = self.entries().get(request.url) if request.method in ("GET", "HEAD") else None
+        if entry is None:
+            raise requests.ConnectionError(f"{self.day} 스냅샷 없음: {request.url}", request=request)
+        try:
+            body = self.store.read(entry["hash"])
+        except (OSError, ValueError, RuntimeError) as e:
+            raise requests.ConnectionError(f"{self.day} 스냅샷 읽기 실패: {e}", request=request)
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = "OK" if entry["status"] < 400 else "Error"
+        response.headers = CaseInsensitiveDict({
+            name: value for name, value in entry["headers"].items()
+            if name.lower() not in _TRANSPORT_HEADERS
+        })
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(b"" if request.method == "HEAD" else body)
+        response.url = entry.get("final_url", request.url)
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_snapshot_store():
+    """프로세스 공용 SnapshotStore. 비활성화되어 있으면 None."""
+    global _store
+    if _store is None and SNAPSHOTS.get("enabled"):
+        with _store_lock:
+            if _store is None:
+                _store = SnapshotStore(
+                    SNAPSHOT_DIR,
+                    level=int(SNAPSHOTS.get("level", 10)),
+                    use_dicts=bool(SNAPSHOTS.get("dictionaries", True)),
+                    queue_size=int(SNAPSHOTS.get("queue_size", 256)),
+                )
+    return _store
+
+
+def snapshot_stats():
+    """실행 결과 요약용 통계. 스냅샷을 쓰지 않으면 None."""
+    return _store.stats() if _store is not None else None
+
+
+def set_snapshot_day(day):
+    """이후 저장하는 스냅샷을 day(YYYY-MM-DD, 실행 날짜) 의 매니페스트에 기록한다."""
+    store = get_snapshot_store()
+    if store is not None:
+        store.run_day = day
+
+
+def reset_snapshot_stats():
+    if _store is not None:
+        _store.reset_counters()
+
+
+def flush_snapshots():
+    """남은 스냅샷 쓰기를 기다린다 (실행 종료 전)."""
+    if _store is not None:
+        _store.flush()
+
+
+# ─────────────────────────────────────────────
+# CLI
+# ─────────────────────────────────────────────
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m core.snapshots", description="원본 HTML 스냅샷 보관소")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    stats = commands.add_parser("stats", help="보관 현황")
+    stats.add_argument("--day", metavar="YYYY-MM-DD")
+
+    train = commands.add_parser("train", help="페이지 종류별 zstd 사전 학습")
+    train.add_argument("--days", type=int, default=14, help="최근 며칠 치 스냅샷으로 학습")
+    train.add_argument("--size", type=int, default=112_640, help="사전 크기(바이트)")
+
+    show = commands.add_parser("show", help="저장된 HTML 을 표준 출력으로")
+    show.add_argument("url")
+    show.add_argument("--day", metavar="YYYY-MM-DD", help="기본: URL 이 있는 가장 최근 날짜")
+
+    args = parser.parse_args(argv)
+    store = SnapshotStore(SNAPSHOT_DIR, level=int(SNAPSHOTS.get("level", 10)))
+
+    if args.command == "train":
+        trained = store.train(days=args.days, dict_size=args.size)
+        for kind, name in trained.items():
+            print(f"  {kind:<40} {name}.dict")
+        print(f"{len(trained)}개 사전 학습 ({store.dicts_dir})")
+        return 0
+
+    if args.command == "show":
+        for day in ([args.day] if args.day else reversed(store.days())):
+            entry = store.manifest(day).get(args.url)
+            if entry is not None:
+                sys.stdout.buffer.write(store.read(entry["hash"]))
+                return 0
+        print(f"스냅샷 없음: {args.url}", file=sys.stderr)
+        return 1
+
+    days = [args.day] if args.day else store.days()
+    pages, kinds = 0, {}
+    for day in days:
+        for entry in store.manifest(day).values():
+            pages += 1
+            kinds[entry["kind"]] = kinds.get(entry["kind"], 0) + 1
+    objects, stored = 0, 0
+    for dirpath, _, filenames in os.walk(store.objects_dir):
+        for name in filenames:
+            objects += 1
+            stored += os.path.getsize(os.path.join(dirpath, name))
+    print(f"스냅샷: {store.root} (압축 {store.codec})")
+    print(f"  날짜 {len(days)}일 ({days[0] if days else '-'} ~ {days[-1] if days else '-'}) / 페이지 {pages}")
+    print(f"  저장 본문 {objects}개 / {stored / (1024 * 1024):.1f}MB")
+    for kind, count in sorted(kinds.items(), key=lambda item: -item[1])[:20]:
+        print(f"  {kind:<40} {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
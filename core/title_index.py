@@ -0,0 +1,169 @@
+"""
+제목 유사 중복 검색 인덱스 (경제 뉴스 중복 제거용).
+
+기존 방식은 새 기사마다 이미 채택된 모든 기사와 SequenceMatcher.ratio() 를 계산해
+기사 수 n 에 대해 O(n²) 번의 비교가 필요했다. TitleIndex 는 후보를 먼저 좁힌 뒤
+후보에 대해서만 are_similar 를 계산한다. 판정 결과는 전체 비교와 항상 같다.
+
+후보 검색 (놓치는 중복이 없는 필터만 사용)
+───────────────────────────────────────────
+ratio = 2·M / T (T = 두 길이의 합) 이고, M 은 matching block(연속 일치 구간)들의 길이 합이다.
+- M ≤ 짧은 쪽 길이 → 길이 비가 너무 다르면 임계값을 넘을 수 없다.
+- M ≤ 두 제목의 문자 멀티셋 교집합 크기.
+- 인접한 block 사이에는 a 나 b 쪽에 일치하지 않는 문자가 하나 이상 있으므로
+  block 수 k ≤ (T - 2M) + 1 이고, 길이 s 인 block 은 공통 bigram 을 s-1 개 만든다.
+  → 공유 bigram 수 ≥ M - k ≥ 3M - 1 - T.
+
+문자 멀티셋을 (문자, 몇 번째 등장) 토큰 집합으로 보고, 전역 순서(드문 토큰 먼저)로 정렬한
+앞부분(prefix)만 역색인에 넣는다. 교집합이 α 이상인 두 집합은 각자 앞 |x|-α+1 개 토큰 중
+하나를 반드시 공유하므로 (prefix filtering), prefix 토큰을 공유하지 않는 제목은 비교할 필요가
+없다. 처음 공유한 토큰 뒤에 남은 토큰 수로 교집합 상한을 한 번 더 계산해 후보를 거른다
+(positional filtering). 남은 후보는 길이 → 문자 교집합 → bigram 교집합 순으로 거른 뒤
+are_similar 로 확인한다. 교집합은 토큰 frozenset 의 & 로 계산한다.
+
+전역 순서는 채택된 제목들의 토큰 빈도로 정하고, 제목 수가 두 배가 될 때마다 순서를 다시
+정해 역색인을 재구성한다 (분할 상환 O(n)). 조회와 색인이 항상 같은 순서를 쓰므로 판정은 정확하다.
+"""
+
+import math
+import zlib
+from collections import Counter
+from difflib import SequenceMatcher
+
+
+def are_similar(str1, str2, threshold=0.8):
+    """두 문자열의 유사도를 비교하여 중복 여부를 판단."""
+    return SequenceMatcher(None, str1, str2).ratio() > threshold
+
+
+def _numbered(items):
+    """항목 목록을 (항목, 등장 순번) 토큰 목록으로 바꾼다. 멀티셋 교집합 = 토큰 집합 교집합."""
+    seen = Counter()
+    tokens = []
+    for item in items:
+        seen[item] += 1
+        tokens.append((item, seen[item]))
+    return tokens
+
+
+def _bigrams(title):
+    return [title[i:i + 2] for i in range(len(title) - 1)]
+
+
+def _tiebreak(token):
+    return zlib.crc32(token[0].encode("utf-8")), token[1], token[0]
+
+
+class TitleIndex:
+    """채택된 제목/URL 을 담고, 새 기사가 기존 기사와 중복인지 빠르게 판정."""
+
+    def __init__(self, threshold=0.8):
+        self.threshold = threshold
+        self._titles = []
+        self._lengths = []
+        self._char_sets = []
+        self._bigram_sets = []
+        self._token_lists = []
+        self._postings = {}
+        self._frequency = Counter()
+        self._order = {}
+        self._rebuild_at = 64
+        self._urls = set()
+        self._has_empty = False
+        self.comparisons = 0
+
+    def __len__(self):
+        return len(self._titles)
+
+    # ── 필터 계산 ──
+
+    def _required_matches(self, la, lb):
+        """길이 la, lb 인 두 제목이 중복이 되려면 필요한 최소 일치 문자 수 M (보수적 하한)."""
+        return math.floor(self.threshold * (la + lb) / 2 - 1e-9) + 1
+
+    def _min_matches(self, length):
+        """길이 length 인 제목이 길이 조건을 만족하는 어떤 상대와든 중복이 되려면 필요한 최소 M."""
+        shortest = math.floor(self.threshold * length / (2 - self.threshold))
+        return self._required_matches(length, shortest)
+
+    def _length_ok(self, la, lb):
+        """길이만으로 본 ratio 상한이 임계값을 넘을 수 있는지."""
+        return 2 * min(la, lb) > self.threshold * (la + lb) - 1e-9
+
+    # ── 역색인 ──
+
+    def _prefix(self, tokens):
+        """전역 순서(마지막 재구성 시점의 빈도가 낮은 순, 처음 보는 토큰이 가장 앞)의 prefix."""
+        order = self._order
+        ordered = sorted(tokens, key=lambda token: (order.get(token, -1), _tiebreak(token)))
+        keep = len(ordered) - self._min_matches(len(ordered)) + 1
+        return ordered[:max(1, keep)]
+
+    def _index(self, idx, tokens):
+        for position, token in enumerate(self._prefix(tokens)):
+            self._postings.setdefault(token, []).append((idx, position))
+
+    def _rebuild(self):
+        """현재 토큰 빈도로 전역 순서를 다시 정하고 역색인을 재구성."""
+        self._order = dict(self._frequency)
+        self._postings = {}
+        for idx, tokens in enumerate(self._token_lists):
+            self._index(idx, tokens)
+        self._rebuild_at = 2 * len(self._titles)
+
+    # ── 공개 API ──
+
+    def is_duplicate(self, title, url):
+        """기존 기사 중 제목이 유사(are_similar)하거나 URL 이 같은 것이 있으면 True."""
+        if url in self._urls:
+            return True
+        if not title:
+            # 빈 문자열끼리의 ratio 는 1.0, 빈 문자열과 그 외는 0.0
+            return self._has_empty
+
+        length = len(title)
+        tokens = _numbered(title)
+        char_set = frozenset(tokens)
+        bigram_set = None
+        checked = set()
+        for position, token in enumerate(self._prefix(tokens)):
+            for idx, other_position in self._postings.get(token, ()):
+                if idx in checked:
+                    continue
+                checked.add(idx)
+                other_length = self._lengths[idx]
+                if not self._length_ok(length, other_length):
+                    continue
+                required = self._required_matches(length, other_length)
+                # 처음 공유한 토큰 위치 이후 남은 토큰 수가 교집합의 상한 (positional filter)
+                if min(length - position, other_length - other_position) < required:
+                    continue
+                if len(char_set & self._char_sets[idx]) < required:
+                    continue
+                if bigram_set is None:
+                    bigram_set = frozenset(_numbered(_bigrams(title)))
+                if len(bigram_set & self._bigram_sets[idx]) < 3 * required - 1 - (length + other_length):
+                    continue
+                self.comparisons += 1
+                if are_similar(self._titles[idx], title, self.threshold):
+                    return True
+        return False
+
+    def add(self, title, url):
+        """채택된 기사를 인덱스에 추가."""
+        self._urls.add(url)
+        if not title:
+            self._has_empty = True
+            return
+        idx = len(self._titles)
+        tokens = _numbered(title)
+        self._titles.append(title)
+        self._lengths.append(len(title))
+        self._char_sets.append(frozenset(tokens))
+        self._bigram_sets.append(frozenset(_numbered(_bigrams(title))))
+        self._token_lists.append(tokens)
+        self._frequency.update(tokens)
+        if len(self._titles) >= self._rebuild_at:
+            self._rebuild()
+        else:
+            self._index(idx, tokens)
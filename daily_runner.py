@@ -2,26 +2,35 @@
 일일 크롤링 자동화 메인 실행 스크립트.
 
 실행 순서:
-1. 인터넷 연결 확인 (5초 간격, 최대 5회 재시도)
-2. 영어 명언 수집 (crawling_english_saying.py) → 바탕화면 실제 파일
-3. 헤드라인 크롤링 → C:\\news\\headlines
-4. 경제 뉴스 크롤링 → C:\\news\\economics
-5. 사설 크롤링 → C:\\news\\opinions
-6. 영문 주식 뉴스 크롤링 → C:\\news\\stock_news
+1. 인터넷 연결 확인 (수집 대상에 동시에 요청, 첫 목록 페이지를 겸함. 5초 간격, 최대 5회 재시도)
+2~6. 아래 작업을 동시에 실행 (요청은 공용 요청 엔진의 우선순위 대기열을 거침)
+   2. 영어 명언 수집 (crawling_english_saying.py) → 바탕화면 실제 파일
+   3. 헤드라인 크롤링 → C:\\news\\headlines
+   4. 경제 뉴스 크롤링 → C:\\news\\economics
+   5. 사설 크롤링 → C:\\news\\opinions
+   6. 영문 주식 뉴스 크롤링 → C:\\news\\stock_news
 + 바탕화면 뉴스 폴더 바로가기 생성 (.lnk)
 + 실행 결과 요약 및 로그 기록
++ 실행 지표(호스트별 요청/지연, 단계별 소요 시간) JSON 저장 ({날짜}_실행지표.json, 실행 로그 옆)
 
 필요 패키지: requests, beautifulsoup4, pywin32
 Selenium/ChromeDriver 불필요.
 
 Usage:
-    python daily_runner.py
+    python daily_runner.py            # 1회 실행
+    python daily_runner.py --daemon   # 상주 모드 (config.json 의 daemon.times 마다 실행)
+    python daily_runner.py --status   # 상주 모드 상태 확인 (상주 중이면 종료 코드 0)
+    python daily_runner.py --offline 2026-02-01 2026-02-28   # 그 기간의 원본 HTML 스냅샷으로 재추출 (core.offline)
 """
 
 import os
 import sys
 import time
+import argparse
 import datetime
+import importlib
+import multiprocessing
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from core.config import (
@@ -31,7 +40,18 @@ from core.config import (
     MIN_EXPECTED_HEADLINES, MIN_EXPECTED_ECONOMICS,
     MIN_EXPECTED_OPINIONS, MIN_EXPECTED_STOCK_NEWS,
 )
-from core.http_utils import check_internet, log, setup_file_logging
+from core.logging_utils import log, setup_file_logging
+from core.metrics import metrics
+
+# requests / BeautifulSoup / 크롤러 모듈은 처음 쓰는 곳에서 불러온다 (시작 시간 단축).
+# 크롤러 모듈은 인터넷 연결을 확인하는 동안 백그라운드 스레드에서 미리 불러온다 (preload_crawlers).
+CRAWLER_MODULES = (
+    "core.crawling_english_saying",
+    "core.run_headline_crawling",
+    "core.run_economics_crawling",
+    "core.run_opinions_crawling",
+    "core.run_eng_stock_check",
+)
 
 
 # ─────────────────────────────────────────────
@@ -39,11 +59,18 @@ from core.http_utils import check_internet, log, setup_file_logging
 # ─────────────────────────────────────────────
 
 def wait_for_internet(max_retries=INTERNET_MAX_RETRIES, interval=INTERNET_RETRY_INTERVAL):
-    """인터넷 연결을 확인. 실패 시 interval초 간격으로 재시도."""
+    """인터넷 연결을 확인. 실패 시 interval초 간격으로 재시도.
+
+    수집 대상 여러 곳에 동시에 요청해(http_utils.probe_internet) 하나라도 응답하면 바로 끝난다.
+    확인 요청은 크롤러의 첫 목록 페이지 요청을 겸하고, 공용 연결 풀에 연결을 미리 맺어 둔다.
+    """
+    from core.http_utils import probe_internet
+
     for attempt in range(1, max_retries + 1):
         log(f"  연결 확인 중... ({attempt}/{max_retries})")
-        if check_internet():
-            log("  ✓ 인터넷 연결 확인 완료")
+        host = probe_internet()
+        if host:
+            log(f"  ✓ 인터넷 연결 확인 완료 ({host} 응답)")
             return True
 
         if attempt < max_retries:
@@ -53,6 +80,31 @@ def wait_for_internet(max_retries=INTERNET_MAX_RETRIES, interval=INTERNET_RETRY_
     return False
 
 
+# ─────────────────────────────────────────────
+# 모듈 미리 불러오기
+# ─────────────────────────────────────────────
+
+def preload_crawlers():
+    """크롤러 모듈(과 bs4, asyncio 요청 엔진, 아카이브 등 의존 모듈)을 백그라운드 스레드에서 import.
+
+    인터넷 연결 확인은 대부분 네트워크를 기다리는 시간이라, 그동안 import 를 끝내 두면
+    크롤링 시작 전 대기 시간이 줄어든다. 실패해도 무시한다 (나중에 평소처럼 import 하며 오류가 난다).
+
+    Returns:
+        threading.Thread: join() 하면 import 가 끝날 때까지 기다린다
+    """
+    def _import_all():
+        for name in CRAWLER_MODULES:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                pass
+
+    thread = threading.Thread(target=_import_all, name="preload-crawlers", daemon=True)
+    thread.start()
+    return thread
+
+
 # ─────────────────────────────────────────────
 # 바탕화면 바로가기 생성
 # ─────────────────────────────────────────────
@@ -96,7 +148,38 @@ def validate_count(name, count, min_expected):
 # 메인 실행
 # ─────────────────────────────────────────────
 
-def main():
+def reset_run_state(today):
+    """실행마다 새로 집계하는 통계와 메모를 비우고, 원본 HTML 스냅샷의 날짜를 today 로 맞춘다.
+
+    상주 모드에서는 한 프로세스가 여러 번 실행하므로, 실행 요약/지표가 그 실행분만 담기도록
+    매 실행 시작 때 부른다. 연결 풀, HTTP 캐시, 요청 엔진, 헤지 지연 추정치는 그대로 유지한다.
+    """
+    from core.http_cache import reset_cache_stats
+    from core.article_memo import article_memo
+    from core.seen_index import seen_index
+    from core.connection_pool import pool_stats
+    from core.http_utils import clear_prefetched
+    from core.snapshots import reset_snapshot_stats, set_snapshot_day
+
+    metrics.reset()
+    article_memo.clear()
+    seen_index.reset_counters()
+    pool_stats.reset()
+    reset_cache_stats()
+    reset_snapshot_stats()
+    set_snapshot_day(today)
+    clear_prefetched()
+
+
+def run_once():
+    """크롤링 1회 실행 (인터넷 확인 → 병렬 수집 → 요약/지표 저장).
+
+    날짜와 저장 경로는 호출할 때마다 다시 계산하므로, 상주 모드에서 날짜가 바뀌어도
+    새 날짜의 파일/로그에 기록된다. 종료(sys.exit)나 입력 대기는 하지 않는다.
+
+    Returns:
+        dict: 항목별 실행 결과. 인터넷 연결에 실패하면 {"인터넷 연결": "실패"}
+    """
     start_time = datetime.datetime.now()
 
     # 로그 파일 핸들러 설정 (즉시 기록)
@@ -106,6 +189,7 @@ def main():
     log_dir = os.path.join(LOGS_DIR, year, month)
     os.makedirs(log_dir, exist_ok=True)
     log_path = os.path.join(log_dir, f'{today}_실행로그.txt')
+    metrics_path = os.path.join(log_dir, f'{today}_실행지표.json')
     setup_file_logging(log_path)
 
     log("=" * 60)
@@ -125,31 +209,30 @@ def main():
     log(f"  실행 로그 : {log_path}")
 
     results = {}
+    reset_run_state(today)
 
-    # ── [1/6] 인터넷 연결 확인 ──
+    # ── [1/6] 인터넷 연결 확인 (그동안 크롤러 모듈을 미리 불러옴) ──
+    # 확인 요청에 필요한 모듈(http_utils)은 reset_run_state 에서 이미 불러왔으므로,
+    # preload 가 확인 요청과 import 를 다투지 않는다.
     log("")
     log("[1/6] 인터넷 연결 확인")
-    if not wait_for_internet():
+    preload = preload_crawlers()
+    with metrics.phase("daily_runner", "인터넷 연결"):
+        connected = wait_for_internet()
+    if not connected:
         log("  ✗ 인터넷 연결 실패 (5회 시도 후 중단)")
         results["인터넷 연결"] = "실패"
-        sys.exit(1)
+        return results
     results["인터넷 연결"] = "성공"
 
-    # ── [2/6] 영어 명언 수집 ──
+    # ── [2~6] 영어 명언 수집 + 크롤러 병렬 실행 ──
+    # 크롤러 스레드는 요청을 공용 요청 엔진(core.fetch_engine)의 우선순위 대기열에 제출하므로,
+    # 호스트별 상한 안에서 먼저 끝난 크롤러의 자리를 남은 크롤러가 바로 이어 쓴다.
     log("")
-    log("[2/6] 영어 명언 수집")
-    try:
-        from core import crawling_english_saying
-        success = crawling_english_saying.insert_latest_quote()
-        results["영어 명언 수집"] = "성공" if success else "실패"
-    except Exception as e:
-        results["영어 명언 수집"] = f"실패: {e}"
-        log(f"  ✗ 영어 명언 수집 실패: {e}")
-
-    # ── [3~6] 크롤러 병렬 실행 ──
-    log("")
-    log("[3~6] 크롤러 4개 병렬 실행")
+    log("[2~6] 영어 명언 수집 + 크롤러 4개 병렬 실행")
 
+    preload.join()
+    from core import crawling_english_saying
     from core import run_headline_crawling
     from core import run_economics_crawling
     from core import run_opinions_crawling
@@ -162,20 +245,33 @@ def main():
         ("영문 주식 뉴스", run_eng_stock_check.main, MIN_EXPECTED_STOCK_NEWS),
     ]
 
+    def _run_quote():
+        """영어 명언 수집 래퍼. 결과 문자열 반환."""
+        try:
+            with metrics.phase("daily_runner", "영어 명언 수집"):
+                success = crawling_english_saying.insert_latest_quote()
+            return "성공" if success else "실패"
+        except Exception as e:
+            log(f"  ✗ 영어 명언 수집 실패: {e}")
+            return f"실패: {e}"
+
     def _run_crawler(name, func, min_expected):
         """단일 크롤러 실행 래퍼. (name, result_str, count) 반환."""
         try:
-            count = func()
+            with metrics.phase("daily_runner", name):
+                count = func()
             result_str = f"{count}개 수집" if count else "실패"
             return name, result_str, count, min_expected
         except Exception as e:
             return name, f"실패: {e}", None, min_expected
 
-    with ThreadPoolExecutor(max_workers=4) as executor:
+    with ThreadPoolExecutor(max_workers=len(crawlers) + 1) as executor:
+        quote_future = executor.submit(_run_quote)
         futures = {
             executor.submit(_run_crawler, name, func, min_exp): name
             for name, func, min_exp in crawlers
         }
+        results["영어 명언 수집"] = quote_future.result()
         for future in as_completed(futures):
             name, result_str, count, min_exp = future.result()
             results[name] = result_str
@@ -203,14 +299,64 @@ def main():
         status = "✓" if "실패" not in str(value) else "✗"
         log(f"  {status} {key}: {value}")
     log("-" * 60)
+    from core.http_cache import cache_stats
+    from core.article_memo import article_memo
+    from core.seen_index import seen_index
+    from core.connection_pool import pool_stats
+    from core.snapshots import flush_snapshots, snapshot_stats
+
+    stats = cache_stats()
+    if stats is not None:
+        saved_mb = stats["bytes_saved"] / (1024 * 1024)
+        log(f"  HTTP 캐시: 적중 {stats['hits']} / 재검증 {stats['revalidated']}"
+            f" / 미스 {stats['misses']} / 절약 {saved_mb:.1f}MB")
+    memo = article_memo.stats()
+    log(f"  기사 메타데이터 메모: 요청 {memo['fetches']} / 재사용 {memo['saved']}")
+    seen = seen_index.stats()
+    log(f"  이전 수집 기사: {seen['repeats']} (상세 재사용 {seen['reused']}) / 색인 URL {seen['urls']}")
+    connections = pool_stats.snapshot()
+    log(f"  연결: 새 연결 {connections['created']} / 재사용 {connections['reused']}"
+        f" / 풀 초과로 버림 {connections['discarded']}")
+    flush_snapshots()
+    snapshots = snapshot_stats()
+    if snapshots is not None:
+        log(f"  HTML 스냅샷: 페이지 {snapshots['pages']} / 새로 저장 {snapshots['stored']}"
+            f" ({snapshots['stored_bytes'] / (1024 * 1024):.1f}MB) / 중복 {snapshots['deduped']}"
+            f" / 건너뜀 {snapshots['dropped'] + snapshots['errors']}")
+    log("-" * 60)
+    for line in metrics.summary_lines():
+        log(line)
+    log("-" * 60)
     log(f"  시작: {start_time.strftime('%H:%M:%S')}")
     log(f"  종료: {end_time.strftime('%H:%M:%S')}")
     log(f"  소요: {h:02d}:{m:02d}:{s:02d}")
     log("=" * 60)
 
+    try:
+        metrics.write_json(metrics_path, extra={
+            "results": results,
+            "elapsed_seconds": elapsed.total_seconds(),
+            "http_cache": stats,
+            "article_memo": memo,
+            "seen_index": seen,
+            "connections": connections,
+            "snapshots": snapshots,
+        })
+    except OSError as e:
+        log(f"  ✗ 실행 지표 저장 실패: {e}")
+
     log("")
     log(f"로그 저장: {log_path}")
+    log(f"지표 저장: {metrics_path}")
     log("일일 크롤링 자동화 완료.")
+    return results
+
+
+def main():
+    """1회 실행 (기본 모드). 인터넷 연결에 실패하면 종료 코드 1."""
+    results = run_once()
+    if results.get("인터넷 연결") != "성공":
+        sys.exit(1)
 
     # EXE 실행 시 사용자가 결과를 확인할 수 있도록 대기
     if getattr(sys, 'frozen', False):
@@ -219,4 +365,27 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # EXE 로 묶었을 때 --offline 의 작업 프로세스가 인자 처리 전에 여기서 갈라져 나간다
+    multiprocessing.freeze_support()
+    parser = argparse.ArgumentParser(description="일일 크롤링 자동화")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--daemon", action="store_true", help="상주 모드: 정해진 시각마다 실행")
+    mode.add_argument("--status", action="store_true", help="상주 모드 상태 확인")
+    mode.add_argument("--offline", nargs="+", metavar="YYYY-MM-DD",
+                      help="원본 HTML 스냅샷으로 재추출 (날짜 하나 또는 시작·끝 날짜)")
+    parser.add_argument("--workers", type=int, help="--offline: 동시에 처리할 날짜 수 (기본: CPU 코어 수)")
+    args = parser.parse_args()
+
+    if args.offline:
+        from core.offline import main as offline_main
+        if len(args.offline) > 2:
+            parser.error("--offline 은 날짜 하나 또는 시작·끝 날짜 두 개")
+        sys.exit(offline_main(args.offline + (["--workers", str(args.workers)] if args.workers else [])))
+    elif args.daemon:
+        from core.daemon import run_daemon
+        sys.exit(run_daemon(run_once))
+    elif args.status:
+        from core.daemon import print_status
+        sys.exit(print_status())
+    else:
+        main()
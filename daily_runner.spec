@@ -24,7 +24,25 @@ hidden_imports = [
     # 프로젝트 내부 모듈 (core 패키지)
     'core',
     'core.config',
+    'core.logging_utils',
     'core.http_utils',
+    'core.fetch_engine',
+    'core.rate_limit',
+    'core.http_cache',
+    'core.connection_pool',
+    'core.article_memo',
+    'core.hedged_fetch',
+    'core.title_index',
+    'core.metrics',
+    'core.archive',
+    'core.file_lock',
+    'core.seen_index',
+    'core.snapshots',
+    'core.offline',
+    'core.daemon',
+    'sqlite3',
+    'core.quote_store',
+    'core.quote_backfill',
     'core.crawling_english_saying',
     'core.run_headline_crawling',
     'core.run_economics_crawling',
@@ -40,6 +58,7 @@ hidden_imports = [
     'bs4',
     'bs4.builder',
     'bs4.builder._htmlparser',
+    'bs4.builder._lxml',
     # pywin32 (바로가기 생성)
     'win32com',
     'win32com.client',